@@ -12,23 +12,27 @@ Supports multiple formats:
 - GPX (.gpx)
 """
 
-from mtu.converters import (
-    BaseConverter,
-    ConversionResult,
-    get_converter,
-    get_supported_formats,
-)
-from mtu.uploader import (
-    TilesetConfig,
-    TilesetUploader,
-    UploadResult,
-)
-from mtu.validators import (
-    GeometryValidator,
-    ValidationResult,
-    ValidationWarning,
-    validate_geojson,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from mtu.converters import (
+        BaseConverter,
+        ConversionResult,
+        get_converter,
+        get_supported_formats,
+    )
+    from mtu.uploader import (
+        TilesetConfig,
+        TilesetUploader,
+        UploadResult,
+    )
+    from mtu.validators import (
+        GeometryValidator,
+        ValidationResult,
+        ValidationWarning,
+        validate_geojson,
+    )
 
 __version__ = "0.2.0"
 __all__ = [
@@ -49,3 +53,35 @@ __all__ = [
     # Version
     "__version__",
 ]
+
+# Public names are imported on first access (PEP 562) so that lightweight
+# entry points such as ``mtu --version`` don't load every submodule.
+_LAZY_IMPORTS = {
+    "TilesetUploader": "mtu.uploader",
+    "TilesetConfig": "mtu.uploader",
+    "UploadResult": "mtu.uploader",
+    "get_converter": "mtu.converters",
+    "get_supported_formats": "mtu.converters",
+    "BaseConverter": "mtu.converters",
+    "ConversionResult": "mtu.converters",
+    "GeometryValidator": "mtu.validators",
+    "ValidationResult": "mtu.validators",
+    "ValidationWarning": "mtu.validators",
+    "validate_geojson": "mtu.validators",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including lazily imported names."""
+    return sorted(set(globals()) | set(__all__))
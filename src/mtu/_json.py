@@ -0,0 +1,148 @@
+"""
+JSON encoding and decoding helpers.
+
+Uses orjson when it is installed and falls back to the standard library json
+module otherwise. Both paths work on UTF-8 bytes, which skips decoding the
+input to a str first.
+"""
+
+import gc
+import json
+import mmap
+from pathlib import Path
+from typing import Any, BinaryIO
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# orjson.JSONDecodeError subclasses this, so callers can catch either backend
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | memoryview | str) -> Any:
+    """
+    Parse JSON data.
+
+    Args:
+        data: UTF-8 encoded bytes or a string. Memory views are only
+            supported with orjson.
+
+    Returns:
+        The decoded object.
+    """
+    # Parsed JSON can't contain reference cycles, and collections triggered by
+    # the millions of allocations in a large document dominate the parse time
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def load(source: str | Path | BinaryIO) -> Any:
+    """
+    Parse JSON from a file path or binary file object.
+
+    Args:
+        source: Path to a JSON file or a binary file object.
+
+    Returns:
+        The decoded object.
+    """
+    if hasattr(source, "read"):
+        return loads(source.read())
+    if orjson is None:
+        return loads(Path(source).read_bytes())
+
+    # orjson parses straight from a memory map, so the file contents are
+    # never copied into a bytes object next to the parsed document
+    with open(source, "rb") as f:
+        try:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files and pipes can't be mapped
+            return loads(f.read())
+        with mapped, memoryview(mapped) as view:
+            return loads(view)
+
+
+def dumps(obj: Any, pretty: bool = False) -> bytes:
+    """
+    Encode an object as UTF-8 JSON.
+
+    Args:
+        obj: Object to encode.
+        pretty: Indent the output with two spaces.
+
+    Returns:
+        The encoded JSON bytes.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if pretty:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def round_coordinates(geojson: dict[str, Any], precision: int) -> dict[str, Any]:
+    """
+    Round the coordinates of a GeoJSON object.
+
+    Returns a copy; only the objects on the path to the coordinates are
+    copied, properties are shared with the input.
+
+    Args:
+        geojson: FeatureCollection, Feature or geometry.
+        precision: Number of decimal places to keep.
+
+    Returns:
+        GeoJSON with rounded coordinates.
+    """
+    geojson_type = geojson.get("type")
+    if geojson_type == "FeatureCollection":
+        features = [round_coordinates(f, precision) for f in geojson.get("features", [])]
+        return {**geojson, "features": features}
+    if geojson_type == "Feature":
+        geometry = geojson.get("geometry")
+        if not isinstance(geometry, dict):
+            return geojson
+        return {**geojson, "geometry": round_coordinates(geometry, precision)}
+    if geojson_type == "GeometryCollection":
+        geometries = [round_coordinates(g, precision) for g in geojson.get("geometries", [])]
+        return {**geojson, "geometries": geometries}
+    if "coordinates" in geojson:
+        return {**geojson, "coordinates": _round_positions(geojson["coordinates"], precision)}
+    return geojson
+
+
+def dumps_rounded(feature: dict[str, Any], precision: int) -> bytes:
+    """
+    Encode a feature with its coordinates rounded.
+
+    Args:
+        feature: GeoJSON Feature.
+        precision: Number of decimal places to keep.
+
+    Returns:
+        The encoded JSON bytes.
+    """
+    return dumps(round_coordinates(feature, precision))
+
+
+def _round_positions(coords: Any, precision: int) -> Any:
+    """Round a position or a nested list of positions."""
+    # fiona and pyshp return positions as tuples
+    if not isinstance(coords, (list, tuple)) or not coords:
+        return coords
+    if isinstance(coords[0], (list, tuple)):
+        return [_round_positions(c, precision) for c in coords]
+    return [round(c, precision) if isinstance(c, float) else c for c in coords]
@@ -2,23 +2,47 @@
 Command-line interface for Mapbox Tileset Uploader.
 """
 
-import json
 import sys
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from itertools import islice
+from typing import Any, BinaryIO
 
 import click
 
 from mtu import __version__
-from mtu.converters import get_converter, get_supported_formats
-from mtu.uploader import TilesetConfig, TilesetUploader
-from mtu.validators import validate_geojson
+
+# Converter, uploader, validator and JSON imports are deferred to the commands that
+# use them so that --help, --version and info start quickly.
+
+# Number of features encoded per call when writing GeoJSON output
+STREAM_BATCH_SIZE = 1000
+
+# Icons for tileset job status in list-tilesets
+_STATUS_ICONS = {"success": "✅", "processing": "⏳"}
 
 
 # Custom help class for better formatting
 class CustomGroup(click.Group):
     """Custom group with better help formatting."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Rendered help text keyed by (command path, formatter width)
+        self._help_cache: dict[tuple[str, int | None], str] = {}
+
     def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
-        """Write the help into the formatter with additional info."""
+        """Write the help into the formatter, rendering it only once."""
+        key = (ctx.command_path, formatter.width)
+        help_text = self._help_cache.get(key)
+        if help_text is None:
+            help_formatter = click.HelpFormatter(width=formatter.width)
+            self._render_help(ctx, help_formatter)
+            help_text = self._help_cache[key] = help_formatter.getvalue()
+        formatter.write(help_text)
+
+    def _render_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """Render the help with additional info."""
         self.format_usage(ctx, formatter)
         self.format_help_text(ctx, formatter)
         self.format_options(ctx, formatter)
@@ -80,51 +104,66 @@ def formats() -> None:
     Examples:
       mtu formats
     """
+    from mtu.converters import get_supported_formats
+
     formats_list = get_supported_formats()
 
-    click.echo("\n📁 Supported Input Formats\n")
-    click.echo("-" * 60)
+    # Build the listing first and write it in one go
+    lines = ["\n📁 Supported Input Formats\n", "-" * 60]
 
     for fmt in formats_list:
         status = "✅" if fmt["available"] else "❌"
         extensions = ", ".join(fmt["file_extensions"])
 
-        click.echo(f"\n{status} {fmt['format_name']}")
-        click.echo(f"   Extensions: {extensions}")
+        lines.append(f"\n{status} {fmt['format_name']}")
+        lines.append(f"   Extensions: {extensions}")
 
         if fmt["requires_packages"]:
             packages = ", ".join(fmt["requires_packages"])
-            click.echo(f"   Requires: {packages}")
+            lines.append(f"   Requires: {packages}")
             if not fmt["available"]:
-                click.echo(f"   Install: pip install {' '.join(fmt['requires_packages'])}")
+                lines.append(f"   Install: pip install {' '.join(fmt['requires_packages'])}")
         else:
-            click.echo("   Requires: (built-in)")
+            lines.append("   Requires: (built-in)")
 
-    click.echo("\n" + "-" * 60)
-    click.echo("\nInstall all optional formats:")
-    click.echo("  pip install mapbox-tileset-uploader[all]\n")
+    lines.append("\n" + "-" * 60)
+    lines.append("\nInstall all optional formats:")
+    lines.append("  pip install mapbox-tileset-uploader[all]\n")
+    click.echo("\n".join(lines))
 
 
 @main.command()
 @click.argument("file_path", type=click.Path(exists=True))
 @click.option("--format", "-f", "format_hint", help="Force a specific format")
 @click.option("--verbose", "-v", is_flag=True, help="Show all warnings including info-level")
+@click.option(
+    "--deep/--no-deep",
+    default=True,
+    help="Run full geometry checks (default), or only check GeoJSON structure",
+)
 def validate(
     file_path: str,
     format_hint: str | None,
     verbose: bool,
+    deep: bool,
 ) -> None:
     """
     Validate a GIS file without uploading.
 
     Checks for geometry issues, coordinate bounds, and format validity.
+    With --no-deep only the GeoJSON structure is checked; the full geometry
+    checks still run if that structural check fails.
 
     \b
     Examples:
       mtu validate data.geojson
       mtu validate shapefile.shp --verbose
+      mtu validate large.geojson --no-deep
       mtu validate data.json --format geojson
     """
+    from mtu.converters import get_converter
+    from mtu.validators import is_well_formed, validate_geojson
+
     click.echo(f"\n🔍 Validating: {file_path}\n")
 
     try:
@@ -140,6 +179,11 @@ def validate(
             for warning in result.warnings:
                 click.echo(f"   - {warning}")
 
+        if not deep and is_well_formed(result.geojson):
+            click.echo("\n📊 Structure check passed (geometry checks skipped)")
+            click.echo("\n✅ File is valid for upload")
+            return
+
         # Validate geometry
         validation = validate_geojson(result.geojson)
 
@@ -151,28 +195,28 @@ def validate(
         click.echo(f"   Errors: {validation.error_count}")
 
         if validation.warnings:
-            # Group by type
-            by_type: dict[str, list] = {}
+            # Count by type, keeping only the first 3 examples of each
+            counts: Counter[str] = Counter()
+            examples: defaultdict[str, list] = defaultdict(list)
             for w in validation.warnings:
                 if not verbose and w.severity == "info":
                     continue
-                if w.warning_type not in by_type:
-                    by_type[w.warning_type] = []
-                by_type[w.warning_type].append(w)
+                counts[w.warning_type] += 1
+                if counts[w.warning_type] <= 3:
+                    examples[w.warning_type].append(w)
 
-            if by_type:
+            if counts:
                 click.echo("\n⚠️  Issues found:")
-                for wtype, warnings in sorted(by_type.items()):
-                    click.echo(f"\n   [{wtype}] ({len(warnings)} occurrences)")
-                    # Show first 3 examples
-                    for w in warnings[:3]:
+                for wtype, count in sorted(counts.items()):
+                    click.echo(f"\n   [{wtype}] ({count} occurrences)")
+                    for w in examples[wtype]:
                         if w.feature_index is not None:
                             loc = f"feature {w.feature_index}"
                         else:
                             loc = "global"
                         click.echo(f"     • {loc}: {w.message}")
-                    if len(warnings) > 3:
-                        click.echo(f"     ... and {len(warnings) - 3} more")
+                    if count > 3:
+                        click.echo(f"     ... and {count - 3} more")
 
         if validation.valid:
             click.echo("\n✅ File is valid for upload")
@@ -203,6 +247,18 @@ def validate(
 @click.option("--work-dir", "-w", type=click.Path(), help="Working directory for temp files")
 @click.option("--no-validate", is_flag=True, help="Skip geometry validation")
 @click.option("--dry-run", is_flag=True, help="Validate without uploading")
+@click.option(
+    "--concurrency",
+    default=4,
+    type=click.IntRange(1, 10),
+    help="Number of source parts to upload in parallel (1-10)",
+)
+@click.option("--compress", is_flag=True, help="Gzip source parts before uploading")
+@click.option(
+    "--precision",
+    type=click.IntRange(0, 15),
+    help="Round uploaded coordinates to this many decimal places (default: keep all)",
+)
 @click.option("--token", envvar="MAPBOX_ACCESS_TOKEN", help="Mapbox access token")
 @click.option("--username", envvar="MAPBOX_USERNAME", help="Mapbox username")
 def upload(
@@ -221,6 +277,9 @@ def upload(
     work_dir: str | None,
     no_validate: bool,
     dry_run: bool,
+    concurrency: int,
+    compress: bool,
+    precision: int | None,
     token: str | None,
     username: str | None,
 ) -> None:
@@ -247,6 +306,9 @@ def upload(
       # Dry run to validate
       mtu upload -f data.geojson -i test -n "Test" --dry-run
     """
+    from mtu._json import load
+    from mtu.uploader import TilesetConfig, TilesetUploader
+
     if not url and not file_path:
         raise click.UsageError("Either --url or --file must be provided")
 
@@ -256,8 +318,7 @@ def upload(
     # Load custom recipe if provided
     custom_recipe = {}
     if recipe:
-        with open(recipe, encoding="utf-8") as f:
-            custom_recipe = json.load(f)
+        custom_recipe = load(recipe)
 
     # Build configuration
     config = TilesetConfig(
@@ -277,6 +338,9 @@ def upload(
             access_token=token,
             username=username,
             validate_geometry=not no_validate,
+            upload_concurrency=concurrency,
+            compress=compress,
+            precision=precision,
         )
     except ValueError as e:
         raise click.ClickException(str(e))
@@ -292,7 +356,12 @@ def upload(
         if url:
             click.echo(f"   Source: {url}")
             result = uploader.upload_from_url(
-                url, config, format_hint=format_hint, work_dir=work_dir, dry_run=dry_run
+                url,
+                config,
+                format_hint=format_hint,
+                work_dir=work_dir,
+                dry_run=dry_run,
+                stream=not work_dir,
             )
         else:
             click.echo(f"   Source: {file_path}")
@@ -329,6 +398,8 @@ def upload(
 
     except Exception as e:
         raise click.ClickException(str(e))
+    finally:
+        uploader.close()
 
 
 @main.command()
@@ -337,57 +408,173 @@ def upload(
 @click.option("--format", "-f", "format_hint", help="Force a specific input format")
 @click.option("--object", "-o", "object_name", help="TopoJSON object name to convert")
 @click.option("--pretty", "-p", is_flag=True, help="Pretty-print output JSON")
+@click.option(
+    "--precision",
+    type=click.IntRange(0, 15),
+    help="Round coordinates to this many decimal places (default: keep all)",
+)
+@click.option("--ndjson", is_flag=True, help="Write one feature per line (line-delimited GeoJSON)")
 def convert(
     input_file: str,
     output_file: str,
     format_hint: str | None,
     object_name: str | None,
     pretty: bool,
+    precision: int | None,
+    ndjson: bool,
 ) -> None:
     """
     Convert a GIS file to GeoJSON.
 
     Supports TopoJSON, Shapefile, GeoPackage, KML, FlatGeobuf, GeoParquet, and GPX.
+    Use - as OUTPUT_FILE to write to stdout; messages then go to stderr.
+    With --ndjson, formats that can be read one feature at a time are
+    streamed without reporting conversion warnings, e.g. for skipped
+    null geometries.
 
     \b
     Examples:
       mtu convert input.topojson output.geojson
       mtu convert boundaries.shp boundaries.geojson --pretty
+      mtu convert boundaries.shp boundaries.geojson --precision 6
+      mtu convert data.gpkg - --ndjson | tippecanoe -o data.mbtiles
       mtu convert data.gpkg data.geojson
       mtu convert track.gpx track.geojson
     """
-    click.echo(f"\n🔄 Converting: {input_file}")
+    from mtu.converters import get_converter
+
+    if ndjson and pretty:
+        raise click.UsageError("--pretty can't be combined with --ndjson")
+
+    # Keep stdout for the data when writing to it
+    to_stdout = output_file == "-"
+
+    click.echo(f"\n🔄 Converting: {input_file}", err=to_stdout)
 
     try:
         # Get converter
         converter = get_converter(format_name=format_hint, file_path=input_file)
-        click.echo(f"   Format: {converter.format_name}")
+        click.echo(f"   Format: {converter.format_name}", err=to_stdout)
 
-        # Convert (pass object_name for TopoJSON)
+        # Pass object_name for TopoJSON
+        options = {}
         if object_name and converter.format_name == "TopoJSON":
-            result = converter.convert(input_file, object_name=object_name)
+            options["object_name"] = object_name
+
+        # Line-delimited output is streamed straight from the source when the
+        # converter supports it, without building a FeatureCollection
+        lines = None
+        if ndjson and converter.supports_geojsonl:
+            try:
+                _, lines = converter.iter_geojsonl(input_file, precision=precision, **options)
+            except ValueError:
+                lines = None
+
+        if lines is not None:
+            with click.open_file(output_file, "wb") as f:
+                feature_count = _write_lines(f, lines)
         else:
-            result = converter.convert(input_file)
+            result = converter.convert(input_file, **options)
+            feature_count = result.feature_count
 
-        # Show warnings
-        if result.warnings:
-            click.echo("\n⚠️  Warnings:")
-            for warning in result.warnings:
-                click.echo(f"   - {warning}")
+            # Show warnings
+            if result.warnings:
+                click.echo("\n⚠️  Warnings:", err=to_stdout)
+                for warning in result.warnings:
+                    click.echo(f"   - {warning}", err=to_stdout)
 
-        # Write output
-        with open(output_file, "w", encoding="utf-8") as f:
-            if pretty:
-                json.dump(result.geojson, f, indent=2, ensure_ascii=False)
-            else:
-                json.dump(result.geojson, f, ensure_ascii=False)
+            # Write output
+            with click.open_file(output_file, "wb") as f:
+                if ndjson:
+                    _stream_geojsonl(f, result.geojson, precision)
+                else:
+                    _stream_geojson(f, result.geojson, pretty, precision)
 
-        click.echo(f"\n✅ Converted {result.feature_count} features to {output_file}")
+        destination = "stdout" if to_stdout else output_file
+        click.echo(f"\n✅ Converted {feature_count} features to {destination}", err=to_stdout)
 
     except Exception as e:
         raise click.ClickException(str(e))
 
 
+def _stream_geojson(
+    f: BinaryIO, geojson: dict[str, Any], pretty: bool, precision: int | None = None
+) -> None:
+    """
+    Write GeoJSON to a binary file one feature at a time.
+
+    Features are encoded in batches of STREAM_BATCH_SIZE, so large
+    FeatureCollections don't need a second full-size copy in memory while
+    still avoiding the overhead of one encoder call per feature. Coordinates
+    are rounded per batch when ``precision`` is given.
+    """
+    from mtu._json import dumps, round_coordinates
+
+    features = geojson.get("features")
+    if not isinstance(features, list):
+        if precision is not None:
+            geojson = round_coordinates(geojson, precision)
+        f.write(dumps(geojson, pretty))
+        return
+
+    pad = b"  " if pretty else b""
+    newline = b"\n" if pretty else b""
+    separator = b",\n" if pretty else b","
+    colon = b": " if pretty else b":"
+
+    def encode(obj: Any, depth: int) -> bytes:
+        data = dumps(obj, pretty)
+        return data.replace(b"\n", b"\n" + pad * depth) if pretty else data
+
+    f.write(b"{" + newline)
+    for key, value in geojson.items():
+        if key != "features":
+            f.write(pad + encode(key, 1) + colon + encode(value, 1) + separator)
+
+    if not features:
+        f.write(pad + b'"features"' + colon + b"[]" + newline + b"}")
+        return
+
+    f.write(pad + b'"features"' + colon + b"[" + newline)
+    for start in range(0, len(features), STREAM_BATCH_SIZE):
+        if start:
+            f.write(separator)
+        batch = features[start : start + STREAM_BATCH_SIZE]
+        if precision is not None:
+            batch = [round_coordinates(feature, precision) for feature in batch]
+        # Encode a batch of features as a list and strip the brackets
+        data = dumps(batch, pretty)
+        if pretty:
+            f.write(pad + data[2:-2].replace(b"\n", b"\n" + pad))
+        else:
+            f.write(data[1:-1])
+    f.write(newline + pad + b"]" + newline + b"}")
+
+
+def _stream_geojsonl(f: BinaryIO, geojson: dict[str, Any], precision: int | None = None) -> None:
+    """Write GeoJSON features to a binary file as line-delimited GeoJSON."""
+    from mtu._json import dumps, round_coordinates
+
+    features = geojson.get("features")
+    if geojson.get("type") != "FeatureCollection" or not isinstance(features, list):
+        features = [geojson]
+
+    for start in range(0, len(features), STREAM_BATCH_SIZE):
+        batch = features[start : start + STREAM_BATCH_SIZE]
+        if precision is not None:
+            batch = [round_coordinates(feature, precision) for feature in batch]
+        f.write(b"".join(dumps(feature) + b"\n" for feature in batch))
+
+
+def _write_lines(f: BinaryIO, lines: Iterator[bytes]) -> int:
+    """Write encoded features one per line, returning how many were written."""
+    count = 0
+    while batch := list(islice(lines, STREAM_BATCH_SIZE)):
+        f.write(b"".join(line + b"\n" for line in batch))
+        count += len(batch)
+    return count
+
+
 @main.command("list-sources")
 @click.option("--token", envvar="MAPBOX_ACCESS_TOKEN", help="Mapbox access token")
 @click.option("--username", envvar="MAPBOX_USERNAME", help="Mapbox username")
@@ -399,24 +586,27 @@ def list_sources(token: str | None, username: str | None) -> None:
     Examples:
       mtu list-sources
     """
-    try:
-        uploader = TilesetUploader(access_token=token, username=username)
-        sources = uploader.list_sources()
+    from mtu.uploader import TilesetUploader
 
-        if not sources:
-            click.echo("\n📂 No tileset sources found.\n")
-            return
-
-        click.echo(f"\n📂 Found {len(sources)} tileset source(s):\n")
-        for source in sources:
-            if isinstance(source, dict):
-                source_id = source.get("id", source)
-                size = source.get("size", "")
-                size_str = f" ({size} bytes)" if size else ""
-                click.echo(f"   • {source_id}{size_str}")
+    try:
+        with TilesetUploader(access_token=token, username=username) as uploader:
+            sources = uploader.list_sources()
+
+            if not sources:
+                click.echo("\n📂 No tileset sources found.\n")
+                return
+
+            lines = [f"\n📂 Found {len(sources)} tileset source(s):\n"]
+            # The API returns a homogeneous list, so check the item type once
+            if isinstance(sources[0], dict):
+                for source in sources:
+                    size = source.get("size")
+                    size_str = f" ({size} bytes)" if size else ""
+                    lines.append(f"   • {source.get('id', source)}{size_str}")
             else:
-                click.echo(f"   • {source}")
-        click.echo()
+                lines.extend(f"   • {source}" for source in sources)
+            lines.append("")
+            click.echo("\n".join(lines))
 
     except Exception as e:
         raise click.ClickException(str(e))
@@ -433,28 +623,27 @@ def list_tilesets(token: str | None, username: str | None) -> None:
     Examples:
       mtu list-tilesets
     """
-    try:
-        uploader = TilesetUploader(access_token=token, username=username)
-        tilesets = uploader.list_tilesets()
+    from mtu.uploader import TilesetUploader
 
-        if not tilesets:
-            click.echo("\n🗺️  No tilesets found.\n")
-            return
-
-        click.echo(f"\n🗺️  Found {len(tilesets)} tileset(s):\n")
-        for tileset in tilesets:
-            if isinstance(tileset, dict):
-                name = tileset.get("name", "Unnamed")
-                tileset_id = tileset.get("id", "")
-                status = tileset.get("status", "")
-                status_icon = (
-                    "✅" if status == "success" else "⏳" if status == "processing" else "❓"
-                )
-                click.echo(f"   {status_icon} {name}")
-                click.echo(f"      ID: {tileset_id}")
+    try:
+        with TilesetUploader(access_token=token, username=username) as uploader:
+            tilesets = uploader.list_tilesets()
+
+            if not tilesets:
+                click.echo("\n🗺️  No tilesets found.\n")
+                return
+
+            lines = [f"\n🗺️  Found {len(tilesets)} tileset(s):\n"]
+            # The API returns a homogeneous list, so check the item type once
+            if isinstance(tilesets[0], dict):
+                for tileset in tilesets:
+                    status_icon = _STATUS_ICONS.get(tileset.get("status", ""), "❓")
+                    lines.append(f"   {status_icon} {tileset.get('name', 'Unnamed')}")
+                    lines.append(f"      ID: {tileset.get('id', '')}")
             else:
-                click.echo(f"   • {tileset}")
-        click.echo()
+                lines.extend(f"   • {tileset}" for tileset in tilesets)
+            lines.append("")
+            click.echo("\n".join(lines))
 
     except Exception as e:
         raise click.ClickException(str(e))
@@ -482,13 +671,15 @@ def delete_source(
     if not yes:
         click.confirm(f"Are you sure you want to delete source '{source_id}'?", abort=True)
 
+    from mtu.uploader import TilesetUploader
+
     try:
-        uploader = TilesetUploader(access_token=token, username=username)
-        if uploader.delete_source(source_id):
-            click.echo(f"\n✅ Deleted source: {source_id}\n")
-        else:
-            click.echo(f"\n❌ Failed to delete source: {source_id}\n")
-            sys.exit(1)
+        with TilesetUploader(access_token=token, username=username) as uploader:
+            if uploader.delete_source(source_id):
+                click.echo(f"\n✅ Deleted source: {source_id}\n")
+            else:
+                click.echo(f"\n❌ Failed to delete source: {source_id}\n")
+                sys.exit(1)
 
     except Exception as e:
         raise click.ClickException(str(e))
@@ -516,13 +707,15 @@ def delete_tileset(
     if not yes:
         click.confirm(f"Are you sure you want to delete tileset '{tileset_id}'?", abort=True)
 
+    from mtu.uploader import TilesetUploader
+
     try:
-        uploader = TilesetUploader(access_token=token, username=username)
-        if uploader.delete_tileset(tileset_id):
-            click.echo(f"\n✅ Deleted tileset: {tileset_id}\n")
-        else:
-            click.echo(f"\n❌ Failed to delete tileset: {tileset_id}\n")
-            sys.exit(1)
+        with TilesetUploader(access_token=token, username=username) as uploader:
+            if uploader.delete_tileset(tileset_id):
+                click.echo(f"\n✅ Deleted tileset: {tileset_id}\n")
+            else:
+                click.echo(f"\n❌ Failed to delete tileset: {tileset_id}\n")
+                sys.exit(1)
 
     except Exception as e:
         raise click.ClickException(str(e))
@@ -3,6 +3,7 @@ Converters package for transforming various GIS formats to GeoJSON.
 
 Supported formats:
 - GeoJSON (.geojson, .json) - native
+- GeoJSONSeq (.geojsonl, .geojsons, .ndjson) - native, read one line at a time
 - TopoJSON (.topojson) - built-in converter
 - Shapefile (.shp) - requires pyshp or fiona
 - GeoPackage (.gpkg) - requires fiona
@@ -10,7 +11,7 @@ Supported formats:
 - FlatGeobuf (.fgb) - requires fiona
 - GeoParquet (.parquet, .geoparquet) - requires geopandas
 - GML (.gml) - requires fiona
-- GPX (.gpx) - requires gpxpy
+- GPX (.gpx) - built-in converter
 """
 
 from mtu.converters.base import BaseConverter, ConversionResult
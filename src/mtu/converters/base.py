@@ -2,13 +2,153 @@
 Base converter interface for GIS format conversion.
 """
 
+import importlib.util
+import os
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 
-@dataclass
+def file_extension(file_path: str | Path) -> str:
+    """
+    Get the lowercase extension used to pick a converter for a file.
+
+    Compressed files keep the extension in front, e.g. ``.shp.zip``.
+
+    Args:
+        file_path: Path to the file.
+
+    Returns:
+        The file extension including the leading dot.
+    """
+    # Plain string operations, Path.suffix and Path.suffixes each rebuild
+    # the path parts. Leading dots don't start an extension, as with Path.
+    name = os.path.basename(file_path).lower()
+    dot = name.rfind(".")
+    if dot <= 0 or dot == len(name) - 1:
+        return ""
+    if name.endswith((".gz", ".zip")):
+        previous = name.rfind(".", 0, dot)
+        if previous > 0 and name[:previous].strip("."):
+            return name[previous:]
+    return name[dot:]
+
+
+def is_installed(package: str) -> bool:
+    """
+    Check if a package can be imported, without importing it.
+
+    Args:
+        package: Distribution or module name, e.g. "requests-toolbelt".
+
+    Returns:
+        True if the package is installed.
+    """
+    try:
+        return importlib.util.find_spec(package.replace("-", "_")) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def iter_encoded_parallel(
+    encode: Callable[[int, int], list[bytes]],
+    count: int,
+    workers: int,
+    chunk_size: int,
+) -> Iterator[bytes]:
+    """
+    Encode ranges of features in worker processes, yielding them in order.
+
+    Workers are started with forkserver, or spawn where that isn't
+    available, rather than by forking a process that may be running threads.
+
+    Args:
+        encode: Picklable function returning the encoded features from
+            start to stop, e.g. a functools.partial of a module function.
+        count: Number of features in the source.
+        workers: Number of worker processes.
+        chunk_size: Number of features encoded by each task.
+
+    Yields:
+        Encoded features in source order.
+    """
+    import multiprocessing
+    from concurrent.futures import Future, ProcessPoolExecutor
+
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    with ProcessPoolExecutor(workers, mp_context=context) as pool:
+        pending: deque[Future[list[bytes]]] = deque()
+        try:
+            for start in range(0, count, chunk_size):
+                stop = min(start + chunk_size, count)
+                pending.append(pool.submit(encode, start, stop))
+                # Bound the number of encoded ranges waiting to be consumed
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def fiona_to_geojson_feature(feature: Any) -> dict[str, Any] | None:
+    """
+    Convert a fiona record to a GeoJSON feature.
+
+    Args:
+        feature: Record read with fiona.
+
+    Returns:
+        The GeoJSON feature, or None if the geometry is null.
+    """
+    geom = feature.get("geometry") or {}
+    props = feature.get("properties") or {}
+    # Records from fiona 1.9+ are Mapping objects that need converting
+    # to encode as JSON, plain dicts from older versions are used as is
+    if not isinstance(geom, dict):
+        geom = dict(geom)
+    if not isinstance(props, dict):
+        props = dict(props)
+
+    if not geom or geom.get("type") is None:
+        return None
+
+    # Records are Mapping objects, so each lookup is a Python-level call
+    feature_id = feature.get("id")
+    if feature_id is None:
+        return {"type": "Feature", "geometry": geom, "properties": props}
+    return {"type": "Feature", "geometry": geom, "properties": props, "id": feature_id}
+
+
+def round_geometries(geoms: Any, precision: int) -> Any:
+    """
+    Round the coordinates of an array of shapely geometries.
+
+    Args:
+        geoms: NumPy object array of shapely geometries, changed in place.
+        precision: Number of decimal places to keep.
+
+    Returns:
+        The array with rounded geometries.
+    """
+    import numpy as np
+    import shapely
+
+    # Round XY and XYZ geometries separately to keep their dimensions
+    has_z = shapely.has_z(geoms)
+    for mask, include_z in ((~has_z, False), (has_z, True)):
+        geoms[mask] = shapely.transform(
+            geoms[mask], lambda c: np.round(c, precision), include_z=include_z
+        )
+    return geoms
+
+
+@dataclass(slots=True)
 class ConversionResult:
     """Result of a format conversion operation."""
 
@@ -59,24 +199,32 @@ class BaseConverter(ABC):
     mime_types: list[str] = []
     requires_packages: list[str] = []
 
+    # Whether convert() also accepts a binary file-like object as the source
+    supports_streams: bool = False
+
+    # Whether iter_geojsonl() can read sources without building a FeatureCollection
+    supports_geojsonl: bool = False
+
+    # Converter classes whose packages were found, so later instances skip the imports
+    _dependencies_checked: ClassVar[set[type["BaseConverter"]]] = set()
+
     def __init__(self) -> None:
         """Initialize the converter."""
         self._check_dependencies()
 
     def _check_dependencies(self) -> None:
         """Check if required packages are installed."""
-        missing = []
-        for package in self.requires_packages:
-            try:
-                __import__(package.replace("-", "_"))
-            except ImportError:
-                missing.append(package)
+        if type(self) in BaseConverter._dependencies_checked:
+            return
+
+        missing = [package for package in self.requires_packages if not is_installed(package)]
 
         if missing:
             raise ImportError(
                 f"Missing required packages for {self.format_name}: {', '.join(missing)}. "
                 f"Install with: pip install mapbox-tileset-uploader[{self.format_name.lower()}]"
             )
+        BaseConverter._dependencies_checked.add(type(self))
 
     @classmethod
     def can_handle(cls, file_path: str | Path) -> bool:
@@ -89,14 +237,7 @@ class BaseConverter(ABC):
         Returns:
             True if this converter can handle the file.
         """
-        path = Path(file_path)
-        suffix = path.suffix.lower()
-
-        # Handle compound extensions like .tar.gz
-        if suffix in (".gz", ".zip"):
-            suffix = "".join(path.suffixes[-2:]).lower()
-
-        return suffix in cls.file_extensions
+        return file_extension(file_path) in cls.file_extensions
 
     @abstractmethod
     def convert(
@@ -108,7 +249,8 @@ class BaseConverter(ABC):
         Convert the source to GeoJSON.
 
         Args:
-            source: File path, URL, or data dictionary to convert.
+            source: File path, URL, or data dictionary to convert. Converters
+                with ``supports_streams`` set also accept a binary file object.
             **options: Format-specific conversion options.
 
         Returns:
@@ -138,6 +280,30 @@ class BaseConverter(ABC):
         """
         pass
 
+    def iter_geojsonl(
+        self,
+        source: str | Path,
+        **options: Any,
+    ) -> tuple[int, Iterator[bytes]]:
+        """
+        Read a source as line-delimited GeoJSON features.
+
+        Only available when ``supports_geojsonl`` is True. Unlike convert(),
+        no warnings are reported: features convert() skips with a warning,
+        such as ones with null geometries, are skipped silently.
+
+        Args:
+            source: Path to the source file.
+            **options: Format-specific options.
+
+        Returns:
+            Tuple of (upper bound on the feature count, encoded features).
+
+        Raises:
+            ValueError: If this source can't be read this way.
+        """
+        raise ValueError(f"{self.format_name} can't be read as line-delimited GeoJSON")
+
     def validate_source(self, source: str | Path | dict[str, Any]) -> None:
         """
         Validate the source before conversion.
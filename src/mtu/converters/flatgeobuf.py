@@ -3,12 +3,26 @@ FlatGeobuf converter using fiona.
 """
 
 import tempfile
+from collections.abc import Iterator
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-from mtu.converters.base import BaseConverter, ConversionResult
+from mtu._json import dumps, round_coordinates
+from mtu.converters.base import (
+    BaseConverter,
+    ConversionResult,
+    fiona_to_geojson_feature,
+    iter_encoded_parallel,
+)
 from mtu.converters.registry import register_converter
 
+# Files with fewer features than this are encoded in the calling process
+PARALLEL_MIN_FEATURES = 50_000
+
+# Number of features encoded by each worker process task
+WORKER_CHUNK_SIZE = 10_000
+
 
 @register_converter
 class FlatGeobufConverter(BaseConverter):
@@ -18,6 +32,7 @@ class FlatGeobufConverter(BaseConverter):
     file_extensions = [".fgb"]
     mime_types = ["application/flatgeobuf"]
     requires_packages = ["fiona"]
+    supports_geojsonl = True
 
     def convert(
         self,
@@ -56,22 +71,10 @@ class FlatGeobufConverter(BaseConverter):
                     metadata["crs"] = crs_str
 
                 for feature in src:
-                    geom = dict(feature.get("geometry", {}))
-                    props = dict(feature.get("properties", {}))
-
-                    if not geom or geom.get("type") is None:
+                    feat = fiona_to_geojson_feature(feature)
+                    if feat is None:
                         warnings.append("Feature with null geometry skipped")
                         continue
-
-                    feat: dict[str, Any] = {
-                        "type": "Feature",
-                        "geometry": geom,
-                        "properties": props,
-                    }
-
-                    if feature.get("id") is not None:
-                        feat["id"] = feature["id"]
-
                     features.append(feat)
 
         except Exception as e:
@@ -87,6 +90,47 @@ class FlatGeobufConverter(BaseConverter):
             metadata=metadata,
         )
 
+    def iter_geojsonl(
+        self,
+        source: str | Path,
+        precision: int | None = None,
+        workers: int | None = None,
+        **options: Any,
+    ) -> tuple[int, Iterator[bytes]]:
+        """
+        Read FlatGeobuf as line-delimited GeoJSON features.
+
+        When workers are requested, large files are split into ranges of
+        features that worker processes read and encode in parallel; lines are
+        still yielded in file order.
+        Features with null geometry are skipped.
+
+        Args:
+            source: Path to .fgb file.
+            precision: Round coordinates to this many decimal places.
+            workers: Number of worker processes. Defaults to encoding in this
+                process.
+            **options: Not used.
+
+        Returns:
+            Tuple of (feature count, encoded features).
+        """
+        import fiona
+
+        self.validate_source(source)
+        path = str(source)
+
+        try:
+            with fiona.open(path) as src:
+                count = len(src)
+        except Exception as e:
+            raise ValueError(f"Failed to read FlatGeobuf: {e}")
+
+        if not workers or workers == 1 or count < PARALLEL_MIN_FEATURES:
+            return count, _iter_encoded(path, 0, count, precision)
+        encode = partial(_encode_features, path, precision=precision)
+        return count, iter_encoded_parallel(encode, count, workers, WORKER_CHUNK_SIZE)
+
     def convert_from_bytes(
         self,
         data: bytes,
@@ -101,3 +145,22 @@ class FlatGeobufConverter(BaseConverter):
             return self.convert(temp_path, **options)
         finally:
             temp_path.unlink(missing_ok=True)
+
+
+def _iter_encoded(path: str, start: int, stop: int, precision: int | None) -> Iterator[bytes]:
+    """Encode the features in a range of a FlatGeobuf file."""
+    import fiona
+
+    with fiona.open(path) as src:
+        for feature in src.filter(start, stop):
+            feat = fiona_to_geojson_feature(feature)
+            if feat is None:
+                continue
+            if precision is not None:
+                feat = round_coordinates(feat, precision)
+            yield dumps(feat)
+
+
+def _encode_features(path: str, start: int, stop: int, precision: int | None) -> list[bytes]:
+    """Encode a range of features in a worker process."""
+    return list(_iter_encoded(path, start, stop, precision))
@@ -2,10 +2,12 @@
 GeoJSON converter (native format - passthrough with validation).
 """
 
-import json
+from collections.abc import Callable, Iterator
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
+from mtu._json import dumps, dumps_rounded, load, loads
 from mtu.converters.base import BaseConverter, ConversionResult
 from mtu.converters.registry import register_converter
 
@@ -18,17 +20,19 @@ class GeoJSONConverter(BaseConverter):
     file_extensions = [".geojson", ".json"]
     mime_types = ["application/geo+json", "application/json"]
     requires_packages: list[str] = []  # Built-in
+    supports_streams = True
+    supports_geojsonl = True
 
     def convert(
         self,
-        source: str | Path | dict[str, Any],
+        source: str | Path | dict[str, Any] | BinaryIO,
         **options: Any,
     ) -> ConversionResult:
         """
         Load and validate GeoJSON.
 
         Args:
-            source: File path or GeoJSON dictionary.
+            source: File path, binary file object or GeoJSON dictionary.
             **options: Not used for GeoJSON.
 
         Returns:
@@ -39,9 +43,9 @@ class GeoJSONConverter(BaseConverter):
         if isinstance(source, dict):
             geojson = source
         else:
-            self.validate_source(source)
-            with open(source, encoding="utf-8") as f:
-                geojson = json.load(f)
+            if not hasattr(source, "read"):
+                self.validate_source(source)
+            geojson = load(source)
 
         # Normalize to FeatureCollection
         geojson, norm_warnings = self._normalize_geojson(geojson)
@@ -56,13 +60,42 @@ class GeoJSONConverter(BaseConverter):
             warnings=warnings,
         )
 
+    def iter_geojsonl(
+        self,
+        source: str | Path,
+        precision: int | None = None,
+        **options: Any,
+    ) -> tuple[int, Iterator[bytes]]:
+        """
+        Read GeoJSON as line-delimited features.
+
+        The document still has to be parsed as a whole, but each feature is
+        released as soon as it is encoded, so the parsed features and their
+        encoded lines are never all held in memory together.
+
+        Args:
+            source: Path to the GeoJSON file.
+            precision: Round coordinates to this many decimal places.
+            **options: Not used.
+
+        Returns:
+            Tuple of (feature count, encoded features).
+        """
+        self.validate_source(source)
+        geojson, _ = self._normalize_geojson(load(source))
+        features = geojson.get("features", [])
+        encode: Callable[[Any], bytes] = dumps
+        if precision is not None:
+            encode = partial(dumps_rounded, precision=precision)
+        return len(features), _iter_encoded(features, encode)
+
     def convert_from_bytes(
         self,
         data: bytes,
         **options: Any,
     ) -> ConversionResult:
         """Convert GeoJSON from bytes."""
-        geojson = json.loads(data.decode("utf-8"))
+        geojson = loads(data)
         return self.convert(geojson, **options)
 
     def _normalize_geojson(
@@ -111,3 +144,11 @@ class GeoJSONConverter(BaseConverter):
             }, warnings
 
         raise ValueError(f"Invalid GeoJSON type: {geojson_type}")
+
+
+def _iter_encoded(features: list[Any], encode: Callable[[Any], bytes]) -> Iterator[bytes]:
+    """Encode features in order, dropping each one from the list once it is encoded."""
+    # Popping from the end is cheap, so reverse once and pop from there
+    features.reverse()
+    while features:
+        yield encode(features.pop())
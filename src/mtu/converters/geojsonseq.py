@@ -0,0 +1,178 @@
+"""
+GeoJSON Text Sequence converter (RFC 8142, line-delimited GeoJSON).
+"""
+
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from mtu._json import JSONDecodeError, dumps, loads, round_coordinates
+from mtu.converters.base import ConversionResult
+from mtu.converters.geojson import GeoJSONConverter
+from mtu.converters.registry import register_converter
+
+# RFC 8142 prefixes each text with a record separator, newline-delimited
+# GeoJSON doesn't; both are accepted
+_WHITESPACE = b"\x1e \t\r\n"
+
+# Size of the blocks read when counting lines
+_COUNT_BLOCK_SIZE = 1024 * 1024
+
+
+@register_converter
+class GeoJSONSeqConverter(GeoJSONConverter):
+    """Converter for line-delimited GeoJSON files, one object per line."""
+
+    format_name = "GeoJSONSeq"
+    file_extensions = [".geojsonl", ".geojsons", ".ndjson"]
+    mime_types = ["application/geo+json-seq"]
+    requires_packages: list[str] = []  # Built-in
+    supports_streams = True
+    supports_geojsonl = True
+
+    def convert(
+        self,
+        source: str | Path | dict[str, Any] | BinaryIO,
+        **options: Any,
+    ) -> ConversionResult:
+        """
+        Load line-delimited GeoJSON into a FeatureCollection.
+
+        Args:
+            source: File path, binary file object or GeoJSON dictionary.
+            **options: Not used for GeoJSONSeq.
+
+        Returns:
+            ConversionResult with the GeoJSON data.
+        """
+        if isinstance(source, dict):
+            result = super().convert(source)
+            result.source_format = self.format_name
+            return result
+
+        if hasattr(source, "read"):
+            features, warnings = self._read_lines(source)
+        else:
+            self.validate_source(source)
+            with open(source, "rb") as f:
+                features, warnings = self._read_lines(f)
+
+        return ConversionResult(
+            geojson={"type": "FeatureCollection", "features": features},
+            source_format=self.format_name,
+            feature_count=len(features),
+            warnings=warnings,
+        )
+
+    def convert_from_bytes(
+        self,
+        data: bytes,
+        **options: Any,
+    ) -> ConversionResult:
+        """Convert line-delimited GeoJSON from bytes."""
+        features, warnings = self._read_lines(data.splitlines())
+        return ConversionResult(
+            geojson={"type": "FeatureCollection", "features": features},
+            source_format=self.format_name,
+            feature_count=len(features),
+            warnings=warnings,
+        )
+
+    def iter_geojsonl(
+        self,
+        source: str | Path,
+        precision: int | None = None,
+        **options: Any,
+    ) -> tuple[int, Iterator[bytes]]:
+        """
+        Read line-delimited GeoJSON as line-delimited features.
+
+        The file is read one line at a time, so only a single feature is held
+        in memory no matter how large the file is. Every line is parsed, but
+        lines that hold a Feature are passed through without being encoded
+        again unless coordinates are rounded.
+
+        Args:
+            source: Path to the line-delimited GeoJSON file.
+            precision: Round coordinates to this many decimal places.
+            **options: Not used.
+
+        Returns:
+            Tuple of (line count, encoded features). Blank lines make the
+            count too high and FeatureCollection lines too low.
+        """
+        self.validate_source(source)
+        return _count_lines(source), self._iter_lines(source, precision)
+
+    def _iter_lines(self, path: str | Path, precision: int | None) -> Iterator[bytes]:
+        """Yield each feature in a file, encoded as a single line."""
+        with open(path, "rb") as f:
+            if precision is not None:
+                for feature in self._iter_features(f, []):
+                    yield dumps(round_coordinates(feature, precision))
+                return
+
+            for number, line in enumerate(f, 1):
+                line = line.strip(_WHITESPACE)
+                if not line:
+                    continue
+                obj = _parse_line(line, number)
+                if obj.get("type") == "Feature":
+                    yield line
+                else:
+                    yield from map(dumps, self._normalize_geojson(obj)[0].get("features", []))
+
+    def _read_lines(self, lines: Iterable[bytes]) -> tuple[list[dict[str, Any]], list[str]]:
+        """Parse lines into a list of features, returning (features, warnings)."""
+        warnings: list[str] = []
+        features = list(self._iter_features(lines, warnings))
+        return features, warnings
+
+    def _iter_features(
+        self, lines: Iterable[bytes], warnings: list[str], first_line: int = 1
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Parse GeoJSON texts one per line and yield their features.
+
+        Texts that aren't Features are normalized the same way as GeoJSON
+        files; each distinct warning is only reported once.
+        """
+        for number, line in enumerate(lines, first_line):
+            line = line.strip(_WHITESPACE)
+            if not line:
+                continue
+            obj = _parse_line(line, number)
+            if obj.get("type") == "Feature":
+                yield obj
+                continue
+
+            collection, line_warnings = self._normalize_geojson(obj)
+            for warning in line_warnings:
+                if warning not in warnings:
+                    warnings.append(warning)
+            yield from collection.get("features", [])
+
+
+def _count_lines(path: str | Path) -> int:
+    """Count the lines of a file, including a last line without a newline."""
+    count = 0
+    # An empty file counts as ending in a newline
+    last = b"\n"
+    with open(path, "rb", buffering=0) as f:
+        while block := f.read(_COUNT_BLOCK_SIZE):
+            count += block.count(b"\n")
+            last = block[-1:]
+    if last != b"\n":
+        count += 1
+    return count
+
+
+def _parse_line(line: bytes, number: int) -> dict[str, Any]:
+    """Parse a line holding a GeoJSON object."""
+    try:
+        obj = loads(line)
+    except JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON on line {number}: {e}") from e
+    if not isinstance(obj, dict):
+        raise ValueError(f"Invalid GeoJSON on line {number}: expected an object")
+    return obj
@@ -2,12 +2,13 @@
 GeoParquet converter using geopandas.
 """
 
-import json
 import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
-from mtu.converters.base import BaseConverter, ConversionResult
+from mtu._json import dumps, loads
+from mtu.converters.base import BaseConverter, ConversionResult, round_geometries
 from mtu.converters.registry import register_converter
 
 
@@ -19,6 +20,7 @@ class GeoParquetConverter(BaseConverter):
     file_extensions = [".parquet", ".geoparquet"]
     mime_types = ["application/x-parquet", "application/geoparquet"]
     requires_packages = ["geopandas", "pyarrow"]
+    supports_geojsonl = True
 
     def convert(
         self,
@@ -67,8 +69,7 @@ class GeoParquetConverter(BaseConverter):
             warnings.append(f"{null_count} features with null geometry will be skipped")
             gdf = gdf[gdf.geometry.notna()]
 
-        # Convert to GeoJSON
-        geojson = json.loads(gdf.to_json())
+        geojson = loads(_encode_feature_collection(gdf))
 
         return ConversionResult(
             geojson=geojson,
@@ -78,6 +79,115 @@ class GeoParquetConverter(BaseConverter):
             metadata=metadata,
         )
 
+    def iter_geojsonl(
+        self,
+        source: str | Path,
+        batch_size: int = 10_000,
+        precision: int | None = None,
+        **options: Any,
+    ) -> tuple[int, Iterator[bytes]]:
+        """
+        Read GeoParquet as line-delimited GeoJSON features.
+
+        Rows are read in Arrow record batches and geometries are encoded with
+        shapely's vectorized GeoJSON writer, so no GeoDataFrame or
+        FeatureCollection is built. Features with null geometry are skipped.
+
+        Args:
+            source: Path to .parquet or .geoparquet file.
+            batch_size: Number of rows read at a time.
+            precision: Round coordinates to this many decimal places.
+            **options: Not used.
+
+        Returns:
+            Tuple of (row count, encoded features).
+
+        Raises:
+            ValueError: If the geometry isn't WKB encoded or a property column
+                has a type that needs geopandas' conversion.
+        """
+        import pyarrow.parquet as pq
+
+        self.validate_source(source)
+
+        try:
+            parquet_file = pq.ParquetFile(str(source))
+            schema = parquet_file.schema_arrow
+            geo = loads(schema.metadata[b"geo"])
+            geometry_column = geo["primary_column"]
+            encoding = geo["columns"][geometry_column].get("encoding", "WKB")
+        except Exception as e:
+            raise ValueError(f"Failed to read GeoParquet metadata: {e}")
+
+        if encoding != "WKB":
+            raise ValueError(f"Unsupported geometry encoding: {encoding}")
+
+        index = _index_metadata(schema, parquet_file.metadata.num_rows)
+        columns = [
+            name
+            for name in schema.names
+            if name != geometry_column and name != index and not name.startswith("__index_level_")
+        ]
+        for name in [*columns, *([index] if isinstance(index, str) else [])]:
+            if not _is_json_type(schema.field(name).type):
+                raise ValueError(f"Column {name} has unsupported type {schema.field(name).type}")
+
+        features = self._iter_features(
+            parquet_file, geometry_column, columns, index, batch_size, precision
+        )
+        return parquet_file.metadata.num_rows, features
+
+    def _iter_features(
+        self,
+        parquet_file: Any,
+        geometry_column: str,
+        columns: list[str],
+        index: str | range,
+        batch_size: int,
+        precision: int | None,
+    ) -> Iterator[bytes]:
+        """
+        Encode each row of a GeoParquet file as a GeoJSON feature.
+
+        Features are encoded the same way as by convert(), with the
+        GeoDataFrame index as the feature ID and empty geometries as null.
+        """
+        import pyarrow.compute as pc
+        import pyarrow.types as pa_types
+        import shapely
+
+        read_columns = [*columns, geometry_column]
+        if isinstance(index, str):
+            read_columns.append(index)
+        start = 0
+        for batch in parquet_file.iter_batches(batch_size=batch_size, columns=read_columns):
+            wkb = batch.column(geometry_column).to_numpy(zero_copy_only=False)
+            geoms = shapely.from_wkb(wkb)
+            missing = shapely.is_missing(geoms).tolist()
+            if precision is not None:
+                geoms = round_geometries(geoms, precision)
+            geometries = shapely.to_geojson(geoms)
+            geometries[shapely.is_empty(geoms)] = None
+
+            if isinstance(index, str):
+                ids = map(str, batch.column(index).to_pylist())
+            else:
+                ids = map(str, index[start : start + batch.num_rows])
+            start += batch.num_rows
+
+            values = []
+            for name in columns:
+                column = batch.column(name)
+                if pa_types.is_floating(column.type):
+                    # NaN is not valid JSON, write it as null like geopandas does
+                    column = pc.if_else(pc.is_nan(column), None, column)
+                values.append(column.to_pylist())
+
+            for feature_id, is_missing, geometry, *row in zip(ids, missing, geometries, *values):
+                if is_missing:
+                    continue
+                yield _encode_feature(feature_id, geometry, dict(zip(columns, row)))
+
     def convert_from_bytes(
         self,
         data: bytes,
@@ -92,3 +202,93 @@ class GeoParquetConverter(BaseConverter):
             return self.convert(temp_path, **options)
         finally:
             temp_path.unlink(missing_ok=True)
+
+
+def _encode_feature_collection(gdf: Any) -> bytes:
+    """
+    Encode a GeoDataFrame as a FeatureCollection.
+
+    The features are the same as the ones from GeoDataFrame.to_geo_dict(na="null"),
+    but geometries are encoded with shapely's vectorized GeoJSON writer instead
+    of building a mapping for each one in Python.
+    """
+    import pandas as pd
+    import shapely
+
+    geoms = gdf.geometry.values
+    geometries = shapely.to_geojson(geoms)
+    # to_geo_dict() writes empty geometries as null
+    geometries[shapely.is_empty(geoms)] = None
+
+    columns = gdf.columns.drop(gdf.geometry.name)
+    properties = gdf[columns].astype(object)
+    properties[pd.isna(gdf[columns]).values] = None
+    names = columns.tolist()
+
+    lines = [
+        _encode_feature(str(feature_id), geometry, dict(zip(names, row)))
+        for feature_id, geometry, row in zip(gdf.index, geometries, properties.values)
+    ]
+    return b'{"type":"FeatureCollection","features":[' + b",".join(lines) + b"]}"
+
+
+def _encode_feature(feature_id: str, geometry: str | None, properties: dict[str, Any]) -> bytes:
+    """Encode a feature from its ID, GeoJSON geometry and properties."""
+    return (
+        b'{"id":'
+        + dumps(feature_id)
+        + b',"type":"Feature","properties":'
+        + dumps(properties)
+        + b',"geometry":'
+        + (b"null" if geometry is None else geometry.encode())
+        + b"}"
+    )
+
+
+def _index_metadata(schema: Any, num_rows: int) -> str | range:
+    """
+    Get the index geopandas would read for a GeoParquet file.
+
+    Returns:
+        The name of the index column, or the range of a range index.
+
+    Raises:
+        ValueError: If the index has more than one level.
+    """
+    pandas_metadata = schema.pandas_metadata or {}
+    index_columns = pandas_metadata.get("index_columns", [])
+    if not index_columns:
+        return range(num_rows)
+    if len(index_columns) > 1:
+        raise ValueError("Multi-level indexes are not supported")
+    index = index_columns[0]
+    if isinstance(index, str):
+        return index
+    return range(index["start"], index["stop"], index["step"])
+
+
+def _is_json_type(data_type: Any) -> bool:
+    """Check if an Arrow type maps directly onto a JSON value."""
+    import pyarrow.types as pa_types
+
+    # Categorical columns are dictionary encoded, and nested values come out
+    # of to_pylist() as lists and dicts
+    if pa_types.is_dictionary(data_type):
+        return _is_json_type(data_type.value_type)
+    if (
+        pa_types.is_list(data_type)
+        or pa_types.is_large_list(data_type)
+        or pa_types.is_fixed_size_list(data_type)
+    ):
+        return _is_json_type(data_type.value_type)
+    if pa_types.is_struct(data_type):
+        return all(_is_json_type(child.type) for child in data_type)
+
+    return bool(
+        pa_types.is_integer(data_type)
+        or pa_types.is_floating(data_type)
+        or pa_types.is_string(data_type)
+        or pa_types.is_large_string(data_type)
+        or pa_types.is_boolean(data_type)
+        or pa_types.is_null(data_type)
+    )
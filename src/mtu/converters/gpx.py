@@ -2,13 +2,25 @@
 GPX (GPS Exchange Format) converter.
 """
 
+import gc
+import re
 import tempfile
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from functools import partial
+from itertools import chain
 from pathlib import Path
 from typing import Any
+from xml.etree import ElementTree
 
+from mtu._json import dumps, dumps_rounded
 from mtu.converters.base import BaseConverter, ConversionResult
 from mtu.converters.registry import register_converter
 
+# Fractional seconds, which datetime.fromisoformat() only accepts with 3 or 6
+# digits before Python 3.11
+_FRACTION = re.compile(r"\.(\d+)")
+
 
 @register_converter
 class GPXConverter(BaseConverter):
@@ -17,7 +29,8 @@ class GPXConverter(BaseConverter):
     format_name = "GPX"
     file_extensions = [".gpx"]
     mime_types = ["application/gpx+xml"]
-    requires_packages = ["gpxpy"]
+    requires_packages: list[str] = []  # Built-in
+    supports_geojsonl = True
 
     def convert(
         self,
@@ -40,114 +53,19 @@ class GPXConverter(BaseConverter):
         Returns:
             ConversionResult with the GeoJSON data.
         """
-        import gpxpy
-
-        warnings: list[str] = []
         self.validate_source(source)
 
-        path = Path(source)
-        features: list[dict[str, Any]] = []
+        waypoints, routes, tracks, warnings = self._read(
+            Path(source), include_tracks, include_routes, include_waypoints, _identity
+        )
+
+        features = waypoints + routes + tracks
         metadata: dict[str, Any] = {
-            "tracks": 0,
-            "routes": 0,
-            "waypoints": 0,
+            "tracks": len(tracks),
+            "routes": len(routes),
+            "waypoints": len(waypoints),
         }
 
-        with open(path, encoding="utf-8") as f:
-            try:
-                gpx = gpxpy.parse(f)
-            except Exception as e:
-                raise ValueError(f"Failed to parse GPX: {e}")
-
-        # Process waypoints
-        if include_waypoints:
-            for wpt in gpx.waypoints:
-                props: dict[str, Any] = {
-                    "type": "waypoint",
-                    "name": wpt.name,
-                    "description": wpt.description,
-                    "elevation": wpt.elevation,
-                    "time": wpt.time.isoformat() if wpt.time else None,
-                }
-                # Remove None values
-                props = {k: v for k, v in props.items() if v is not None}
-
-                features.append(
-                    {
-                        "type": "Feature",
-                        "geometry": {
-                            "type": "Point",
-                            "coordinates": self._point_coords(wpt),
-                        },
-                        "properties": props,
-                    }
-                )
-                metadata["waypoints"] += 1
-
-        # Process routes
-        if include_routes:
-            for route in gpx.routes:
-                if not route.points:
-                    warnings.append(f"Empty route '{route.name}' skipped")
-                    continue
-
-                coords = [self._point_coords(pt) for pt in route.points]
-                props = {
-                    "type": "route",
-                    "name": route.name,
-                    "description": route.description,
-                }
-                props = {k: v for k, v in props.items() if v is not None}
-
-                features.append(
-                    {
-                        "type": "Feature",
-                        "geometry": {
-                            "type": "LineString",
-                            "coordinates": coords,
-                        },
-                        "properties": props,
-                    }
-                )
-                metadata["routes"] += 1
-
-        # Process tracks
-        if include_tracks:
-            for track in gpx.tracks:
-                for i, segment in enumerate(track.segments):
-                    if not segment.points:
-                        warnings.append(f"Empty track segment in '{track.name}' skipped")
-                        continue
-
-                    coords = [self._point_coords(pt) for pt in segment.points]
-                    props = {
-                        "type": "track",
-                        "name": track.name,
-                        "segment": i,
-                        "description": track.description,
-                    }
-                    props = {k: v for k, v in props.items() if v is not None}
-
-                    # Calculate track statistics
-                    if segment.points:
-                        times = [pt.time for pt in segment.points if pt.time]
-                        if len(times) >= 2:
-                            props["start_time"] = times[0].isoformat()
-                            props["end_time"] = times[-1].isoformat()
-                            props["duration_seconds"] = (times[-1] - times[0]).total_seconds()
-
-                    features.append(
-                        {
-                            "type": "Feature",
-                            "geometry": {
-                                "type": "LineString",
-                                "coordinates": coords,
-                            },
-                            "properties": props,
-                        }
-                    )
-                    metadata["tracks"] += 1
-
         if not features:
             warnings.append("No features found in GPX file")
 
@@ -161,11 +79,231 @@ class GPXConverter(BaseConverter):
             metadata=metadata,
         )
 
-    def _point_coords(self, point: Any) -> list[float]:
-        """Extract coordinates from GPX point."""
-        if point.elevation is not None:
-            return [point.longitude, point.latitude, point.elevation]
-        return [point.longitude, point.latitude]
+    def iter_geojsonl(
+        self,
+        source: str | Path,
+        include_tracks: bool = True,
+        include_routes: bool = True,
+        include_waypoints: bool = True,
+        precision: int | None = None,
+        **options: Any,
+    ) -> tuple[int, Iterator[bytes]]:
+        """
+        Read GPX as line-delimited GeoJSON features.
+
+        Features are encoded as soon as they are built, so only their
+        encoded form is kept until the file has been read.
+
+        Args:
+            source: Path to .gpx file.
+            include_tracks: Include track data as LineStrings.
+            include_routes: Include route data as LineStrings.
+            include_waypoints: Include waypoint data as Points.
+            precision: Round coordinates to this many decimal places.
+            **options: Not used.
+
+        Returns:
+            Tuple of (feature count, encoded features).
+        """
+        self.validate_source(source)
+
+        encode: Callable[[dict[str, Any]], bytes] = dumps
+        if precision is not None:
+            encode = partial(dumps_rounded, precision=precision)
+
+        waypoints, routes, tracks, _ = self._read(
+            Path(source), include_tracks, include_routes, include_waypoints, encode
+        )
+        return len(waypoints) + len(routes) + len(tracks), chain(waypoints, routes, tracks)
+
+    def _read(
+        self,
+        path: Path,
+        include_tracks: bool,
+        include_routes: bool,
+        include_waypoints: bool,
+        encode: Callable[[dict[str, Any]], Any],
+    ) -> tuple[list[Any], list[Any], list[Any], list[str]]:
+        """
+        Parse a GPX file into waypoint, route and track features.
+
+        The file is parsed incrementally and every element is cleared once
+        its feature is built, so the XML tree never exists in full.
+
+        Returns:
+            Tuple of (waypoints, routes, tracks, warnings), with every
+            feature passed through encode.
+        """
+        waypoints: list[Any] = []
+        routes: list[Any] = []
+        tracks: list[Any] = []
+        route_warnings: list[str] = []
+        track_warnings: list[str] = []
+
+        # Positions and times of the route or track segment being read
+        points: list[list[float]] = []
+        times: list[str] = []
+        segments: list[tuple[list[list[float]], list[str]]] = []
+
+        # Tracks can have millions of points, and collections triggered by
+        # building their coordinates dominate the run time. The parsed
+        # elements and features can't contain reference cycles.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            ns = _namespace(path)
+            wpt, rte, rtept, trk, trkseg, trkpt, ele, time = (
+                f"{ns}{name}"
+                for name in ("wpt", "rte", "rtept", "trk", "trkseg", "trkpt", "ele", "time")
+            )
+
+            # Only end events are needed, which halves the events read for
+            # the ele and time elements of every point
+            for _, elem in ElementTree.iterparse(str(path)):
+                tag = elem.tag
+                if tag == trkpt or tag == rtept:
+                    points.append(self._point_coords(elem, ele))
+                    timestamp = elem.findtext(time)
+                    if timestamp:
+                        times.append(timestamp)
+                    elem.clear()
+                elif tag == trkseg:
+                    segments.append((points, times))
+                    points, times = [], []
+                    elem.clear()
+                elif tag == wpt:
+                    if include_waypoints:
+                        waypoints.append(encode(self._waypoint_feature(elem, ns)))
+                    elem.clear()
+                elif tag == rte:
+                    if include_routes:
+                        route = self._route_feature(elem, ns, points)
+                        if route is None:
+                            name = elem.findtext(f"{ns}name") or None
+                            route_warnings.append(f"Empty route '{name}' skipped")
+                        else:
+                            routes.append(encode(route))
+                    points, times = [], []
+                    elem.clear()
+                elif tag == trk:
+                    if include_tracks:
+                        features = self._track_features(elem, ns, segments, track_warnings)
+                        tracks.extend(map(encode, features))
+                    segments = []
+                    elem.clear()
+        except Exception as e:
+            raise ValueError(f"Failed to parse GPX: {e}")
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        return waypoints, routes, tracks, route_warnings + track_warnings
+
+    def _waypoint_feature(self, wpt: ElementTree.Element, ns: str) -> dict[str, Any]:
+        """Build a Point feature from a wpt element."""
+        # Only values present in the file are set
+        props: dict[str, Any] = {"type": "waypoint"}
+        name = wpt.findtext(f"{ns}name")
+        if name:
+            props["name"] = name
+        description = wpt.findtext(f"{ns}desc")
+        if description:
+            props["description"] = description
+        elevation = wpt.findtext(f"{ns}ele")
+        if elevation:
+            props["elevation"] = float(elevation)
+        time = wpt.findtext(f"{ns}time")
+        if time:
+            props["time"] = _format_time(time)
+
+        return {
+            "type": "Feature",
+            "geometry": {
+                "type": "Point",
+                "coordinates": self._point_coords(wpt, f"{ns}ele"),
+            },
+            "properties": props,
+        }
+
+    def _route_feature(
+        self,
+        rte: ElementTree.Element,
+        ns: str,
+        coords: list[list[float]],
+    ) -> dict[str, Any] | None:
+        """Build a LineString feature from a rte element, or None when empty."""
+        if not coords:
+            return None
+
+        props = {"type": "route"}
+        name = rte.findtext(f"{ns}name")
+        if name:
+            props["name"] = name
+        description = rte.findtext(f"{ns}desc")
+        if description:
+            props["description"] = description
+
+        return {
+            "type": "Feature",
+            "geometry": {
+                "type": "LineString",
+                "coordinates": coords,
+            },
+            "properties": props,
+        }
+
+    def _track_features(
+        self,
+        trk: ElementTree.Element,
+        ns: str,
+        segments: list[tuple[list[list[float]], list[str]]],
+        warnings: list[str],
+    ) -> list[dict[str, Any]]:
+        """Build a LineString feature for each segment of a trk element."""
+        name = trk.findtext(f"{ns}name") or None
+        description = trk.findtext(f"{ns}desc") or None
+        features = []
+
+        for i, (coords, times) in enumerate(segments):
+            if not coords:
+                warnings.append(f"Empty track segment in '{name}' skipped")
+                continue
+
+            props: dict[str, Any] = {"type": "track"}
+            if name:
+                props["name"] = name
+            props["segment"] = i
+            if description:
+                props["description"] = description
+
+            # Calculate track statistics
+            if len(times) >= 2:
+                start, end = _parse_time(times[0]), _parse_time(times[-1])
+                props["start_time"] = start.isoformat()
+                props["end_time"] = end.isoformat()
+                props["duration_seconds"] = (end - start).total_seconds()
+
+            features.append(
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": coords,
+                    },
+                    "properties": props,
+                }
+            )
+
+        return features
+
+    def _point_coords(self, point: ElementTree.Element, ele: str) -> list[float]:
+        """Extract coordinates from a GPX point element, given the ele tag name."""
+        # Called for every point, so the tag name is built once by the caller
+        elevation = point.findtext(ele)
+        attrib = point.attrib
+        if elevation:
+            return [float(attrib["lon"]), float(attrib["lat"]), float(elevation)]
+        return [float(attrib["lon"]), float(attrib["lat"])]
 
     def convert_from_bytes(
         self,
@@ -181,3 +319,42 @@ class GPXConverter(BaseConverter):
             return self.convert(temp_path, **options)
         finally:
             temp_path.unlink(missing_ok=True)
+
+
+def _namespace(path: Path) -> str:
+    """Return the namespace of the root element, as used in element tags."""
+    # GPX 1.0 and 1.1 use different namespaces
+    with open(path, "rb") as f:
+        _, root = next(ElementTree.iterparse(f, events=("start",)))
+    return root.tag[: root.tag.index("}") + 1] if root.tag[0] == "{" else ""
+
+
+def _parse_time(text: str) -> datetime:
+    """Parse an ISO 8601 GPX timestamp."""
+    return datetime.fromisoformat(_normalize_time(text))
+
+
+def _format_time(text: str) -> str:
+    """Format a GPX timestamp the way datetime.isoformat() does."""
+    text = _normalize_time(text)
+    parsed = datetime.fromisoformat(text)
+    # Whole seconds with a positive or UTC offset are already in the output
+    # format, which is what most files contain, so formatting is skipped
+    if len(text) == 25 and text[10] == "T" and text[19] == "+":
+        return text
+    return parsed.isoformat()
+
+
+def _normalize_time(text: str) -> str:
+    """Rewrite a timestamp in the form datetime.fromisoformat() accepts."""
+    text = text.strip()
+    if text[-1] in "Zz":
+        text = text[:-1] + "+00:00"
+    if "." in text:
+        text = _FRACTION.sub(lambda m: "." + m.group(1)[:6].ljust(6, "0"), text, count=1)
+    return text
+
+
+def _identity(feature: dict[str, Any]) -> dict[str, Any]:
+    """Return a feature unchanged."""
+    return feature
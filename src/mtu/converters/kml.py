@@ -7,7 +7,7 @@ import zipfile
 from pathlib import Path
 from typing import Any
 
-from mtu.converters.base import BaseConverter, ConversionResult
+from mtu.converters.base import BaseConverter, ConversionResult, fiona_to_geojson_feature
 from mtu.converters.registry import register_converter
 
 
@@ -57,28 +57,18 @@ class KMLConverter(BaseConverter):
         try:
             with fiona.open(str(path), driver="KML") as src:
                 for feature in src:
-                    geom = dict(feature.get("geometry", {}))
-                    props = dict(feature.get("properties", {}))
-
-                    if not geom or geom.get("type") is None:
+                    feat = fiona_to_geojson_feature(feature)
+                    if feat is None:
                         warnings.append("Feature with null geometry skipped")
                         continue
 
                     # KML often has HTML in description
+                    props = feat["properties"]
                     if "description" in props and props["description"]:
                         desc = props["description"]
                         if "<" in str(desc) and ">" in str(desc):
                             warnings.append("Description contains HTML markup - may need cleaning")
 
-                    feat: dict[str, Any] = {
-                        "type": "Feature",
-                        "geometry": geom,
-                        "properties": props,
-                    }
-
-                    if feature.get("id") is not None:
-                        feat["id"] = feature["id"]
-
                     features.append(feat)
 
         except Exception as e:
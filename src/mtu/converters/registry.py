@@ -2,10 +2,44 @@
 Converter registry for auto-detecting and loading format converters.
 """
 
+import importlib
 from pathlib import Path
 from typing import Any
 
-from mtu.converters.base import BaseConverter
+from mtu.converters.base import BaseConverter, file_extension, is_installed
+
+# Built-in converters as format name -> (module, class), imported on first use
+_BUILTIN_CONVERTERS = {
+    "flatgeobuf": ("mtu.converters.flatgeobuf", "FlatGeobufConverter"),
+    "geojson": ("mtu.converters.geojson", "GeoJSONConverter"),
+    "geojsonseq": ("mtu.converters.geojsonseq", "GeoJSONSeqConverter"),
+    "geopackage": ("mtu.converters.geopackage", "GeoPackageConverter"),
+    "geoparquet": ("mtu.converters.geoparquet", "GeoParquetConverter"),
+    "gpx": ("mtu.converters.gpx", "GPXConverter"),
+    "kml": ("mtu.converters.kml", "KMLConverter"),
+    "shapefile": ("mtu.converters.shapefile", "ShapefileConverter"),
+    "topojson": ("mtu.converters.topojson", "TopoJSONConverter"),
+}
+
+# File extensions of the built-in converters, so files can be matched
+# without importing their modules
+_BUILTIN_EXTENSIONS = {
+    ".fgb": "flatgeobuf",
+    ".geojson": "geojson",
+    ".json": "geojson",
+    ".geojsonl": "geojsonseq",
+    ".geojsons": "geojsonseq",
+    ".ndjson": "geojsonseq",
+    ".gpkg": "geopackage",
+    ".parquet": "geoparquet",
+    ".geoparquet": "geoparquet",
+    ".gpx": "gpx",
+    ".kml": "kml",
+    ".kmz": "kml",
+    ".shp": "shapefile",
+    ".zip": "shapefile",
+    ".topojson": "topojson",
+}
 
 
 class ConverterRegistry:
@@ -17,6 +51,11 @@ class ConverterRegistry:
 
     _converters: dict[str, type[BaseConverter]] = {}
     _extension_map: dict[str, str] = {}
+    # Installed packages don't change while running, so availability is
+    # checked once per converter
+    _availability: dict[type[BaseConverter], bool] = {}
+    # Built by get_supported_formats() and reset when a converter is registered
+    _formats: list[dict[str, Any]] | None = None
 
     @classmethod
     def register(cls, converter_class: type[BaseConverter]) -> type[BaseConverter]:
@@ -36,10 +75,15 @@ class ConverterRegistry:
         """
         format_name = converter_class.format_name.lower()
         cls._converters[format_name] = converter_class
+        # Kept sorted by name, re-sorted in place as registering is rare
+        converters = sorted(cls._converters.items())
+        cls._converters.clear()
+        cls._converters.update(converters)
 
         for ext in converter_class.file_extensions:
             cls._extension_map[ext.lower()] = format_name
 
+        cls._formats = None
         return converter_class
 
     @classmethod
@@ -63,27 +107,24 @@ class ConverterRegistry:
         """
         if format_name:
             name = format_name.lower()
+            cls._load_builtin(name)
             if name not in cls._converters:
+                supported = {**dict.fromkeys(_BUILTIN_CONVERTERS), **cls._converters}
                 raise ValueError(
-                    f"Unknown format: {format_name}. Supported: {', '.join(cls._converters.keys())}"
+                    f"Unknown format: {format_name}. Supported: {', '.join(supported)}"
                 )
             return cls._converters[name]()
 
         if file_path:
-            path = Path(file_path)
-            suffix = path.suffix.lower()
-
-            # Handle compound extensions
-            if suffix in (".gz", ".zip"):
-                suffix = "".join(path.suffixes[-2:]).lower()
-
-            if suffix not in cls._extension_map:
+            suffix = file_extension(file_path)
+            format_name = cls._extension_map.get(suffix) or _BUILTIN_EXTENSIONS.get(suffix)
+            if format_name is None:
+                supported = {**_BUILTIN_EXTENSIONS, **cls._extension_map}
                 raise ValueError(
-                    f"Unknown file extension: {suffix}. "
-                    f"Supported: {', '.join(cls._extension_map.keys())}"
+                    f"Unknown file extension: {suffix}. Supported: {', '.join(supported)}"
                 )
 
-            format_name = cls._extension_map[suffix]
+            cls._load_builtin(format_name)
             return cls._converters[format_name]()
 
         raise ValueError("Either format_name or file_path must be provided")
@@ -96,22 +137,36 @@ class ConverterRegistry:
         Returns:
             List of converter info dictionaries.
         """
-        result = []
-        for name, converter_class in sorted(cls._converters.items()):
-            info = converter_class.get_info()
-            info["available"] = cls._is_available(converter_class)
-            result.append(info)
-        return result
+        if cls._formats is None:
+            for name in _BUILTIN_CONVERTERS:
+                cls._load_builtin(name)
+            formats = []
+            for converter_class in cls._converters.values():
+                info = converter_class.get_info()
+                info["available"] = cls._is_available(converter_class)
+                formats.append(info)
+            cls._formats = formats
+        # Copies, so callers can't change the cached entries
+        return [dict(info) for info in cls._formats]
+
+    @classmethod
+    def _load_builtin(cls, format_name: str) -> None:
+        """Import and register a built-in converter that isn't registered yet."""
+        if format_name in cls._converters or format_name not in _BUILTIN_CONVERTERS:
+            return
+        module_name, class_name = _BUILTIN_CONVERTERS[format_name]
+        # Importing registers the converter the first time; registering it
+        # here as well covers a module that was imported before
+        cls.register(getattr(importlib.import_module(module_name), class_name))
 
     @classmethod
     def _is_available(cls, converter_class: type[BaseConverter]) -> bool:
         """Check if a converter's dependencies are installed."""
-        for package in converter_class.requires_packages:
-            try:
-                __import__(package.replace("-", "_"))
-            except ImportError:
-                return False
-        return True
+        available = cls._availability.get(converter_class)
+        if available is None:
+            available = all(map(is_installed, converter_class.requires_packages))
+            cls._availability[converter_class] = available
+        return available
 
     @classmethod
     def is_supported(cls, file_path: str | Path) -> bool:
@@ -124,11 +179,8 @@ class ConverterRegistry:
         Returns:
             True if the format is supported.
         """
-        path = Path(file_path)
-        suffix = path.suffix.lower()
-        if suffix in (".gz", ".zip"):
-            suffix = "".join(path.suffixes[-2:]).lower()
-        return suffix in cls._extension_map
+        suffix = file_extension(file_path)
+        return suffix in cls._extension_map or suffix in _BUILTIN_EXTENSIONS
 
 
 # Convenience functions
@@ -148,47 +200,3 @@ def get_supported_formats() -> list[dict[str, Any]]:
 def register_converter(converter_class: type[BaseConverter]) -> type[BaseConverter]:
     """Register a converter. See ConverterRegistry.register."""
     return ConverterRegistry.register(converter_class)
-
-
-def _register_builtin_converters() -> None:
-    """Register all built-in converters."""
-    # Import converters to trigger registration
-    from mtu.converters import (
-        geojson,  # noqa: F401
-        topojson,  # noqa: F401
-    )
-
-    # Optional converters - only register if dependencies available
-    try:
-        from mtu.converters import shapefile  # noqa: F401
-    except ImportError:
-        pass
-
-    try:
-        from mtu.converters import geopackage  # noqa: F401
-    except ImportError:
-        pass
-
-    try:
-        from mtu.converters import kml  # noqa: F401
-    except ImportError:
-        pass
-
-    try:
-        from mtu.converters import flatgeobuf  # noqa: F401
-    except ImportError:
-        pass
-
-    try:
-        from mtu.converters import geoparquet  # noqa: F401
-    except ImportError:
-        pass
-
-    try:
-        from mtu.converters import gpx  # noqa: F401
-    except ImportError:
-        pass
-
-
-# Register built-in converters on module load
-_register_builtin_converters()
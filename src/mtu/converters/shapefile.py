@@ -2,14 +2,24 @@
 Shapefile converter using pyshp or fiona.
 """
 
-import tempfile
+import gc
+import io
 import zipfile
+from collections.abc import Iterator
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
-from mtu.converters.base import BaseConverter, ConversionResult
+from mtu._json import dumps, round_coordinates
+from mtu.converters.base import BaseConverter, ConversionResult, iter_encoded_parallel
 from mtu.converters.registry import register_converter
 
+# Files with fewer features than this are encoded in the calling process
+PARALLEL_MIN_FEATURES = 50_000
+
+# Number of features encoded by each worker process task
+WORKER_CHUNK_SIZE = 10_000
+
 
 @register_converter
 class ShapefileConverter(BaseConverter):
@@ -19,6 +29,7 @@ class ShapefileConverter(BaseConverter):
     file_extensions = [".shp", ".zip"]
     mime_types = ["application/x-shapefile", "application/zip"]
     requires_packages = ["shapefile"]  # pyshp
+    supports_geojsonl = True
 
     def convert(
         self,
@@ -37,8 +48,6 @@ class ShapefileConverter(BaseConverter):
         Returns:
             ConversionResult with the GeoJSON data.
         """
-        import shapefile
-
         warnings: list[str] = []
         path = Path(source)
 
@@ -55,30 +64,129 @@ class ShapefileConverter(BaseConverter):
         if not base.with_suffix(".prj").exists():
             warnings.append("Missing .prj file - assuming WGS84 (EPSG:4326)")
 
+        return self._convert_reader(warnings, str(path), encoding=encoding)
+
+    def iter_geojsonl(
+        self,
+        source: str | Path,
+        encoding: str = "utf-8",
+        precision: int | None = None,
+        workers: int | None = None,
+        **options: Any,
+    ) -> tuple[int, Iterator[bytes]]:
+        """
+        Read a Shapefile as line-delimited GeoJSON features.
+
+        When workers are requested, large files are split into ranges of
+        records that worker processes read and encode in parallel; lines are
+        still yielded in file order.
+        Null shapes are skipped.
+
+        Args:
+            source: Path to .shp file. ZIP archives are not supported.
+            encoding: Character encoding for DBF file.
+            precision: Round coordinates to this many decimal places.
+            workers: Number of worker processes. Defaults to encoding in this
+                process.
+            **options: Not used.
+
+        Returns:
+            Tuple of (feature count, encoded features).
+        """
+        import shapefile
+
+        path = Path(source)
+        if path.suffix.lower() == ".zip":
+            raise ValueError("Zipped shapefiles can't be read as line-delimited GeoJSON")
+        self.validate_source(source)
+
         try:
             with shapefile.Reader(str(path), encoding=encoding) as sf:
+                count = len(sf)
+        except shapefile.ShapefileException as e:
+            raise ValueError(f"Invalid shapefile: {e}")
+
+        if not workers or workers == 1 or count < PARALLEL_MIN_FEATURES:
+            return count, _iter_encoded(str(path), encoding, 0, count, precision)
+        encode = partial(_encode_features, str(path), encoding, precision=precision)
+        return count, iter_encoded_parallel(encode, count, workers, WORKER_CHUNK_SIZE)
+
+    def _convert_from_zip(
+        self,
+        zip_path: Path | BinaryIO,
+        encoding: str,
+        **options: Any,
+    ) -> ConversionResult:
+        """Convert a shapefile read straight from the members of a ZIP archive."""
+        warnings: list[str] = []
+
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            names = zf.namelist()
+
+            # Find .shp file
+            shp_names = [n for n in names if n.lower().endswith(".shp")]
+            if not shp_names:
+                raise ValueError("No .shp file found in ZIP archive")
+
+            if len(shp_names) > 1:
+                # Try to find one not in __MACOSX
+                shp_names = [n for n in shp_names if "__MACOSX" not in n] or shp_names
+
+            # Companion files, matched case-insensitively like on disk
+            members = {n.lower(): n for n in names}
+            base = shp_names[0][: -len(".shp")].lower()
+            shx_name = members.get(f"{base}.shx")
+            dbf_name = members.get(f"{base}.dbf")
+            if dbf_name is None:
+                warnings.append("Missing .dbf file - attributes may be empty")
+            if f"{base}.prj" not in members:
+                warnings.append("Missing .prj file - assuming WGS84 (EPSG:4326)")
+
+            # Members are read into memory rather than extracted to disk.
+            # pyshp reads them in many small pieces, which is much slower
+            # through a decompressing ZipExtFile than from a buffer.
+            files = {
+                key: io.BytesIO(zf.read(name))
+                for key, name in (("shp", shp_names[0]), ("shx", shx_name), ("dbf", dbf_name))
+                if name is not None
+            }
+
+        return self._convert_reader(warnings, encoding=encoding, **files)
+
+    def _convert_reader(self, warnings: list[str], *args: Any, **kwargs: Any) -> ConversionResult:
+        """Convert the shapefile opened by shapefile.Reader(*args, **kwargs)."""
+        import shapefile
+
+        # pyshp allocates several objects per shape and record, and collections
+        # triggered by them took up to half of the run time. The features
+        # can't contain reference cycles.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with shapefile.Reader(*args, **kwargs) as sf:
                 features = []
                 field_names = [field[0] for field in sf.fields[1:]]  # Skip DeletionFlag
 
-                for shaperec in sf.iterShapeRecords():
-                    geom = shaperec.shape.__geo_interface__
-                    props = dict(zip(field_names, shaperec.record))
-
-                    # Check for null geometry
-                    if geom.get("type") is None:
+                for shape, record in zip(sf.iterShapes(), sf.iterRecords()):
+                    # Check for null geometry, which pyshp can't represent
+                    # as GeoJSON
+                    if shape.shapeType == shapefile.NULL:
                         warnings.append("Feature with null geometry skipped")
                         continue
 
                     features.append(
                         {
                             "type": "Feature",
-                            "geometry": geom,
-                            "properties": props,
+                            "geometry": shape.__geo_interface__,
+                            "properties": dict(zip(field_names, record)),
                         }
                     )
 
         except shapefile.ShapefileException as e:
             raise ValueError(f"Invalid shapefile: {e}")
+        finally:
+            if gc_enabled:
+                gc.enable()
 
         geojson = {"type": "FeatureCollection", "features": features}
 
@@ -89,43 +197,14 @@ class ShapefileConverter(BaseConverter):
             warnings=warnings,
         )
 
-    def _convert_from_zip(
-        self,
-        zip_path: Path,
-        encoding: str,
-        **options: Any,
-    ) -> ConversionResult:
-        """Extract and convert shapefile from ZIP."""
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                zf.extractall(tmpdir)
-
-            # Find .shp file
-            shp_files = list(Path(tmpdir).rglob("*.shp"))
-            if not shp_files:
-                raise ValueError("No .shp file found in ZIP archive")
-
-            if len(shp_files) > 1:
-                # Try to find one not in __MACOSX
-                shp_files = [f for f in shp_files if "__MACOSX" not in str(f)]
-
-            return self.convert(shp_files[0], encoding=encoding, **options)
-
     def convert_from_bytes(
         self,
         data: bytes,
         **options: Any,
     ) -> ConversionResult:
         """Convert shapefile from bytes (must be ZIP)."""
-        with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as f:
-            f.write(data)
-            temp_path = Path(f.name)
-
-        try:
-            return self.convert(temp_path, **options)
-        finally:
-            temp_path.unlink(missing_ok=True)
+        encoding = options.pop("encoding", "utf-8")
+        return self._convert_from_zip(io.BytesIO(data), encoding, **options)
 
     @classmethod
     def can_handle(cls, file_path: str | Path) -> bool:
@@ -146,3 +225,36 @@ class ShapefileConverter(BaseConverter):
                 return False
 
         return False
+
+
+def _iter_encoded(
+    path: str, encoding: str, start: int, stop: int, precision: int | None
+) -> Iterator[bytes]:
+    """Encode the features in a range of records of a Shapefile."""
+    import shapefile
+
+    with shapefile.Reader(path, encoding=encoding) as sf:
+        field_names = [field[0] for field in sf.fields[1:]]  # Skip DeletionFlag
+        if start == 0 and stop == len(sf):
+            shapes = sf.iterShapes()
+        else:
+            shapes = (sf.shape(i) for i in range(start, stop))
+
+        for shape, record in zip(shapes, sf.iterRecords(start=start, stop=stop)):
+            if shape.shapeType == shapefile.NULL:
+                continue
+            feat: dict[str, Any] = {
+                "type": "Feature",
+                "geometry": shape.__geo_interface__,
+                "properties": dict(zip(field_names, record)),
+            }
+            if precision is not None:
+                feat = round_coordinates(feat, precision)
+            yield dumps(feat)
+
+
+def _encode_features(
+    path: str, encoding: str, start: int, stop: int, precision: int | None
+) -> list[bytes]:
+    """Encode a range of features in a worker process."""
+    return list(_iter_encoded(path, encoding, start, stop, precision))
@@ -2,13 +2,19 @@
 TopoJSON to GeoJSON converter.
 """
 
-import json
+import gc
+from collections.abc import Callable, Iterator
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, ClassVar
 
+from mtu._json import dumps, load, loads, round_coordinates
 from mtu.converters.base import BaseConverter, ConversionResult
 from mtu.converters.registry import register_converter
 
+# Quantization as (scale x, scale y, translate x, translate y)
+Transform = tuple[float, float, float, float]
+
 
 @register_converter
 class TopoJSONConverter(BaseConverter):
@@ -18,10 +24,12 @@ class TopoJSONConverter(BaseConverter):
     file_extensions = [".topojson"]
     mime_types = ["application/topojson+json"]
     requires_packages: list[str] = []  # Built-in
+    supports_streams = True
+    supports_geojsonl = True
 
     def convert(
         self,
-        source: str | Path | dict[str, Any],
+        source: str | Path | dict[str, Any] | BinaryIO,
         object_name: str | None = None,
         **options: Any,
     ) -> ConversionResult:
@@ -29,7 +37,7 @@ class TopoJSONConverter(BaseConverter):
         Convert TopoJSON to GeoJSON.
 
         Args:
-            source: File path or TopoJSON dictionary.
+            source: File path, binary file object or TopoJSON dictionary.
             object_name: Name of the object to convert. If None, converts the first.
             **options: Additional options.
 
@@ -41,10 +49,74 @@ class TopoJSONConverter(BaseConverter):
         if isinstance(source, dict):
             topojson = source
         else:
-            self.validate_source(source)
-            with open(source, encoding="utf-8") as f:
-                topojson = json.load(f)
+            if not hasattr(source, "read"):
+                self.validate_source(source)
+            topojson = load(source)
+
+        object_name, obj = self._select_object(topojson, object_name, warnings)
+        # Decoded features can't contain reference cycles, and collections
+        # triggered by building millions of small objects dominate the run time
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            features = list(
+                self._iter_features(topojson.get("arcs", []), topojson.get("transform"), obj)
+            )
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+        geojson = {"type": "FeatureCollection", "features": features}
+
+        return ConversionResult(
+            geojson=geojson,
+            source_format="TopoJSON",
+            feature_count=len(features),
+            warnings=warnings,
+            metadata={"source_object": object_name},
+        )
+
+    def iter_geojsonl(
+        self,
+        source: str | Path,
+        object_name: str | None = None,
+        precision: int | None = None,
+        **options: Any,
+    ) -> tuple[int, Iterator[bytes]]:
+        """
+        Read TopoJSON as line-delimited GeoJSON features.
+
+        Features are decoded and encoded one at a time, so only the topology
+        itself is held in memory rather than a full FeatureCollection.
+
+        Args:
+            source: Path to the TopoJSON file.
+            object_name: Name of the object to convert. If None, converts the first.
+            precision: Round coordinates to this many decimal places.
+            **options: Not used.
 
+        Returns:
+            Tuple of (feature count, encoded features).
+        """
+        self.validate_source(source)
+        topojson = load(source)
+        _, obj = self._select_object(topojson, object_name, [])
+
+        # The topology was loaded here, so the encoded arcs can be dropped as
+        # soon as they are decoded instead of living as long as the stream
+        arcs = topojson.pop("arcs", [])
+        features = self._iter_features(arcs, topojson.get("transform"), obj, compact=True)
+        if precision is not None:
+            features = (round_coordinates(f, precision) for f in features)
+        return len(obj.get("geometries", [obj])), map(dumps, features)
+
+    def _select_object(
+        self,
+        topojson: dict[str, Any],
+        object_name: str | None,
+        warnings: list[str],
+    ) -> tuple[str, dict[str, Any]]:
+        """Check a topology and return the name and contents of the object to convert."""
         if topojson.get("type") != "Topology":
             raise ValueError("Input is not a valid TopoJSON (missing 'Topology' type)")
 
@@ -52,45 +124,52 @@ class TopoJSONConverter(BaseConverter):
         if not objects:
             raise ValueError("TopoJSON contains no objects")
 
-        # Get the object to convert
         if object_name:
             if object_name not in objects:
                 raise ValueError(f"Object '{object_name}' not found in TopoJSON")
-            obj = objects[object_name]
-        else:
-            object_name = next(iter(objects))
-            if len(objects) > 1:
-                warnings.append(
-                    f"Multiple objects found, using '{object_name}'. "
-                    f"Available: {', '.join(objects.keys())}"
-                )
-            obj = objects[object_name]
+            return object_name, objects[object_name]
+
+        object_name = next(iter(objects))
+        if len(objects) > 1:
+            warnings.append(
+                f"Multiple objects found, using '{object_name}'. "
+                f"Available: {', '.join(objects.keys())}"
+            )
+        return object_name, objects[object_name]
 
-        arcs = topojson.get("arcs", [])
-        transform = topojson.get("transform")
+    def _iter_features(
+        self,
+        arcs: list[list[list[int]]],
+        transform: dict[str, Any] | None,
+        obj: dict[str, Any],
+        compact: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Decode the geometries of a TopoJSON object to GeoJSON features.
 
-        features = []
-        geometries = obj.get("geometries", [obj])
+        With ``compact``, decoded arcs are held as arrays while features are
+        produced, see _decode_all_arcs(). Otherwise they are lists whose
+        positions are shared by the features, which is faster when all
+        features are kept anyway.
+        """
+        parsed_transform = self._read_transform(transform)
+        # Arcs are shared between geometries, decode each of them only once
+        if compact:
+            decoded_arcs = self._decode_all_arcs(arcs, parsed_transform)
+        else:
+            decoded_arcs = [self._decode_arc(arc, parsed_transform) for arc in arcs]
+        del arcs
 
-        for geometry in geometries:
+        decode_geometry = self._decode_geometry
+        for geometry in obj.get("geometries", [obj]):
             feature: dict[str, Any] = {
                 "type": "Feature",
                 "properties": geometry.get("properties", {}),
-                "geometry": self._decode_geometry(geometry, arcs, transform),
+                "geometry": decode_geometry(geometry, decoded_arcs, parsed_transform),
             }
             if "id" in geometry:
                 feature["id"] = geometry["id"]
-            features.append(feature)
-
-        geojson = {"type": "FeatureCollection", "features": features}
-
-        return ConversionResult(
-            geojson=geojson,
-            source_format="TopoJSON",
-            feature_count=len(features),
-            warnings=warnings,
-            metadata={"source_object": object_name},
-        )
+            yield feature
 
     def convert_from_bytes(
         self,
@@ -98,122 +177,215 @@ class TopoJSONConverter(BaseConverter):
         **options: Any,
     ) -> ConversionResult:
         """Convert TopoJSON from bytes."""
-        topojson = json.loads(data.decode("utf-8"))
+        topojson = loads(data)
         return self.convert(topojson, **options)
 
     def _decode_geometry(
         self,
         geometry: dict[str, Any],
-        arcs: list[list[list[int]]],
-        transform: dict[str, Any] | None,
+        arcs: list[Any],
+        transform: Transform,
     ) -> dict[str, Any] | None:
         """Decode a TopoJSON geometry to GeoJSON geometry."""
         geom_type = geometry.get("type")
 
+        decoder = self._GEOMETRY_DECODERS.get(geom_type)
+        if decoder is not None:
+            return decoder(self, geometry, arcs, transform)
+
         if geom_type is None or geom_type == "null":
             return None
 
-        if geom_type == "Point":
-            coords = geometry.get("coordinates", [])
-            return {"type": "Point", "coordinates": self._transform_point(coords, transform)}
-
-        if geom_type == "MultiPoint":
-            coords = geometry.get("coordinates", [])
-            return {
-                "type": "MultiPoint",
-                "coordinates": [self._transform_point(c, transform) for c in coords],
-            }
-
-        if geom_type == "LineString":
-            arc_indices = geometry.get("arcs", [])
-            return {
-                "type": "LineString",
-                "coordinates": self._decode_arcs(arc_indices, arcs, transform),
-            }
-
-        if geom_type == "MultiLineString":
-            arc_groups = geometry.get("arcs", [])
-            return {
-                "type": "MultiLineString",
-                "coordinates": [self._decode_arcs(ag, arcs, transform) for ag in arc_groups],
-            }
-
-        if geom_type == "Polygon":
-            arc_groups = geometry.get("arcs", [])
-            return {
-                "type": "Polygon",
-                "coordinates": [self._decode_arcs(ring, arcs, transform) for ring in arc_groups],
-            }
-
-        if geom_type == "MultiPolygon":
-            polygon_groups = geometry.get("arcs", [])
-            return {
-                "type": "MultiPolygon",
-                "coordinates": [
-                    [self._decode_arcs(ring, arcs, transform) for ring in polygon]
-                    for polygon in polygon_groups
-                ],
-            }
-
-        if geom_type == "GeometryCollection":
-            geometries = geometry.get("geometries", [])
-            return {
-                "type": "GeometryCollection",
-                "geometries": [self._decode_geometry(g, arcs, transform) for g in geometries],
-            }
-
         raise ValueError(f"Unknown geometry type: {geom_type}")
 
+    def _decode_point(
+        self, geometry: dict[str, Any], arcs: list[Any], transform: Transform
+    ) -> dict[str, Any]:
+        """Decode a Point."""
+        coords = geometry.get("coordinates", [])
+        return {"type": "Point", "coordinates": self._transform_point(coords, transform)}
+
+    def _decode_multi_point(
+        self, geometry: dict[str, Any], arcs: list[Any], transform: Transform
+    ) -> dict[str, Any]:
+        """Decode a MultiPoint."""
+        coords = geometry.get("coordinates", [])
+        return {
+            "type": "MultiPoint",
+            "coordinates": [self._transform_point(c, transform) for c in coords],
+        }
+
+    def _decode_line_string(
+        self, geometry: dict[str, Any], arcs: list[Any], transform: Transform
+    ) -> dict[str, Any]:
+        """Decode a LineString."""
+        arc_indices = geometry.get("arcs", [])
+        return {"type": "LineString", "coordinates": self._decode_arcs(arc_indices, arcs)}
+
+    def _decode_rings(
+        self, geometry: dict[str, Any], arcs: list[Any], transform: Transform
+    ) -> dict[str, Any]:
+        """Decode a MultiLineString or Polygon."""
+        arc_groups = geometry.get("arcs", [])
+        return {
+            "type": geometry["type"],
+            "coordinates": [self._decode_arcs(ag, arcs) for ag in arc_groups],
+        }
+
+    def _decode_multi_polygon(
+        self, geometry: dict[str, Any], arcs: list[Any], transform: Transform
+    ) -> dict[str, Any]:
+        """Decode a MultiPolygon."""
+        polygon_groups = geometry.get("arcs", [])
+        return {
+            "type": "MultiPolygon",
+            "coordinates": [
+                [self._decode_arcs(ring, arcs) for ring in polygon] for polygon in polygon_groups
+            ],
+        }
+
+    def _decode_geometry_collection(
+        self, geometry: dict[str, Any], arcs: list[Any], transform: Transform
+    ) -> dict[str, Any]:
+        """Decode a GeometryCollection."""
+        geometries = geometry.get("geometries", [])
+        return {
+            "type": "GeometryCollection",
+            "geometries": [self._decode_geometry(g, arcs, transform) for g in geometries],
+        }
+
+    # Decoder for each geometry type
+    _GEOMETRY_DECODERS: ClassVar[dict[Any, Callable[..., dict[str, Any]]]] = {
+        "Point": _decode_point,
+        "MultiPoint": _decode_multi_point,
+        "LineString": _decode_line_string,
+        "MultiLineString": _decode_rings,
+        "Polygon": _decode_rings,
+        "MultiPolygon": _decode_multi_polygon,
+        "GeometryCollection": _decode_geometry_collection,
+    }
+
     def _decode_arcs(
         self,
         arc_indices: list[int],
-        arcs: list[list[list[int]]],
-        transform: dict[str, Any] | None,
+        arcs: list[Any],
     ) -> list[list[float]]:
-        """Decode arc indices to coordinates."""
+        """Join decoded arcs into a single coordinate list."""
+        if arcs and not isinstance(arcs[0], list):
+            return self._join_arrays(arc_indices, arcs)
+
         coordinates: list[list[float]] = []
 
         for arc_index in arc_indices:
+            # Consecutive arcs share their end and start positions
+            start = 1 if coordinates else 0
             if arc_index < 0:
-                arc = list(reversed(arcs[~arc_index]))
+                # Reverse and drop the shared position in a single slice
+                coordinates += arcs[~arc_index][-1 - start :: -1]
+            elif start:
+                coordinates += arcs[arc_index][1:]
             else:
-                arc = arcs[arc_index]
-
-            decoded_arc = self._decode_arc(arc, transform)
-            start = 0 if not coordinates else 1
-            coordinates.extend(decoded_arc[start:])
+                coordinates += arcs[arc_index]
 
         return coordinates
 
+    def _join_arrays(self, arc_indices: list[int], arcs: list[Any]) -> list[list[float]]:
+        """Join arcs decoded to arrays, see _decode_all_arcs()."""
+        import numpy as np
+
+        pieces = []
+        started = False
+
+        for arc_index in arc_indices:
+            # Reversed and sliced arrays are views, nothing is copied until
+            # the pieces are concatenated
+            arc = arcs[arc_index] if arc_index >= 0 else arcs[~arc_index][::-1]
+            pieces.append(arc[1:] if started else arc)
+            started = started or len(arc) > 0
+
+        if not pieces:
+            return []
+        return np.concatenate(pieces).tolist()
+
+    def _decode_all_arcs(
+        self,
+        arcs: list[list[list[int]]],
+        transform: Transform,
+    ) -> list[Any]:
+        """
+        Decode every arc of a topology to compact arrays.
+
+        Quantized arcs are decoded with NumPy when it is installed and kept
+        as (n, 2) arrays, which take a fraction of the memory of nested lists
+        and give the garbage collector far fewer objects to scan while
+        features are streamed. Otherwise, or if positions aren't integer x/y
+        pairs, arcs are decoded to lists.
+        """
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover - optional speedup
+            return [self._decode_arc(arc, transform) for arc in arcs]
+
+        try:
+            points = np.array(list(chain.from_iterable(arcs)))
+        except (OverflowError, TypeError, ValueError):
+            points = None
+        if (
+            points is None
+            or points.ndim != 2
+            or points.shape[1] != 2
+            or points.dtype.kind not in "iu"
+        ):
+            return [self._decode_arc(arc, transform) for arc in arcs]
+
+        # One cumulative sum over all arcs, minus the running total at the
+        # start of each arc so that every arc restarts from zero
+        lengths = np.fromiter(map(len, arcs), dtype=np.intp, count=len(arcs))
+        ends = lengths.cumsum()
+        positions = points.astype(np.int64).cumsum(axis=0)
+        offsets = np.zeros((len(arcs), 2), dtype=np.int64)
+        nonempty = ends[:-1] > 0
+        offsets[1:][nonempty] = positions[ends[:-1][nonempty] - 1]
+        positions -= np.repeat(offsets, lengths, axis=0)
+
+        scale_x, scale_y, translate_x, translate_y = transform
+        coordinates = positions * np.array([scale_x, scale_y]) + np.array(
+            [translate_x, translate_y]
+        )
+        starts = (ends - lengths).tolist()
+        return [coordinates[start:end] for start, end in zip(starts, ends.tolist())]
+
     def _decode_arc(
         self,
         arc: list[list[int]],
-        transform: dict[str, Any] | None,
+        transform: Transform,
     ) -> list[list[float]]:
-        """Decode a single arc with delta encoding and optional transform."""
+        """Decode a single arc with delta encoding and transform."""
+        scale_x, scale_y, translate_x, translate_y = transform
         coordinates: list[list[float]] = []
+        append = coordinates.append
         x, y = 0, 0
 
         for point in arc:
             x += point[0]
             y += point[1]
-            coordinates.append(self._transform_point([x, y], transform))
+            append([x * scale_x + translate_x, y * scale_y + translate_y])
 
         return coordinates
 
     def _transform_point(
         self,
         point: list[int | float],
-        transform: dict[str, Any] | None,
+        transform: Transform,
     ) -> list[float]:
         """Apply transform to a point."""
-        if transform is None:
-            return [float(point[0]), float(point[1])]
+        scale_x, scale_y, translate_x, translate_y = transform
+        return [point[0] * scale_x + translate_x, point[1] * scale_y + translate_y]
 
-        scale = transform.get("scale", [1, 1])
-        translate = transform.get("translate", [0, 0])
-
-        return [
-            point[0] * scale[0] + translate[0],
-            point[1] * scale[1] + translate[1],
-        ]
+    def _read_transform(self, transform: dict[str, Any] | None) -> Transform:
+        """Read the scale and translate of a topology, or an identity transform."""
+        if transform is None:
+            return 1.0, 1.0, 0.0, 0.0
+        scale_x, scale_y = transform.get("scale", [1, 1])
+        translate_x, translate_y = transform.get("translate", [0, 0])
+        return scale_x, scale_y, translate_x, translate_y
@@ -2,21 +2,55 @@
 Core uploader module for Mapbox Tileset operations.
 """
 
-import json
+import gzip
+import io
+import itertools
+import math
 import os
-import subprocess
+import random
+import re
+import shutil
 import tempfile
+import threading
 import time
+import uuid
+import weakref
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder
 
+from mtu._json import JSONDecodeError, dumps, loads, round_coordinates
 from mtu.converters import get_converter, get_supported_formats
-from mtu.converters.base import ConversionResult
+from mtu.converters.base import BaseConverter, ConversionResult
 from mtu.validators import GeometryValidator, ValidationResult
 
+# Mapbox allows at most this many files per tileset source
+MAX_SOURCE_FILES = 10
+
+# Number of retries for a failed source file upload
+UPLOAD_RETRIES = 3
+
+# Number of lines joined into each write to a source file
+WRITE_BATCH_SIZE = 1000
+
+# Bytes read from the response per write when downloading a source
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Connections kept alive per host, enough for four uploads at full concurrency
+HTTP_POOL_SIZE = 4 * MAX_SOURCE_FILES
+
+# File extensions recognized in source URLs; anything else is read as GeoJSON
+_URL_EXTENSION = re.compile(
+    r"\.(topojson|geojson[ls]|ndjson|shp|zip|gpkg|kml|kmz|fgb|parquet|gpx)$", re.IGNORECASE
+)
+
 
 @dataclass
 class TilesetConfig:
@@ -59,11 +93,12 @@ class TilesetUploader:
     """
     Upload GeoJSON and other GIS formats to Mapbox as vector tilesets.
 
-    This class wraps the mapbox-tilesets CLI to provide a Python interface
+    This class wraps the Mapbox Tilesets API to provide a Python interface
     for uploading geographic data to Mapbox Tiling Service (MTS).
 
     Supports multiple input formats through the modular converter system:
     - GeoJSON (.geojson, .json)
+    - GeoJSONSeq (.geojsonl, .geojsons, .ndjson)
     - TopoJSON (.topojson)
     - Shapefile (.shp, .zip)
     - GeoPackage (.gpkg)
@@ -78,6 +113,9 @@ class TilesetUploader:
         access_token: str | None = None,
         username: str | None = None,
         validate_geometry: bool = True,
+        upload_concurrency: int = 1,
+        compress: bool = False,
+        precision: int | None = None,
     ) -> None:
         """
         Initialize the uploader.
@@ -86,10 +124,19 @@ class TilesetUploader:
             access_token: Mapbox access token. If not provided, uses MAPBOX_ACCESS_TOKEN env var.
             username: Mapbox username. If not provided, uses MAPBOX_USERNAME env var.
             validate_geometry: Whether to validate geometries and warn about issues.
+            upload_concurrency: Number of source files to split the data into and
+                upload in parallel (1-10).
+            compress: Gzip source files before uploading them.
+            precision: Round uploaded coordinates to this many decimal places
+                (None keeps full precision).
         """
         self.access_token = access_token or os.environ.get("MAPBOX_ACCESS_TOKEN")
         self.username = username or os.environ.get("MAPBOX_USERNAME")
         self.validate_geometry = validate_geometry
+        self.upload_concurrency = max(1, min(upload_concurrency, MAX_SOURCE_FILES))
+        self.compress = compress
+        self.precision = precision
+        self.api_url = os.environ.get("MAPBOX_API", "https://api.mapbox.com")
 
         if not self.access_token:
             raise ValueError(
@@ -102,12 +149,51 @@ class TilesetUploader:
                 "Set MAPBOX_USERNAME environment variable or pass username parameter."
             )
 
-        # Set environment variable for tilesets CLI
-        os.environ["MAPBOX_ACCESS_TOKEN"] = self.access_token
+        # Shared HTTP session so downloads and API requests reuse connections.
+        # The pool is sized for upload_many, whose uploads each send up to
+        # upload_concurrency files at once; connections beyond it would be
+        # dropped after use instead of kept alive.
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_maxsize=HTTP_POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # Tilesets known to exist, so repeated uploads skip the lookup
+        self._existing_tilesets: set[str] = set()
+
+        # Temporary directory for downloads, shared by all uploads from URLs
+        self._work_dir: Path | None = None
+        self._work_dir_cleanup: weakref.finalize | None = None
+        self._work_dir_lock = threading.Lock()
 
         # Initialize validator
         self._validator = GeometryValidator() if validate_geometry else None
 
+    def __enter__(self) -> "TilesetUploader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the HTTP session and remove the download directory."""
+        self.session.close()
+        with self._work_dir_lock:
+            if self._work_dir_cleanup is not None:
+                self._work_dir_cleanup()
+                self._work_dir = self._work_dir_cleanup = None
+
+    def _download_dir(self) -> Path:
+        """Return the temporary download directory, creating it on first use."""
+        with self._work_dir_lock:
+            if self._work_dir is None:
+                self._work_dir = Path(tempfile.mkdtemp(prefix="mtu-"))
+                # Also removed if the uploader is never closed
+                self._work_dir_cleanup = weakref.finalize(
+                    self, shutil.rmtree, self._work_dir, ignore_errors=True
+                )
+            return self._work_dir
+
     def upload_from_url(
         self,
         url: str,
@@ -115,6 +201,7 @@ class TilesetUploader:
         format_hint: str | None = None,
         work_dir: str | None = None,
         dry_run: bool = False,
+        stream: bool = False,
     ) -> UploadResult:
         """
         Download data from URL and upload to Mapbox.
@@ -125,22 +212,31 @@ class TilesetUploader:
             format_hint: Explicit format name (auto-detected if not provided).
             work_dir: Working directory for temporary files.
             dry_run: If True, validate but don't upload.
+            stream: If True, formats that can be read from a stream (GeoJSON,
+                TopoJSON) are converted straight from the HTTP response instead
+                of being downloaded to ``work_dir`` first.
 
         Returns:
             UploadResult with upload details.
         """
-        work_path = Path(work_dir) if work_dir else Path(tempfile.mkdtemp())
-        work_path.mkdir(parents=True, exist_ok=True)
-
-        # Determine file type from URL
-        url_lower = url.lower()
-        ext = ".geojson"
-        for fmt_ext in [".topojson", ".shp", ".gpkg", ".kml", ".kmz", ".fgb", ".parquet", ".gpx"]:
-            if fmt_ext in url_lower:
-                ext = fmt_ext
-                break
-
-        download_path = work_path / f"source{ext}"
+        ext = _url_extension(url)
+
+        # Feed the response body straight into converters that can read streams
+        if stream and self._can_stream(format_hint, f"source{ext}"):
+            with self.session.get(url, stream=True, timeout=300) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                return self._upload(
+                    response.raw, Path(f"source{ext}"), config, format_hint, dry_run
+                )
+
+        if work_dir:
+            work_path = Path(work_dir)
+            work_path.mkdir(parents=True, exist_ok=True)
+            download_path = work_path / f"source{ext}"
+        else:
+            # Downloads share the uploader's directory under unique names
+            download_path = self._download_dir() / f"{uuid.uuid4().hex}{ext}"
 
         try:
             # Download the file
@@ -155,11 +251,9 @@ class TilesetUploader:
             )
 
         finally:
-            # Clean up if using temp directory
+            # Clean up if using the temp directory
             if not work_dir:
-                import shutil
-
-                shutil.rmtree(work_path, ignore_errors=True)
+                download_path.unlink(missing_ok=True)
 
     def upload_from_file(
         self,
@@ -181,6 +275,88 @@ class TilesetUploader:
             UploadResult with upload details.
         """
         file_path = Path(file_path)
+        return self._upload(file_path, file_path, config, format_hint, dry_run)
+
+    def upload_many(
+        self,
+        jobs: Iterable[tuple[str | Path, TilesetConfig]],
+        max_workers: int = 4,
+        format_hint: str | None = None,
+        dry_run: bool = False,
+    ) -> list[UploadResult]:
+        """
+        Upload several sources to their tilesets concurrently.
+
+        Most of an upload is spent waiting on downloads, the Mapbox API and
+        the tileset job, so running uploads in threads overlaps those waits.
+
+        Args:
+            jobs: Pairs of (URL or file path, tileset configuration). Strings
+                containing "://" are downloaded, anything else is read from disk.
+            max_workers: Maximum number of uploads running at the same time.
+            format_hint: Explicit format name (auto-detected if not provided).
+            dry_run: If True, validate but don't upload.
+
+        Returns:
+            UploadResult for each job, in the order of ``jobs``.
+        """
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            futures = [
+                executor.submit(self._upload_job, source, config, format_hint, dry_run)
+                for source, config in jobs
+            ]
+            return [future.result() for future in futures]
+
+    def _upload_job(
+        self,
+        source: str | Path,
+        config: TilesetConfig,
+        format_hint: str | None,
+        dry_run: bool,
+    ) -> UploadResult:
+        """Upload a URL or file, reporting download errors in the result."""
+        try:
+            if isinstance(source, str) and "://" in source:
+                return self.upload_from_url(source, config, format_hint, dry_run=dry_run)
+            return self.upload_from_file(source, config, format_hint, dry_run)
+        except Exception as e:
+            return UploadResult(
+                success=False,
+                tileset_id=f"{self.username}.{config.tileset_id}",
+                source_id=config.source_id,
+                error=str(e),
+                dry_run=dry_run,
+            )
+
+    def _can_stream(self, format_hint: str | None, file_name: str) -> bool:
+        """Check whether the converter for a source can read from a stream."""
+        try:
+            converter = get_converter(format_name=format_hint, file_path=file_name)
+        except (ValueError, ImportError):
+            return False
+        return converter.supports_streams
+
+    def _upload(
+        self,
+        source: Path | BinaryIO,
+        file_path: Path,
+        config: TilesetConfig,
+        format_hint: str | None,
+        dry_run: bool,
+    ) -> UploadResult:
+        """
+        Convert, validate and upload a source.
+
+        Args:
+            source: Path to the file, or a binary stream with its contents.
+            file_path: File path used to detect the format.
+            config: Tileset configuration.
+            format_hint: Explicit format name (auto-detected if not provided).
+            dry_run: If True, validate but don't upload.
+
+        Returns:
+            UploadResult with upload details.
+        """
         result = UploadResult(
             success=False,
             tileset_id=f"{self.username}.{config.tileset_id}",
@@ -192,69 +368,72 @@ class TilesetUploader:
             # Get converter for the file format
             converter = get_converter(format_name=format_hint, file_path=file_path)
 
-            # Convert to GeoJSON
-            conversion = converter.convert(file_path)
-            result.conversion_result = conversion
-            result.warnings.extend(conversion.warnings)
-            result.steps["convert"] = True
-
-            geojson = conversion.geojson
-
-            # Validate geometry
-            if self._validator:
-                validation = self._validator.validate(geojson)
-                result.validation_result = validation
-                result.steps["validate"] = True
-
-                # Add validation warnings to result
-                for warning in validation.warnings:
-                    if warning.severity in ("warning", "error"):
-                        result.warnings.append(f"[{warning.warning_type}] {warning.message}")
-
-            if dry_run:
-                result.success = True
-                return result
-
-            # Write GeoJSON to temp file for upload
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                suffix=".geojson",
-                delete=False,
-                encoding="utf-8",
-            ) as f:
-                json.dump(geojson, f)
-                geojson_path = Path(f.name)
-
-            try:
-                # Upload source
-                self._upload_source(geojson_path, config.source_id)
+            # Without validation or a dry run nothing needs the whole
+            # FeatureCollection, so formats that can go straight to
+            # line-delimited GeoJSON skip building it
+            geojsonl = None
+            if not self._validator and not dry_run:
+                geojsonl = self._convert_to_geojsonl(converter, source)
+
+            if geojsonl is not None:
+                feature_count, feature_lines = geojsonl
+                result.steps["convert"] = True
+            else:
+                # Convert to GeoJSON
+                conversion = converter.convert(source)
+                result.conversion_result = conversion
+                result.warnings.extend(conversion.warnings)
+                result.steps["convert"] = True
+
+                geojson = conversion.geojson
+
+                # Validate geometry
+                if self._validator:
+                    validation = self._validator.validate(geojson)
+                    result.validation_result = validation
+                    result.steps["validate"] = True
+
+                    # Add validation warnings to result
+                    for warning in validation.warnings:
+                        if warning.severity in ("warning", "error"):
+                            result.warnings.append(f"[{warning.warning_type}] {warning.message}")
+
+                if dry_run:
+                    result.success = True
+                    return result
+
+                feature_count, feature_lines = self._geojson_lines(geojson)
+
+            # Write the line-delimited parts and upload them to the source
+            with tempfile.TemporaryDirectory() as source_dir:
+                source_files = self._iter_source_files(
+                    feature_lines, feature_count, self.upload_concurrency, Path(source_dir)
+                )
+                self._upload_source(source_files, config.source_id)
                 result.steps["upload_source"] = True
 
-                # Create or update tileset
-                full_tileset_id = f"{self.username}.{config.tileset_id}"
-                recipe = self._build_recipe(config)
-
-                if self._tileset_exists(full_tileset_id):
-                    self._update_recipe(full_tileset_id, recipe)
-                    result.steps["update_recipe"] = True
-                else:
-                    self._create_tileset(full_tileset_id, recipe, config)
-                    result.steps["create_tileset"] = True
+            # Create or update tileset
+            full_tileset_id = f"{self.username}.{config.tileset_id}"
+            recipe = self._build_recipe(config)
 
-                # Publish tileset
-                job_id = self._publish_tileset(full_tileset_id)
-                result.steps["publish"] = True
-                result.job_id = job_id
+            if self._tileset_exists(full_tileset_id):
+                self._update_recipe(full_tileset_id, recipe)
+                result.steps["update_recipe"] = True
+            else:
+                self._create_tileset(full_tileset_id, recipe, config)
+                result.steps["create_tileset"] = True
 
-                # Wait for completion
-                status = self._wait_for_job(full_tileset_id, job_id)
-                result.steps["job_complete"] = True
-                result.job_status = status
+            # Publish tileset
+            job_id = self._publish_tileset(full_tileset_id)
+            result.steps["publish"] = True
+            result.job_id = job_id
 
-                result.success = status == "success"
+            # Wait for completion
+            status = self._wait_for_job(full_tileset_id, job_id)
+            result.steps["job_complete"] = True
+            result.job_status = status
 
-            finally:
-                geojson_path.unlink(missing_ok=True)
+            result.success = status == "success"
 
         except Exception as e:
             result.error = str(e)
@@ -263,42 +442,158 @@ class TilesetUploader:
 
     def _download_file(self, url: str, dest_path: Path) -> None:
         """Download a file from URL."""
-        response = requests.get(url, stream=True, timeout=300)
-        response.raise_for_status()
+        with self.session.get(url, stream=True, timeout=300) as response:
+            response.raise_for_status()
+
+            with open(dest_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+
+    def _convert_to_geojsonl(
+        self, converter: BaseConverter, source: Path | BinaryIO
+    ) -> tuple[int, Iterator[bytes]] | None:
+        """Read a source as line-delimited GeoJSON, or return None if unsupported."""
+        if not converter.supports_geojsonl or hasattr(source, "read"):
+            return None
+        try:
+            return converter.iter_geojsonl(source, precision=self.precision)
+        except ValueError:
+            return None
+
+    def _geojson_lines(self, geojson: dict[str, Any]) -> tuple[int, Iterator[bytes]]:
+        """Encode GeoJSON as line-delimited features, returning (count, lines)."""
+        features = geojson.get("features")
+        if geojson.get("type") != "FeatureCollection" or not isinstance(features, list):
+            features = [geojson]
+        if self.precision is not None:
+            precision = self.precision
+            return len(features), (dumps(round_coordinates(f, precision)) for f in features)
+        return len(features), map(dumps, features)
+
+    def _iter_source_files(
+        self, lines: Iterable[bytes], count: int, parts: int, directory: Path
+    ) -> Iterator[Path]:
+        """
+        Write line-delimited GeoJSON split across up to ``parts`` files.
 
-        with open(dest_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+        ``count`` is the expected number of lines. Lines are split into
+        contiguous runs so each file can be uploaded to the tileset source
+        independently. Each path is yielded once its file is complete.
+        Files are gzipped at the fastest level when ``compress`` is set.
+        """
+        parts = max(1, min(parts, count))
+        size = math.ceil(count / parts) if count else 0
+        lines = iter(lines)
+
+        for part in range(parts):
+            written = 0
+            if self.compress:
+                path = directory / f"part-{part}.geojsonl.gz"
+                f: io.BufferedIOBase = gzip.open(path, "wb", compresslevel=1)
+            else:
+                path = directory / f"part-{part}.geojsonl"
+                f = open(path, "wb")
+            with f:
+                # The last part takes whatever is left
+                part_lines = lines if part == parts - 1 else itertools.islice(lines, size)
+                # Write lines in batches, gzip compresses each write separately
+                while batch := list(itertools.islice(part_lines, WRITE_BATCH_SIZE)):
+                    f.write(b"\n".join(batch) + b"\n")
+                    written += len(batch)
+            if part and not written:
+                # Fewer lines than expected, e.g. skipped null geometries
+                break
+            yield path
 
-    def _run_tilesets_command(
-        self,
-        args: list[str],
-        check: bool = True,
-    ) -> subprocess.CompletedProcess[str]:
-        """Run a tilesets CLI command."""
-        cmd = ["tilesets"] + args
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if check and result.returncode != 0:
-            raise RuntimeError(f"Tilesets command failed: {result.stderr}")
-        return result
+    def _upload_source(self, file_paths: Iterable[Path], source_id: str | None) -> None:
+        """
+        Upload files to a tileset source.
 
-    def _upload_source(self, file_path: Path, source_id: str | None) -> None:
-        """Upload file to tileset source."""
+        The first file replaces any existing source data; the remaining files
+        are appended in parallel once it has been accepted. All files are
+        written before the first upload starts, so a conversion error part
+        way through leaves the existing source untouched instead of replacing
+        it with only the first parts.
+        """
         if source_id is None:
             raise ValueError("source_id is required for uploading")
-        self._run_tilesets_command(
-            ["upload-source", "--replace", self.username, source_id, str(file_path)]
+
+        paths = list(file_paths)
+        with ThreadPoolExecutor(max_workers=self.upload_concurrency) as executor:
+            futures: list[Future[None]] = []
+            for path in paths:
+                if futures:
+                    future = executor.submit(self._append_source_file, futures[0], path, source_id)
+                else:
+                    future = executor.submit(
+                        self._upload_source_file, path, source_id, replace=True
+                    )
+                futures.append(future)
+
+            for future in futures:
+                future.result()
+
+    def _append_source_file(self, replaced: Future[None], file_path: Path, source_id: str) -> None:
+        """Append a file to a source once the replacing upload has finished."""
+        replaced.result()
+        self._upload_source_file(file_path, source_id, False)
+
+    def _upload_source_file(self, file_path: Path, source_id: str, replace: bool) -> None:
+        """Upload a single line-delimited GeoJSON file, retrying with backoff."""
+        url = f"{self.api_url}/tilesets/v1/sources/{self.username}/{source_id}"
+        method = "PUT" if replace else "POST"
+        error = ""
+
+        for attempt in range(UPLOAD_RETRIES + 1):
+            if attempt:
+                time.sleep(2 ** (attempt - 1))
+
+            try:
+                with open(file_path, "rb") as f:
+                    encoder = MultipartEncoder(fields={"file": (file_path.name, f)})
+                    response = self.session.request(
+                        method,
+                        url,
+                        params={"access_token": self.access_token},
+                        data=encoder,
+                        headers={"Content-Type": encoder.content_type},
+                        timeout=300,
+                    )
+            except requests.ConnectionError as e:
+                error = str(e)
+                continue
+
+            if response.status_code == 200:
+                return
+
+            error = response.text
+            # Only server errors and rate limiting are worth retrying
+            if response.status_code < 500 and response.status_code != 429:
+                break
+
+        raise RuntimeError(f"Source upload failed: {error}")
+
+    def _api_request(self, method: str, path: str, **kwargs: Any) -> requests.Response:
+        """Send a request to the Tilesets API over the shared session."""
+        return self.session.request(
+            method,
+            f"{self.api_url}/tilesets/v1/{path}",
+            params={"access_token": self.access_token},
+            timeout=60,
+            **kwargs,
         )
 
     def _tileset_exists(self, tileset_id: str) -> bool:
         """Check if tileset already exists."""
-        result = self._run_tilesets_command(["status", tileset_id], check=False)
-        return result.returncode == 0
+        # Tilesets don't disappear unless deleted through this uploader, so
+        # only the first check for each one needs a request
+        if tileset_id in self._existing_tilesets:
+            return True
+        response = self._api_request("GET", f"{tileset_id}/status")
+        if response.status_code != 200:
+            return False
+        self._existing_tilesets.add(tileset_id)
+        return True
 
     def _build_recipe(self, config: TilesetConfig) -> dict[str, Any]:
         """Build tileset recipe."""
@@ -323,50 +618,40 @@ class TilesetUploader:
         config: TilesetConfig,
     ) -> None:
         """Create a new tileset."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False, encoding="utf-8"
-        ) as f:
-            json.dump(recipe, f)
-            recipe_path = f.name
-
-        try:
-            args = [
-                "create",
-                tileset_id,
-                "--recipe",
-                recipe_path,
-                "--name",
-                config.tileset_name,
-            ]
-            if config.description:
-                args.extend(["--description", config.description])
-            if config.attribution:
-                args.extend(["--attribution", config.attribution])
-
-            self._run_tilesets_command(args)
-        finally:
-            os.unlink(recipe_path)
+        body: dict[str, Any] = {"recipe": recipe, "name": config.tileset_name}
+        if config.description:
+            body["description"] = config.description
+        if config.attribution:
+            # Attribution is given as JSON, like the tilesets CLI takes it
+            body["attribution"] = loads(config.attribution)
+
+        response = self._api_request(
+            "POST", tileset_id, data=dumps(body), headers={"Content-Type": "application/json"}
+        )
+        if not response.ok:
+            raise RuntimeError(f"Tileset creation failed: {response.text}")
+        self._existing_tilesets.add(tileset_id)
 
     def _update_recipe(self, tileset_id: str, recipe: dict[str, Any]) -> None:
         """Update tileset recipe."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".json", delete=False, encoding="utf-8"
-        ) as f:
-            json.dump(recipe, f)
-            recipe_path = f.name
-
-        try:
-            self._run_tilesets_command(["update-recipe", tileset_id, recipe_path])
-        finally:
-            os.unlink(recipe_path)
+        response = self._api_request(
+            "PATCH",
+            f"{tileset_id}/recipe",
+            data=dumps(recipe),
+            headers={"Content-Type": "application/json"},
+        )
+        if not response.ok:
+            raise RuntimeError(f"Recipe update failed: {response.text}")
 
     def _publish_tileset(self, tileset_id: str) -> str:
         """Publish tileset and return job ID."""
-        result = self._run_tilesets_command(["publish", tileset_id])
+        response = self._api_request("POST", f"{tileset_id}/publish")
+        if response.status_code != 200:
+            raise RuntimeError(f"Tileset publish failed: {response.text}")
         try:
-            output = json.loads(result.stdout)
+            output = loads(response.content)
             return output.get("jobId", "")
-        except json.JSONDecodeError:
+        except JSONDecodeError:
             return ""
 
     def _wait_for_job(
@@ -374,61 +659,95 @@ class TilesetUploader:
         tileset_id: str,
         job_id: str,
         timeout: int = 600,
-        poll_interval: int = 10,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
     ) -> str:
-        """Wait for tileset job to complete."""
+        """
+        Wait for tileset job to complete.
+
+        Polling starts after ``poll_interval`` seconds and backs off by half
+        each time up to ``max_poll_interval``, so short jobs are seen finishing
+        quickly without long jobs sending a request every second. A little
+        jitter keeps concurrent uploads from polling in lockstep.
+        """
+        # Without a job ID, follow the tileset's latest job instead
+        path = f"{tileset_id}/jobs/{job_id}" if job_id else f"{tileset_id}/status"
         start_time = time.time()
+        delay = poll_interval
 
         while time.time() - start_time < timeout:
-            result = self._run_tilesets_command(["status", tileset_id], check=False)
+            try:
+                response = self._api_request("GET", path)
+            except requests.RequestException:
+                response = None
 
-            if result.returncode == 0:
+            if response is not None and response.status_code == 200:
                 try:
-                    status_data = json.loads(result.stdout)
-                    status = status_data.get("status", "unknown")
+                    status_data = loads(response.content)
+                    # Jobs report a stage, the tileset status a status
+                    status = status_data.get("stage") or status_data.get("status", "unknown")
 
                     if status == "success":
                         return "success"
                     elif status in ("failed", "errored"):
-                        return f"failed: {status_data.get('message', 'Unknown error')}"
-                except json.JSONDecodeError:
+                        errors = status_data.get("errors") or [
+                            status_data.get("message", "Unknown error")
+                        ]
+                        return f"failed: {'; '.join(map(str, errors))}"
+                except JSONDecodeError:
                     pass
 
-            time.sleep(poll_interval)
+            wait = delay + random.uniform(0, delay * 0.1)
+            if response is not None and response.status_code == 429:
+                # Rate limited, wait as long as the API asks
+                try:
+                    wait = max(wait, float(response.headers.get("Retry-After", 0)))
+                except ValueError:
+                    pass
+            time.sleep(wait)
+            delay = min(delay * 1.5, max_poll_interval)
 
         return "timeout"
 
+    def _api_list(self, path: str) -> list[dict[str, Any]]:
+        """Get every page of a Tilesets API listing."""
+        items: list[dict[str, Any]] = []
+        url: str | None = f"{self.api_url}/tilesets/v1/{path}"
+        while url:
+            response = self.session.get(url, params={"access_token": self.access_token}, timeout=60)
+            if not response.ok:
+                raise RuntimeError(f"Listing failed: {response.text}")
+            items.extend(loads(response.content))
+            url = response.links.get("next", {}).get("url")
+        return items
+
     def list_sources(self) -> list[dict[str, Any]]:
         """List all tileset sources for the user."""
-        result = self._run_tilesets_command(["list-sources", self.username])
-        try:
-            return json.loads(result.stdout)
-        except json.JSONDecodeError:
-            return []
+        return self._api_list(f"sources/{self.username}")
 
     def list_tilesets(self) -> list[dict[str, Any]]:
         """List all tilesets for the user."""
-        result = self._run_tilesets_command(["list", self.username])
-        try:
-            lines = result.stdout.strip().split("\n")
-            return [json.loads(line) for line in lines if line]
-        except json.JSONDecodeError:
-            return []
+        return self._api_list(str(self.username))
 
     def delete_source(self, source_id: str) -> bool:
         """Delete a tileset source."""
-        result = self._run_tilesets_command(
-            ["delete-source", "--force", self.username, source_id], check=False
-        )
-        return result.returncode == 0
+        response = self._api_request("DELETE", f"sources/{self.username}/{source_id}")
+        return response.ok
 
     def delete_tileset(self, tileset_id: str) -> bool:
         """Delete a tileset."""
         full_id = f"{self.username}.{tileset_id}"
-        result = self._run_tilesets_command(["delete", "--force", full_id], check=False)
-        return result.returncode == 0
+        self._existing_tilesets.discard(full_id)
+        response = self._api_request("DELETE", full_id)
+        return response.ok
 
     @staticmethod
     def get_supported_formats() -> list[dict[str, Any]]:
         """Get list of supported input formats."""
         return get_supported_formats()
+
+
+def _url_extension(url: str) -> str:
+    """Guess the file extension of a source URL from its path, defaulting to GeoJSON."""
+    match = _URL_EXTENSION.search(urlparse(url).path)
+    return "." + match.group(1).lower() if match else ".geojson"
@@ -5,10 +5,14 @@ Provides warnings for geometry issues without modifying the data.
 """
 
 from dataclasses import dataclass, field
+from itertools import chain
 from typing import Any
 
+# Placeholder for the vertex before the first one
+_NO_VERTEX = object()
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationWarning:
     """A single validation warning."""
 
@@ -31,7 +35,7 @@ class ValidationWarning:
     """Additional details about the issue."""
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of geometry validation."""
 
@@ -147,11 +151,13 @@ class GeometryValidator:
         warnings: list[ValidationWarning] = []
         valid_count = 0
         total_count = 0
+        error_found = False
 
         geojson_type = geojson.get("type")
 
         if geojson_type == "FeatureCollection":
             features = geojson.get("features", [])
+            shapely_geoms, in_range, valid = self._prepare_features(features)
             for i, feature in enumerate(features):
                 if len(warnings) >= self.max_warnings:
                     msg = f"Maximum warnings ({self.max_warnings}) reached"
@@ -167,17 +173,23 @@ class GeometryValidator:
                     break
 
                 total_count += 1
-                feature_warnings = self._validate_feature(feature, i)
-                warnings.extend(feature_warnings)
-
-                if not any(w.severity == "error" for w in feature_warnings):
-                    valid_count += 1
+                feature_warnings = self._validate_feature(
+                    feature, i, shapely_geoms[i], in_range[i], valid[i]
+                )
+                # Most features have no warnings, skip scanning them
+                if feature_warnings:
+                    warnings.extend(feature_warnings)
+                    if _has_error(feature_warnings):
+                        error_found = True
+                        continue
+                valid_count += 1
 
         elif geojson_type == "Feature":
             total_count = 1
             feature_warnings = self._validate_feature(geojson, 0)
             warnings.extend(feature_warnings)
-            if not any(w.severity == "error" for w in feature_warnings):
+            error_found = _has_error(feature_warnings)
+            if not error_found:
                 valid_count = 1
 
         elif geojson_type in (
@@ -192,7 +204,8 @@ class GeometryValidator:
             total_count = 1
             geom_warnings = self._validate_geometry(geojson, 0, None)
             warnings.extend(geom_warnings)
-            if not any(w.severity == "error" for w in geom_warnings):
+            error_found = _has_error(geom_warnings)
+            if not error_found:
                 valid_count = 1
 
         else:
@@ -205,18 +218,95 @@ class GeometryValidator:
                     severity="error",
                 )
             )
+            error_found = True
 
         return ValidationResult(
-            valid=len([w for w in warnings if w.severity == "error"]) == 0,
+            valid=not error_found,
             warnings=warnings,
             feature_count=total_count,
             valid_feature_count=valid_count,
         )
 
+    def _prepare_features(self, features: list[Any]) -> tuple[list[Any], list[bool], list[bool]]:
+        """
+        Build shapely geometries and run the vectorized checks for all features.
+
+        The bounds of every geometry are compared against the valid coordinate
+        range in one vectorized pass. Features that lie entirely inside it can
+        skip the per-coordinate checks; the rest are checked coordinate by
+        coordinate as usual. Bounds are only trusted for valid geometries built
+        from all of their coordinates, which excludes NaN coordinates, empty
+        parts and geometries built with shape(). Validity and emptiness are checked the same way,
+        so only geometries that fail get the per-geometry shapely checks that
+        explain why.
+
+        Returns:
+            Tuple of (shapely geometries, in-range flags, valid flags), one
+            entry per feature.
+        """
+        count = len(features)
+        if not (self.check_validity and self._has_shapely):
+            return [None] * count, [False] * count, [False] * count
+
+        import numpy as np
+        import shapely
+
+        geometries: list[Any] = [
+            feature.get("geometry") if isinstance(feature, dict) else None for feature in features
+        ]
+        geoms = np.empty(count, dtype=object)
+
+        # Geometries of one type are built from a single coordinate array,
+        # without encoding them as JSON for the GEOS reader to parse again
+        by_type: dict[str, list[int]] = {}
+        for i, geometry in enumerate(geometries):
+            if isinstance(geometry, dict) and geometry.get("type") in _NESTING_DEPTHS:
+                by_type.setdefault(geometry["type"], []).append(i)
+        for geom_type, indices in by_type.items():
+            try:
+                geoms[indices] = _from_coordinates(
+                    geom_type, [geometries[i].get("coordinates") for i in indices]
+                )
+            except (TypeError, ValueError, shapely.errors.GEOSException):
+                # Malformed coordinates somewhere in the group
+                pass
+
+        built = ~shapely.is_missing(geoms)
+
+        # Anything else, e.g. a GeometryCollection or an unclosed ring, is
+        # built with shape() as before, so it fails the same way
+        for i in np.flatnonzero(~built).tolist():
+            if isinstance(geometries[i], dict):
+                geoms[i] = self._to_shapely(geometries[i])
+
+        # Missing geometries are neither valid nor empty, so they keep the
+        # per-geometry check and its warning
+        valid = shapely.is_valid(geoms) & ~shapely.is_empty(geoms)
+        shapely_geoms = geoms.tolist()
+        if not self.check_coordinates or not count:
+            return shapely_geoms, [False] * count, valid.tolist()
+
+        minx, miny, maxx, maxy = shapely.bounds(geoms).T
+        # shape() may leave out coordinates, e.g. empty GeometryCollection
+        # members, and the bounds of an invalid polygon may leave out a hole
+        # outside its shell
+        in_range = (
+            built
+            & valid
+            & (minx >= self.LON_MIN)
+            & (maxx <= self.LON_MAX)
+            & (miny >= self.LAT_MIN)
+            & (maxy <= self.LAT_MAX)
+        )
+        return shapely_geoms, in_range.tolist(), valid.tolist()
+
     def _validate_feature(
         self,
         feature: dict[str, Any],
         index: int,
+        shapely_geom: Any = None,
+        coords_checked: bool = False,
+        validity_checked: bool = False,
     ) -> list[ValidationWarning]:
         """Validate a single feature."""
         warnings: list[ValidationWarning] = []
@@ -248,7 +338,11 @@ class GeometryValidator:
                 )
             )
         else:
-            warnings.extend(self._validate_geometry(geometry, index, feature_id))
+            warnings.extend(
+                self._validate_geometry(
+                    geometry, index, feature_id, shapely_geom, coords_checked, validity_checked
+                )
+            )
 
         # Check properties
         props = feature.get("properties")
@@ -270,38 +364,66 @@ class GeometryValidator:
         geometry: dict[str, Any],
         feature_index: int,
         feature_id: Any | None,
+        shapely_geom: Any = None,
+        coords_checked: bool = False,
+        validity_checked: bool = False,
     ) -> list[ValidationWarning]:
-        """Validate a geometry."""
+        """
+        Validate a geometry.
+
+        The shapely geometry is built once for the outermost geometry and
+        its parts are reused for GeometryCollection members. Coordinate
+        checks are skipped when the bounds were already found in range, and
+        the shapely checks when the geometry was already found valid and
+        non-empty.
+        """
         warnings: list[ValidationWarning] = []
         geom_type = geometry.get("type")
+        check_validity = self.check_validity and self._has_shapely
+        check_coords = not coords_checked
+
+        if check_validity and shapely_geom is None:
+            shapely_geom = self._to_shapely(geometry)
 
         if geom_type == "Point":
-            coords = geometry.get("coordinates", [])
-            warnings.extend(self._validate_coordinate(coords, feature_index, feature_id))
+            if check_coords:
+                coords = geometry.get("coordinates", [])
+                warnings.extend(self._validate_coordinate(coords, feature_index, feature_id))
 
         elif geom_type == "MultiPoint":
-            for coord in geometry.get("coordinates", []):
-                warnings.extend(self._validate_coordinate(coord, feature_index, feature_id))
+            if check_coords:
+                coords = geometry.get("coordinates", [])
+                warnings.extend(self._validate_coordinates(coords, feature_index, feature_id))
 
         elif geom_type == "LineString":
             coords = geometry.get("coordinates", [])
-            warnings.extend(self._validate_line_string(coords, feature_index, feature_id))
+            warnings.extend(
+                self._validate_line_string(coords, feature_index, feature_id, check_coords)
+            )
 
         elif geom_type == "MultiLineString":
             for line in geometry.get("coordinates", []):
-                warnings.extend(self._validate_line_string(line, feature_index, feature_id))
+                warnings.extend(
+                    self._validate_line_string(line, feature_index, feature_id, check_coords)
+                )
 
         elif geom_type == "Polygon":
             rings = geometry.get("coordinates", [])
-            warnings.extend(self._validate_polygon(rings, feature_index, feature_id))
+            warnings.extend(self._validate_polygon(rings, feature_index, feature_id, check_coords))
 
         elif geom_type == "MultiPolygon":
             for polygon in geometry.get("coordinates", []):
-                warnings.extend(self._validate_polygon(polygon, feature_index, feature_id))
+                warnings.extend(
+                    self._validate_polygon(polygon, feature_index, feature_id, check_coords)
+                )
 
         elif geom_type == "GeometryCollection":
-            for geom in geometry.get("geometries", []):
-                warnings.extend(self._validate_geometry(geom, feature_index, feature_id))
+            members = list(shapely_geom.geoms) if shapely_geom is not None else []
+            for i, geom in enumerate(geometry.get("geometries", [])):
+                member = members[i] if i < len(members) else None
+                warnings.extend(
+                    self._validate_geometry(geom, feature_index, feature_id, member, coords_checked)
+                )
 
         elif geom_type is None:
             warnings.append(
@@ -326,8 +448,10 @@ class GeometryValidator:
             )
 
         # Check validity using shapely if available
-        if self.check_validity and self._has_shapely:
-            validity_warnings = self._check_shapely_validity(geometry, feature_index, feature_id)
+        if check_validity and not validity_checked:
+            validity_warnings = self._check_shapely_validity(
+                geometry, feature_index, feature_id, shapely_geom
+            )
             warnings.extend(validity_warnings)
 
         return warnings
@@ -386,11 +510,41 @@ class GeometryValidator:
 
         return warnings
 
+    def _validate_coordinates(
+        self,
+        coords: list[list[float]],
+        feature_index: int,
+        feature_id: Any | None,
+    ) -> list[ValidationWarning]:
+        """
+        Validate a list of coordinates.
+
+        Coordinates inside the valid range are passed over with two chained
+        comparisons; only the others go through _validate_coordinate to
+        build their warnings.
+        """
+        if not self.check_coordinates:
+            return []
+
+        lon_min, lon_max = self.LON_MIN, self.LON_MAX
+        lat_min, lat_max = self.LAT_MIN, self.LAT_MAX
+        warnings: list[ValidationWarning] = []
+        for coord in coords:
+            try:
+                if lon_min <= coord[0] <= lon_max and lat_min <= coord[1] <= lat_max:
+                    continue
+            except (IndexError, TypeError):
+                # Malformed coordinates are reported by _validate_coordinate
+                pass
+            warnings.extend(self._validate_coordinate(coord, feature_index, feature_id))
+        return warnings
+
     def _validate_line_string(
         self,
         coords: list[list[float]],
         feature_index: int,
         feature_id: Any | None,
+        check_coords: bool = True,
     ) -> list[ValidationWarning]:
         """Validate a LineString."""
         warnings: list[ValidationWarning] = []
@@ -408,8 +562,8 @@ class GeometryValidator:
             return warnings
 
         # Check individual coordinates
-        for coord in coords:
-            warnings.extend(self._validate_coordinate(coord, feature_index, feature_id))
+        if check_coords:
+            warnings.extend(self._validate_coordinates(coords, feature_index, feature_id))
 
         # Check for duplicate consecutive vertices
         if self.check_duplicates:
@@ -433,6 +587,7 @@ class GeometryValidator:
         rings: list[list[list[float]]],
         feature_index: int,
         feature_id: Any | None,
+        check_coords: bool = True,
     ) -> list[ValidationWarning]:
         """Validate a Polygon."""
         warnings: list[ValidationWarning] = []
@@ -484,8 +639,8 @@ class GeometryValidator:
                     )
 
             # Check coordinates
-            for coord in ring:
-                warnings.extend(self._validate_coordinate(coord, feature_index, feature_id))
+            if check_coords:
+                warnings.extend(self._validate_coordinates(ring, feature_index, feature_id))
 
             # Check duplicates
             if self.check_duplicates:
@@ -538,26 +693,44 @@ class GeometryValidator:
     ) -> list[int]:
         """Find indices of consecutive duplicate vertices."""
         duplicates = []
-        for i in range(1, len(coords)):
-            if coords[i] == coords[i - 1]:
+        # Carry the previous vertex over instead of indexing it again;
+        # the sentinel never equals the first vertex
+        previous: Any = _NO_VERTEX
+        for i, coord in enumerate(coords):
+            if coord == previous:
                 duplicates.append(i)
+            previous = coord
         return duplicates
 
     def _is_counterclockwise(self, ring: list[list[float]]) -> bool:
         """Check if a ring is counter-clockwise using the shoelace formula."""
+        if not ring:
+            return False
         total = 0.0
-        n = len(ring)
-        for i in range(n - 1):
-            x1, y1 = ring[i][0], ring[i][1]
-            x2, y2 = ring[i + 1][0], ring[i + 1][1]
+        # Carry the previous vertex over instead of indexing both ends of each edge
+        x1, y1 = ring[0][0], ring[0][1]
+        for i in range(1, len(ring)):
+            point = ring[i]
+            x2, y2 = point[0], point[1]
             total += (x2 - x1) * (y2 + y1)
+            x1, y1 = x2, y2
         return total < 0
 
+    def _to_shapely(self, geometry: dict[str, Any]) -> Any:
+        """Build a shapely geometry, or return None if it cannot be built."""
+        try:
+            from shapely.geometry import shape
+
+            return shape(geometry)
+        except Exception:
+            return None
+
     def _check_shapely_validity(
         self,
         geometry: dict[str, Any],
         feature_index: int,
         feature_id: Any | None,
+        geom: Any = None,
     ) -> list[ValidationWarning]:
         """Check geometry validity using shapely."""
         warnings: list[ValidationWarning] = []
@@ -566,7 +739,8 @@ class GeometryValidator:
             from shapely.geometry import shape
             from shapely.validation import explain_validity
 
-            geom = shape(geometry)
+            if geom is None:
+                geom = shape(geometry)
 
             if not geom.is_valid:
                 reason = explain_validity(geom)
@@ -622,3 +796,200 @@ def validate_geojson(
     """
     validator = GeometryValidator(**options)
     return validator.validate(geojson)
+
+
+def is_well_formed(geojson: dict[str, Any]) -> bool:
+    """
+    Check that GeoJSON has a valid structure.
+
+    This is a cheap schema-style check of object types, nesting and position
+    arrays (RFC 7946). It does not look at coordinate ranges, winding order or
+    geometry validity, so it is much faster than GeometryValidator but only
+    tells you whether the data is well-formed.
+
+    Args:
+        geojson: GeoJSON data to check.
+
+    Returns:
+        True if the data is structurally valid GeoJSON.
+    """
+    if not isinstance(geojson, dict):
+        return False
+
+    geojson_type = geojson.get("type")
+    if geojson_type == "FeatureCollection":
+        features = geojson.get("features")
+        return isinstance(features, list) and all(map(_is_feature, features))
+    if geojson_type == "Feature":
+        return _is_feature(geojson)
+    return _is_geometry(geojson)
+
+
+def _is_feature(feature: Any) -> bool:
+    """Check the structure of a Feature."""
+    if not isinstance(feature, dict) or feature.get("type") != "Feature":
+        return False
+    properties = feature.get("properties")
+    if properties is not None and not isinstance(properties, dict):
+        return False
+    geometry = feature.get("geometry")
+    return geometry is None or _is_geometry(geometry)
+
+
+def _is_geometry(geometry: Any) -> bool:
+    """Check the structure of a geometry object."""
+    if not isinstance(geometry, dict):
+        return False
+
+    geom_type = geometry.get("type")
+    if geom_type == "GeometryCollection":
+        geometries = geometry.get("geometries")
+        return isinstance(geometries, _SEQUENCE_TYPES) and all(map(_is_geometry, geometries))
+
+    check = _COORDINATE_CHECKS.get(geom_type)  # type: ignore[arg-type]
+    return check is not None and check(geometry.get("coordinates"))
+
+
+def _is_position(position: Any) -> bool:
+    """Check that a value is a position (at least two numbers)."""
+    if not isinstance(position, _SEQUENCE_TYPES) or len(position) < 2:
+        return False
+    # Comparing exact types runs in C and covers what JSON parsers produce;
+    # only other number types, e.g. numpy floats, need the slower check
+    return _NUMBER_TYPES.issuperset(map(type, position)) or all(
+        isinstance(c, (int, float)) and not isinstance(c, bool) for c in position
+    )
+
+
+def _is_position_list(coords: Any, min_length: int = 0) -> bool:
+    """Check that a value is a list of at least ``min_length`` positions."""
+    return (
+        isinstance(coords, _SEQUENCE_TYPES)
+        and len(coords) >= min_length
+        and all(map(_is_position, coords))
+    )
+
+
+def _is_line_string(coords: Any) -> bool:
+    """Check LineString coordinates."""
+    return _is_position_list(coords, 2)
+
+
+def _is_polygon(coords: Any) -> bool:
+    """Check Polygon coordinates (closed rings of at least four positions)."""
+    return (
+        isinstance(coords, _SEQUENCE_TYPES)
+        and len(coords) > 0
+        and all(_is_position_list(ring, 4) and ring[0] == ring[-1] for ring in coords)
+    )
+
+
+def _is_list_of(check: Any) -> Any:
+    """Build a check for a list of coordinates that each pass ``check``."""
+    return lambda coords: isinstance(coords, _SEQUENCE_TYPES) and all(map(check, coords))
+
+
+_NUMBER_TYPES = frozenset((int, float))
+
+# GeoJSON parsers produce lists, while __geo_interface__ implementations such
+# as pyshp and fiona build coordinates from tuples
+_SEQUENCE_TYPES = (list, tuple)
+
+# Levels of lists around the positions of each geometry type
+_NESTING_DEPTHS = {
+    "Point": 0,
+    "MultiPoint": 1,
+    "LineString": 1,
+    "MultiLineString": 2,
+    "Polygon": 2,
+    "MultiPolygon": 3,
+}
+
+_COORDINATE_CHECKS = {
+    "Point": _is_position,
+    "MultiPoint": _is_position_list,
+    "LineString": _is_line_string,
+    "MultiLineString": _is_list_of(_is_line_string),
+    "Polygon": _is_polygon,
+    "MultiPolygon": _is_list_of(_is_polygon),
+}
+
+
+def _has_error(warnings: list[ValidationWarning]) -> bool:
+    """Check if any of the warnings is an error."""
+    return any(w.severity == "error" for w in warnings)
+
+
+def _from_coordinates(geom_type: str, coordinates: list[Any]) -> Any:
+    """
+    Build shapely geometries of one type from their GeoJSON coordinates.
+
+    The positions are flattened into a single array with offsets for each
+    level of nesting, as shapely.from_ragged_array expects. Rings are closed
+    the same way shape() closes them. Geometries that shape() would build
+    differently or reject are returned as None: those with an empty part at
+    any level, e.g. an empty ring, or with positions that aren't all 2D or
+    all 3D. So are geometries with NaN coordinates, whose bounds leave the
+    NaN out.
+
+    Raises:
+        TypeError, ValueError: If any of the coordinates are malformed.
+    """
+    import numpy as np
+    import shapely
+
+    count = len(coordinates)
+    offsets = []
+    items = coordinates
+    # Geometry that each item at the current level of nesting belongs to
+    owners = np.arange(count)
+    unsupported = np.zeros(count, dtype=bool)
+    for _ in range(_NESTING_DEPTHS[geom_type]):
+        sizes = np.fromiter(map(len, items), dtype=np.int64, count=len(items))
+        unsupported[owners[sizes == 0]] = True
+        owners = np.repeat(owners, sizes)
+        offsets.append(np.concatenate(([0], np.cumsum(sizes))))
+        items = list(chain.from_iterable(items))
+
+    dims = np.fromiter(map(len, items), dtype=np.int64, count=len(items))
+    lowest = np.full(count, 4)
+    highest = np.zeros(count, dtype=np.int64)
+    np.minimum.at(lowest, owners, dims)
+    np.maximum.at(highest, owners, dims)
+    unsupported |= (lowest != highest) | (lowest < 2) | (highest > 3)
+
+    if unsupported.any():
+        # from_ragged_array crashes the interpreter on some empty parts, such
+        # as an empty first ring
+        return _from_some_coordinates(geom_type, coordinates, ~unsupported)
+    if lowest.min() != lowest.max():
+        # from_ragged_array needs one number of dimensions for all positions
+        geoms = _from_some_coordinates(geom_type, coordinates, lowest == 2)
+        return np.where(
+            lowest == 3, _from_some_coordinates(geom_type, coordinates, lowest == 3), geoms
+        )
+
+    positions = np.asarray(items)
+    if positions.dtype.kind not in "iuf" or positions.ndim != 2:
+        raise ValueError("Malformed coordinates")
+    if positions.dtype.kind == "f":
+        has_nan = np.zeros(count, dtype=bool)
+        has_nan[owners[np.isnan(positions[:, :2]).any(axis=1)]] = True
+        if has_nan.any():
+            return _from_some_coordinates(geom_type, coordinates, ~has_nan)
+    geometry_type = shapely.GeometryType[geom_type.upper()]
+    # Offsets go from the innermost level out
+    return shapely.from_ragged_array(
+        geometry_type, positions.astype(float), tuple(reversed(offsets)) or None
+    )
+
+
+def _from_some_coordinates(geom_type: str, coordinates: list[Any], keep: Any) -> Any:
+    """Build the geometries selected by a boolean mask, with None for the others."""
+    import numpy as np
+
+    geoms = np.full(len(coordinates), None, dtype=object)
+    indices = np.flatnonzero(keep)
+    if indices.size:
+        geoms[indices] = _from_coordinates(geom_type, [coordinates[i] for i in indices])
+    return geoms
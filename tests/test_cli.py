@@ -1,5 +1,12 @@
 """Tests for the CLI module."""
 
+import itertools
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
 from click.testing import CliRunner
 
 from mtu.cli import main
@@ -17,6 +24,28 @@ class TestCLI:
         assert "upload" in result.output
         assert "convert" in result.output
 
+    def test_help_is_rendered_once(self) -> None:
+        """Test repeated help requests reuse the rendered text."""
+        main._help_cache.clear()
+        runner = CliRunner()
+        with patch.object(main, "format_usage", wraps=main.format_usage) as fmt:
+            first = runner.invoke(main, ["--help"])
+            second = runner.invoke(main, ["--help"])
+        assert first.output == second.output
+        assert "Examples" in first.output
+        assert fmt.call_count == 1
+
+    def test_cli_import_is_lightweight(self) -> None:
+        """Test that importing the CLI does not load uploader or converters."""
+        code = (
+            "import sys, mtu.cli; "
+            "assert 'mtu.uploader' not in sys.modules; "
+            "assert 'mtu.converters' not in sys.modules; "
+            "assert 'mtu.validators' not in sys.modules; "
+            "assert 'mtu._json' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     def test_version(self) -> None:
         """Test version command."""
         runner = CliRunner()
@@ -97,6 +126,57 @@ class TestCLI:
         assert result.exit_code == 0
         assert "FILE_PATH" in result.output
         assert "--verbose" in result.output
+        assert "--no-deep" in result.output
+
+    def test_validate_no_deep(self, tmp_path: Path) -> None:
+        """Test --no-deep skips geometry checks unless the structure is invalid."""
+        feature = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [200, 0]},
+            "properties": {},
+        }
+        input_file = tmp_path / "input.geojson"
+        input_file.write_text(
+            json.dumps({"type": "FeatureCollection", "features": [feature]}), encoding="utf-8"
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(main, ["validate", str(input_file), "--no-deep"])
+        assert result.exit_code == 0, result.output
+        assert "geometry checks skipped" in result.output
+
+        result = runner.invoke(main, ["validate", str(input_file)])
+        assert "out_of_bounds" in result.output
+
+        feature["geometry"] = {"type": "LineString", "coordinates": [[0, 0]]}
+        input_file.write_text(
+            json.dumps({"type": "FeatureCollection", "features": [feature]}), encoding="utf-8"
+        )
+        result = runner.invoke(main, ["validate", str(input_file), "--no-deep"])
+        assert result.exit_code == 1
+        assert "Geometry Validation" in result.output
+
+    def test_validate_groups_warnings(self, tmp_path: Path) -> None:
+        """Test validate shows a count and the first examples of each issue."""
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [200 + i, 0]},
+                "properties": {},
+            }
+            for i in range(5)
+        ]
+        input_file = tmp_path / "input.geojson"
+        input_file.write_text(
+            json.dumps({"type": "FeatureCollection", "features": features}), encoding="utf-8"
+        )
+
+        runner = CliRunner()
+        result = runner.invoke(main, ["validate", str(input_file)])
+        assert result.exit_code == 0, result.output
+        assert "[out_of_bounds] (5 occurrences)" in result.output
+        assert result.output.count("• feature") == 3
+        assert "... and 2 more" in result.output
 
     def test_list_sources_help(self) -> None:
         """Test list-sources command help."""
@@ -114,6 +194,71 @@ class TestCLI:
         assert "--token" in result.output
         assert "--username" in result.output
 
+    def test_list_output(self) -> None:
+        """Test list-sources and list-tilesets output."""
+        sources = [{"id": "mapbox://tileset-source/user/a", "size": 10}, {"id": "b"}]
+        tilesets = [
+            {"name": "One", "id": "user.one", "status": "success"},
+            {"name": "Two", "id": "user.two", "status": "processing"},
+            {"id": "user.three"},
+        ]
+        runner = CliRunner()
+        env = {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "user"}
+        with (
+            patch("mtu.uploader.TilesetUploader.list_sources", return_value=sources),
+            patch("mtu.uploader.TilesetUploader.list_tilesets", return_value=tilesets),
+        ):
+            result = runner.invoke(main, ["list-sources"], env=env)
+            assert result.exit_code == 0, result.output
+            assert "• mapbox://tileset-source/user/a (10 bytes)\n   • b\n\n" in result.output
+
+            result = runner.invoke(main, ["list-tilesets"], env=env)
+            assert result.exit_code == 0, result.output
+            assert "✅ One\n      ID: user.one" in result.output
+            assert "⏳ Two" in result.output
+            assert "❓ Unnamed\n      ID: user.three\n\n" in result.output
+
+    def test_upload_precision_is_opt_in(self, tmp_path: Path) -> None:
+        """Test coordinates are only rounded when --precision is given."""
+        from mtu.converters.geojsonseq import GeoJSONSeqConverter
+
+        line = (
+            b'{"type":"Feature","geometry":{"type":"Point","coordinates":[1.123456789,2]},'
+            b'"properties":{}}'
+        )
+        source = tmp_path / "data.ndjson"
+        source.write_bytes(line + b"\n")
+        runner = CliRunner()
+        env = {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "user"}
+        args = ["upload", "-f", str(source), "-i", "test", "-n", "Test", "--no-validate"]
+
+        for extra, parsed, uploaded_line in (
+            ([], False, line),
+            (["--precision", "7"], True, line.replace(b"1.123456789", b"1.1234568")),
+        ):
+            uploaded: list[bytes] = []
+            with (
+                patch.object(
+                    GeoJSONSeqConverter,
+                    "_iter_features",
+                    autospec=True,
+                    side_effect=GeoJSONSeqConverter._iter_features,
+                ) as iter_features,
+                patch(
+                    "mtu.uploader.TilesetUploader._upload_source_file",
+                    side_effect=lambda path, *args, **kwargs: uploaded.append(path.read_bytes()),
+                ),
+                patch("mtu.uploader.TilesetUploader._tileset_exists", return_value=True),
+                patch("mtu.uploader.TilesetUploader._update_recipe"),
+                patch("mtu.uploader.TilesetUploader._publish_tileset", return_value="job"),
+                patch("mtu.uploader.TilesetUploader._wait_for_job", return_value="success"),
+            ):
+                result = runner.invoke(main, args + extra, env=env)
+
+            assert result.exit_code == 0, result.output
+            assert iter_features.called is parsed
+            assert uploaded == [uploaded_line + b"\n"]
+
     def test_delete_source_help(self) -> None:
         """Test delete-source command help."""
         runner = CliRunner()
@@ -129,3 +274,154 @@ class TestCLI:
         assert result.exit_code == 0
         assert "TILESET_ID" in result.output
         assert "--yes" in result.output
+
+    def test_convert_output_round_trips(self, tmp_path: Path) -> None:
+        """Test streamed convert output parses back to the input GeoJSON."""
+        geojson = {
+            "type": "FeatureCollection",
+            "bbox": [0, 0, 1, 1],
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [0, 0]},
+                    "properties": {"name": "Zürich"},
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [1, 1]},
+                    "properties": {},
+                },
+            ],
+        }
+        input_file = tmp_path / "input.geojson"
+        input_file.write_text(json.dumps(geojson), encoding="utf-8")
+
+        runner = CliRunner()
+        for batch_size, args in itertools.product((1, 1000), ([], ["--pretty"])):
+            output_file = tmp_path / "output.geojson"
+            with patch("mtu.cli.STREAM_BATCH_SIZE", batch_size):
+                result = runner.invoke(main, ["convert", str(input_file), str(output_file), *args])
+            assert result.exit_code == 0, result.output
+            output = output_file.read_text(encoding="utf-8")
+            assert json.loads(output) == geojson
+            assert ("\n    {" in output) == bool(args)
+
+    def test_convert_precision(self, tmp_path: Path) -> None:
+        """Test --precision rounds output coordinates."""
+        geojson = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [0.123456789, 1.987654321]},
+                    "properties": {},
+                }
+            ],
+        }
+        input_file = tmp_path / "input.geojson"
+        input_file.write_text(json.dumps(geojson), encoding="utf-8")
+        output_file = tmp_path / "output.geojson"
+
+        runner = CliRunner()
+        result = runner.invoke(
+            main, ["convert", str(input_file), str(output_file), "--precision", "3"]
+        )
+        assert result.exit_code == 0, result.output
+        output = json.loads(output_file.read_text(encoding="utf-8"))
+        assert output["features"][0]["geometry"]["coordinates"] == [0.123, 1.988]
+
+    def test_convert_ndjson(self, tmp_path: Path) -> None:
+        """Test --ndjson writes one feature per line, including to stdout."""
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [i, i]},
+                "properties": {"i": i},
+            }
+            for i in range(3)
+        ]
+        input_file = tmp_path / "input.geojson"
+        input_file.write_text(
+            json.dumps({"type": "FeatureCollection", "features": features}), encoding="utf-8"
+        )
+        output_file = tmp_path / "output.geojsonl"
+
+        runner = CliRunner()
+        result = runner.invoke(main, ["convert", str(input_file), str(output_file), "--ndjson"])
+        assert result.exit_code == 0, result.output
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == features
+
+        process = subprocess.run(
+            [sys.executable, "-m", "mtu.cli", "convert", str(input_file), "-", "--ndjson"],
+            capture_output=True,
+            check=True,
+        )
+        assert [json.loads(line) for line in process.stdout.splitlines()] == features
+        assert b"Converted 3 features to stdout" in process.stderr
+
+        result = runner.invoke(
+            main, ["convert", str(input_file), str(output_file), "--ndjson", "--pretty"]
+        )
+        assert result.exit_code != 0
+
+    def test_convert_ndjson_streams_features(self, tmp_path: Path) -> None:
+        """Test --ndjson reads TopoJSON without building a FeatureCollection."""
+        topojson = {
+            "type": "Topology",
+            "objects": {
+                "points": {
+                    "type": "GeometryCollection",
+                    "geometries": [{"type": "Point", "coordinates": [i, i]} for i in range(3)],
+                }
+            },
+            "arcs": [],
+        }
+        input_file = tmp_path / "input.topojson"
+        input_file.write_text(json.dumps(topojson), encoding="utf-8")
+        output_file = tmp_path / "output.geojsonl"
+
+        runner = CliRunner()
+        with patch(
+            "mtu.converters.topojson.TopoJSONConverter.convert",
+            side_effect=AssertionError("converted"),
+        ):
+            result = runner.invoke(main, ["convert", str(input_file), str(output_file), "--ndjson"])
+        assert result.exit_code == 0, result.output
+        assert "Converted 3 features" in result.output
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["geometry"]["coordinates"] for line in lines] == [
+            [0.0, 0.0],
+            [1.0, 1.0],
+            [2.0, 2.0],
+        ]
+
+    def test_convert_ndjson_drops_warnings(self, tmp_path: Path) -> None:
+        """Test streamed --ndjson output doesn't report conversion warnings."""
+        input_file = tmp_path / "input.geojson"
+        input_file.write_text(json.dumps({"type": "Point", "coordinates": [1, 2]}))
+        output_file = tmp_path / "output.geojsonl"
+
+        runner = CliRunner()
+        result = runner.invoke(main, ["convert", str(input_file), str(output_file)])
+        assert result.exit_code == 0, result.output
+        assert "Wrapped Point geometry in FeatureCollection" in result.output
+
+        result = runner.invoke(main, ["convert", str(input_file), str(output_file), "--ndjson"])
+        assert result.exit_code == 0, result.output
+        assert "Warnings" not in result.output
+        assert "Converted 1 features" in result.output
+        assert json.loads(output_file.read_text())["geometry"]["coordinates"] == [1, 2]
+
+    def test_convert_without_orjson(self, tmp_path: Path) -> None:
+        """Test convert falls back to the stdlib json module."""
+        geojson = {"type": "FeatureCollection", "features": []}
+        input_file = tmp_path / "input.geojson"
+        input_file.write_text(json.dumps(geojson), encoding="utf-8")
+        output_file = tmp_path / "output.geojson"
+
+        runner = CliRunner()
+        with patch("mtu._json.orjson", None):
+            result = runner.invoke(main, ["convert", str(input_file), str(output_file)])
+        assert result.exit_code == 0, result.output
+        assert json.loads(output_file.read_text(encoding="utf-8")) == geojson
@@ -1,14 +1,21 @@
 """Tests for the converters module."""
 
+import gc
+import io
 import json
+import subprocess
+import sys
 import tempfile
+import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
-from mtu.converters import get_converter, get_supported_formats
-from mtu.converters.base import ConversionResult
+from mtu.converters import ConverterRegistry, get_converter, get_supported_formats
+from mtu.converters.base import ConversionResult, is_installed
 from mtu.converters.geojson import GeoJSONConverter
+from mtu.converters.geojsonseq import GeoJSONSeqConverter
 from mtu.converters.topojson import TopoJSONConverter
 
 
@@ -23,6 +30,90 @@ class TestConverterRegistry:
         format_names = [f["format_name"] for f in formats]
         assert "GeoJSON" in format_names
         assert "TopoJSON" in format_names
+        assert format_names == sorted(format_names, key=str.lower)
+
+    def test_availability_is_checked_once(self) -> None:
+        """Test converter dependencies are only probed on the first call."""
+        ConverterRegistry._availability.clear()
+        ConverterRegistry._formats = None
+        get_supported_formats()
+        with patch(
+            "mtu.converters.registry.is_installed", side_effect=AssertionError("re-checked")
+        ):
+            formats = get_supported_formats()
+        assert {f["format_name"]: f["available"] for f in formats}["GeoJSON"]
+
+    def test_formats_are_rebuilt_after_register(self) -> None:
+        """Test the cached format list picks up newly registered converters."""
+
+        class DummyConverter(GeoJSONConverter):
+            format_name = "Dummy"
+            file_extensions = [".dummy"]
+
+        get_supported_formats()[0]["format_name"] = "changed"
+        with (
+            patch.dict(ConverterRegistry._converters),
+            patch.dict(ConverterRegistry._extension_map),
+            patch.object(ConverterRegistry, "_formats", None),
+        ):
+            assert "Dummy" not in [f["format_name"] for f in get_supported_formats()]
+            ConverterRegistry.register(DummyConverter)
+            formats = get_supported_formats()
+        assert "Dummy" in [f["format_name"] for f in formats]
+        assert "changed" not in [f["format_name"] for f in get_supported_formats()]
+
+    def test_availability_check_does_not_import(self) -> None:
+        """Test listing formats finds optional packages without importing them."""
+        pytest.importorskip("geopandas")
+        code = (
+            "import sys; from mtu.converters import get_supported_formats; "
+            "formats = {f['format_name']: f['available'] for f in get_supported_formats()}; "
+            "assert formats['GeoParquet']; "
+            "assert 'geopandas' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_builtin_converters_are_imported_on_use(self) -> None:
+        """Test converter modules are only imported when their format is used."""
+        code = (
+            "import sys; from mtu.converters import get_converter, ConverterRegistry; "
+            "assert ConverterRegistry.is_supported('roads.shp'); "
+            "get_converter(file_path='roads.geojson'); "
+            "assert 'mtu.converters.geojson' in sys.modules; "
+            "assert 'mtu.converters.shapefile' not in sys.modules; "
+            "assert 'concurrent.futures.process' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_converter_modules_do_not_import_each_other(self) -> None:
+        """Test importing one converter doesn't import and register its siblings."""
+        code = (
+            "import sys; import mtu.converters.geopackage, mtu.converters.kml; "
+            "assert 'mtu.converters.flatgeobuf' not in sys.modules; "
+            "assert 'mtu.converters.geoparquet' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_builtin_tables_match_converters(self) -> None:
+        """Test the built-in name and extension tables match the converter classes."""
+        from mtu.converters import registry
+
+        get_supported_formats()
+        extensions = {}
+        for name in registry._BUILTIN_CONVERTERS:
+            converter_class = ConverterRegistry._converters[name]
+            assert converter_class.format_name.lower() == name
+            extensions.update(dict.fromkeys(converter_class.file_extensions, name))
+        assert extensions == registry._BUILTIN_EXTENSIONS
+
+    def test_dependencies_are_checked_once(self) -> None:
+        """Test converter instances after the first skip the dependency imports."""
+        pytest.importorskip("geopandas")
+        from mtu.converters.geoparquet import GeoParquetConverter
+
+        GeoParquetConverter()
+        with patch("mtu.converters.base.is_installed", side_effect=AssertionError("re-checked")):
+            GeoParquetConverter()
 
     def test_get_converter_by_format(self) -> None:
         """Test getting converter by format name."""
@@ -43,6 +134,21 @@ class TestConverterRegistry:
         converter = get_converter(file_path="data.json")
         assert isinstance(converter, GeoJSONConverter)
 
+    def test_file_extension(self) -> None:
+        """Test extensions match pathlib, keeping compound compressed suffixes."""
+        from mtu.converters.base import file_extension
+
+        for name, expected in [
+            ("data/Roads.SHP.ZIP", ".shp.zip"),
+            ("roads.geojson.gz", ".geojson.gz"),
+            ("archive.zip", ".zip"),
+            ("dir.d/roads.gpkg", ".gpkg"),
+            (".zip", ""),
+            ("README", ""),
+        ]:
+            assert file_extension(name) == expected
+            assert file_extension(Path(name)) == expected
+
     def test_get_converter_unknown_format(self) -> None:
         """Test error for unknown format."""
         with pytest.raises(ValueError, match="Unknown format"):
@@ -129,6 +235,50 @@ class TestGeoJSONConverter:
         finally:
             temp_path.unlink()
 
+    def test_convert_from_stream(self) -> None:
+        """Test converting from a binary file object."""
+        converter = GeoJSONConverter()
+        geojson = {"type": "Point", "coordinates": [1, 2]}
+
+        result = converter.convert(io.BytesIO(json.dumps(geojson).encode("utf-8")))
+        assert result.feature_count == 1
+        assert result.geojson["features"][0]["geometry"] == geojson
+
+    def test_iter_geojsonl(self, tmp_path: Path) -> None:
+        """Test features are encoded one per line, in order."""
+        converter = GeoJSONConverter()
+        features = [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [i + 0.123456, 2]},
+                "properties": {"id": i},
+            }
+            for i in range(3)
+        ]
+        path = tmp_path / "points.geojson"
+        path.write_text(json.dumps({"type": "FeatureCollection", "features": features}))
+
+        count, lines = converter.iter_geojsonl(path)
+        assert count == 3
+        assert [json.loads(line) for line in lines] == features
+
+        count, lines = converter.iter_geojsonl(path, precision=2)
+        assert [json.loads(line)["geometry"]["coordinates"] for line in lines] == [
+            [0.12, 2],
+            [1.12, 2],
+            [2.12, 2],
+        ]
+
+        path.write_text(json.dumps(features[0]))
+        count, lines = converter.iter_geojsonl(path)
+        assert count == 1
+        assert [json.loads(line) for line in lines] == features[:1]
+
+        path.write_text('{"type": "FeatureCollection"}')
+        count, lines = converter.iter_geojsonl(path)
+        assert count == 0
+        assert list(lines) == []
+
     def test_convert_invalid_type(self) -> None:
         """Test error for invalid GeoJSON type."""
         converter = GeoJSONConverter()
@@ -136,6 +286,93 @@ class TestGeoJSONConverter:
             converter.convert({"type": "InvalidType"})
 
 
+class TestGeoJSONSeqConverter:
+    """Test line-delimited GeoJSON converter."""
+
+    FEATURES = [
+        {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [i + 0.123456, 2]},
+            "properties": {"id": i},
+        }
+        for i in range(3)
+    ]
+
+    def write_lines(self, path: Path) -> None:
+        """Write the features with a record separator, a blank line and a bare geometry."""
+        lines = [json.dumps(f) for f in self.FEATURES]
+        lines[1] = "\x1e" + lines[1]
+        lines.insert(2, "")
+        lines.append(json.dumps({"type": "Point", "coordinates": [5, 6]}))
+        path.write_text("\n".join(lines))
+
+    def test_convert(self, tmp_path: Path) -> None:
+        """Test every text becomes a feature of one FeatureCollection."""
+        path = tmp_path / "points.geojsonl"
+        self.write_lines(path)
+        point = {"type": "Feature", "geometry": {"type": "Point", "coordinates": [5, 6]}}
+        expected = [*self.FEATURES, {**point, "properties": {}}]
+
+        result = get_converter(file_path=path).convert(path)
+        assert result.source_format == "GeoJSONSeq"
+        assert result.feature_count == 4
+        assert result.geojson["features"] == expected
+        assert result.warnings == ["Wrapped Point geometry in FeatureCollection"]
+
+        result = GeoJSONSeqConverter().convert_from_bytes(path.read_bytes())
+        assert result.geojson["features"] == expected
+        with path.open("rb") as f:
+            assert GeoJSONSeqConverter().convert(f).geojson["features"] == expected
+
+    def test_iter_geojsonl(self, tmp_path: Path) -> None:
+        """Test lines are re-encoded one at a time."""
+        path = tmp_path / "points.ndjson"
+        self.write_lines(path)
+
+        count, lines = GeoJSONSeqConverter().iter_geojsonl(path, precision=2)
+        assert count == 5
+        features = [json.loads(line) for line in lines]
+        assert [f["properties"] for f in features] == [{"id": 0}, {"id": 1}, {"id": 2}, {}]
+        assert features[1]["geometry"]["coordinates"] == [1.12, 2]
+
+        count, lines = GeoJSONSeqConverter().iter_geojsonl(path)
+        features = [json.loads(line) for line in lines]
+        assert features[:3] == self.FEATURES
+        assert features[3]["geometry"] == {"type": "Point", "coordinates": [5, 6]}
+
+        path.write_text(json.dumps(self.FEATURES[0]) + "\n\n[1,\n")
+        with pytest.raises(ValueError, match="line 3"):
+            list(GeoJSONSeqConverter().iter_geojsonl(path)[1])
+
+        path.write_text('{"type":"FeatureCollection"}\n')
+        assert list(GeoJSONSeqConverter().iter_geojsonl(path)[1]) == []
+        assert GeoJSONSeqConverter().convert(path).feature_count == 0
+
+        path.write_bytes(b"")
+        count, lines = GeoJSONSeqConverter().iter_geojsonl(path)
+        assert count == 0
+        assert list(lines) == []
+
+    def test_iter_geojsonl_parses_feature_lines(self, tmp_path: Path) -> None:
+        """Test lines that only mention Feature aren't passed through."""
+        path = tmp_path / "points.ndjson"
+        path.write_text('{"type":"Point","coordinates":[1,2],"title":"Feature"}\n')
+
+        _, lines = GeoJSONSeqConverter().iter_geojsonl(path)
+        assert [json.loads(line)["type"] for line in lines] == ["Feature"]
+
+        path.write_text('{"type":"Feature","geometry":null\n')
+        with pytest.raises(ValueError, match="line 1"):
+            list(GeoJSONSeqConverter().iter_geojsonl(path)[1])
+
+    def test_convert_invalid_line(self, tmp_path: Path) -> None:
+        """Test errors name the line that couldn't be parsed."""
+        path = tmp_path / "broken.geojsons"
+        path.write_text(json.dumps(self.FEATURES[0]) + "\n{\n")
+        with pytest.raises(ValueError, match="line 2"):
+            GeoJSONSeqConverter().convert(path)
+
+
 class TestTopoJSONConverter:
     """Test TopoJSON converter."""
 
@@ -191,6 +428,90 @@ class TestTopoJSONConverter:
         assert abs(coords[0] - 0.0) < 0.01
         assert abs(coords[1] - 0.0) < 0.01
 
+    def test_convert_shared_arcs(self) -> None:
+        """Test arcs shared between polygons decode the same in both directions."""
+        converter = TopoJSONConverter()
+        topojson = {
+            "type": "Topology",
+            "transform": {"scale": [0.5, 2], "translate": [10, 20]},
+            "objects": {
+                "test": {
+                    "type": "GeometryCollection",
+                    "geometries": [
+                        {"type": "Polygon", "arcs": [[0, 1]]},
+                        {"type": "Polygon", "arcs": [[2, -1]]},
+                    ],
+                }
+            },
+            "arcs": [
+                [[0, 0], [0, 1]],
+                [[0, 1], [-1, 0], [1, -1]],
+                [[0, 0], [1, 0], [-1, 1]],
+            ],
+        }
+
+        result = converter.convert(topojson)
+        left, right = (f["geometry"]["coordinates"] for f in result.geojson["features"])
+        assert left == [[[10.0, 20.0], [10.0, 22.0], [9.5, 22.0], [10.0, 20.0]]]
+        assert right == [[[10.0, 20.0], [10.5, 20.0], [10.0, 22.0], [10.0, 20.0]]]
+
+    def test_convert_restores_gc(self) -> None:
+        """Test the garbage collector is re-enabled after decoding, also on errors."""
+        converter = TopoJSONConverter()
+        topojson = {
+            "type": "Topology",
+            "objects": {"test": {"type": "Point", "coordinates": [1, 2]}},
+            "arcs": [],
+        }
+        converter.convert(topojson)
+        assert gc.isenabled()
+
+        topojson["objects"]["test"] = {"type": "Unknown"}
+        with pytest.raises(ValueError, match="Unknown geometry type"):
+            converter.convert(topojson)
+        assert gc.isenabled()
+
+    def test_iter_geojsonl_matches_convert(self, tmp_path: Path) -> None:
+        """Test line-delimited output has the same features as convert()."""
+        topojson = {
+            "type": "Topology",
+            "transform": {"scale": [0.001, 0.001], "translate": [0, 0]},
+            "objects": {
+                "other": {"type": "GeometryCollection", "geometries": []},
+                "test": {
+                    "type": "GeometryCollection",
+                    "geometries": [
+                        {"type": "LineString", "arcs": [0], "id": 7},
+                        {"type": "Point", "coordinates": [1234, 5678], "properties": {"a": 1}},
+                        {"type": "Polygon", "arcs": [[1, -3, 2]]},
+                        {"type": "MultiLineString", "arcs": [[], [-2]]},
+                    ],
+                },
+            },
+            "arcs": [
+                [[1234, 5678], [1, 1]],
+                [[0, 0], [5, 0]],
+                [[0, 0], [0, 5], [5, -5]],
+                [],
+            ],
+        }
+        path = tmp_path / "data.topojson"
+
+        converter = TopoJSONConverter()
+        # Quantized arcs are decoded to arrays, the float ones to lists
+        for arcs in (topojson["arcs"], [[[0.5, 0.25], [1, 1]]] * 4):
+            path.write_text(json.dumps({**topojson, "arcs": arcs}))
+            count, lines = converter.iter_geojsonl(path, object_name="test")
+            features = [json.loads(line) for line in lines]
+
+            assert count == 4
+            assert features == converter.convert(path, object_name="test").geojson["features"]
+
+        path.write_text(json.dumps(topojson))
+
+        _, lines = converter.iter_geojsonl(path, object_name="test", precision=2)
+        assert json.loads(next(lines))["geometry"]["coordinates"] == [[1.23, 5.68], [1.24, 5.68]]
+
     def test_convert_invalid_topology(self) -> None:
         """Test error for invalid TopoJSON."""
         converter = TopoJSONConverter()
@@ -361,3 +682,432 @@ class TestGeometryTypes:
         geom = result.geojson["features"][0]["geometry"]
         assert geom["type"] == "MultiPoint"
         assert len(geom["coordinates"]) == 2
+
+
+class TestGeoParquetConverter:
+    """Test GeoParquet converter."""
+
+    def test_iter_geojsonl_matches_convert(self, tmp_path: Path) -> None:
+        """Test line-delimited output has the same features as convert()."""
+        gpd = pytest.importorskip("geopandas")
+        from shapely.geometry import Point, Polygon
+
+        from mtu.converters.geoparquet import GeoParquetConverter
+
+        path = tmp_path / "data.parquet"
+        gpd.GeoDataFrame(
+            {"name": ["a", "b", None], "count": [1, 2, 3], "value": [0.5, None, 2.0]},
+            geometry=[Point(0.1, 0.2), None, Polygon()],
+            crs="EPSG:4326",
+        ).to_parquet(path)
+
+        converter = GeoParquetConverter()
+        count, lines = converter.iter_geojsonl(path, batch_size=2)
+        features = [json.loads(line) for line in lines]
+
+        assert count == 3
+        assert features == converter.convert(path).geojson["features"]
+        assert features[1]["geometry"] is None
+
+    @pytest.mark.parametrize("index", ["sliced", "stepped", "strings", "none"])
+    def test_iter_geojsonl_keeps_feature_ids(self, tmp_path: Path, index: str) -> None:
+        """Test feature IDs come from the stored index like with convert()."""
+        gpd = pytest.importorskip("geopandas")
+        import pandas as pd
+        from shapely.geometry import Point
+
+        from mtu.converters.geoparquet import GeoParquetConverter
+
+        path = tmp_path / "data.parquet"
+        gdf = gpd.GeoDataFrame(
+            {"name": ["a", "b", "c", "d"]},
+            geometry=[Point(0, 0), Point(1, 1), Point(2, 2), Point(3, 3)],
+            crs="EPSG:4326",
+        )
+        if index == "sliced":
+            gdf = gdf.iloc[1:]
+        elif index == "stepped":
+            gdf.index = pd.RangeIndex(0, 40, 10)
+        elif index == "strings":
+            gdf.index = ["w", "x", "y", "z"]
+        gdf.to_parquet(path, index=None if index != "none" else False)
+
+        converter = GeoParquetConverter()
+        _, lines = converter.iter_geojsonl(path, batch_size=2)
+        features = [json.loads(line) for line in lines]
+
+        assert features == converter.convert(path).geojson["features"]
+        assert all("id" in feature for feature in features)
+
+    def test_iter_geojsonl_rejects_complex_columns(self, tmp_path: Path) -> None:
+        """Test columns that need geopandas' conversion are rejected."""
+        gpd = pytest.importorskip("geopandas")
+        import pandas as pd
+        from shapely.geometry import Point
+
+        from mtu.converters.geoparquet import GeoParquetConverter
+
+        path = tmp_path / "data.parquet"
+        gpd.GeoDataFrame(
+            {"when": [pd.Timestamp("2024-01-01")]}, geometry=[Point(0, 0)], crs="EPSG:4326"
+        ).to_parquet(path)
+
+        with pytest.raises(ValueError, match="unsupported type"):
+            GeoParquetConverter().iter_geojsonl(path)
+
+    def test_iter_geojsonl_nested_columns(self, tmp_path: Path) -> None:
+        """Test categorical, list and struct columns are streamed."""
+        gpd = pytest.importorskip("geopandas")
+        import pandas as pd
+        from shapely.geometry import Point
+
+        from mtu.converters.geoparquet import GeoParquetConverter
+
+        path = tmp_path / "data.parquet"
+        gpd.GeoDataFrame(
+            {
+                "kind": pd.Categorical(["a", None]),
+                "tags": [[1, 2], None],
+                "info": [{"x": 1}, {"x": None}],
+            },
+            geometry=[Point(0, 0), Point(1, 1)],
+            crs="EPSG:4326",
+        ).to_parquet(path)
+
+        _, lines = GeoParquetConverter().iter_geojsonl(path)
+
+        assert [json.loads(line)["properties"] for line in lines] == [
+            {"kind": "a", "tags": [1, 2], "info": {"x": 1}},
+            {"kind": None, "tags": None, "info": {"x": None}},
+        ]
+
+    def test_convert_matches_to_geo_dict(self, tmp_path: Path) -> None:
+        """Test features are the same as the ones geopandas builds."""
+        gpd = pytest.importorskip("geopandas")
+        from shapely.geometry import Point, Polygon
+
+        from mtu.converters.geoparquet import GeoParquetConverter
+
+        path = tmp_path / "data.parquet"
+        gdf = gpd.GeoDataFrame(
+            {"name": ["a", None, "c"], "value": [0.5, float("nan"), 2.0]},
+            geometry=[Point(0.1, 0.2, 3.0), Polygon(), Polygon([(0, 0), (1, 0), (1, 1)])],
+            index=["x", "y", "z"],
+            crs="EPSG:4326",
+        )
+        gdf.to_parquet(path)
+
+        result = GeoParquetConverter().convert(path)
+
+        assert result.geojson == json.loads(gdf.to_json(na="null"))
+
+
+class TestGeoPackageConverter:
+    """Test GeoPackage converter."""
+
+    def test_bulk_read(self, tmp_path: Path) -> None:
+        """Test layers read with pyogrio look like the ones read with fiona."""
+        gpd = pytest.importorskip("geopandas")
+        pytest.importorskip("pyogrio")
+        from shapely.geometry import Point
+
+        from mtu.converters.geopackage import GeoPackageConverter
+
+        path = tmp_path / "data.gpkg"
+        for layer in ("first", "second"):
+            gpd.GeoDataFrame(
+                {"name": ["a", None, "c"], "count": [1, None, 3]},
+                geometry=[Point(0.123, 0.456), Point(1, 1), None],
+                crs="EPSG:4326",
+            ).astype({"count": "Int64"}).to_file(path, layer=layer, engine="pyogrio")
+
+        # fiona is the declared requirement, pyogrio is used when it's installed
+        with patch("mtu.converters.base.is_installed", return_value=True):
+            converter = GeoPackageConverter()
+        result = converter.convert(path)
+
+        assert result.geojson["features"] == [
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [0.123, 0.456]},
+                "properties": {"name": "a", "count": 1},
+                "id": "1",
+            },
+            {
+                "type": "Feature",
+                "geometry": {"type": "Point", "coordinates": [1.0, 1.0]},
+                "properties": {"name": None, "count": None},
+                "id": "2",
+            },
+        ]
+        assert result.metadata["available_layers"] == ["first", "second"]
+        assert "Feature with null geometry skipped" in result.warnings
+
+        count, lines = converter.iter_geojsonl(path, layer="second", precision=1)
+        features = [json.loads(line) for line in lines]
+        assert count == 3
+        assert features[0]["geometry"]["coordinates"] == [0.1, 0.5]
+        assert features[1]["properties"] == {"name": None, "count": None}
+
+    def test_bulk_read_nullable_booleans(self, tmp_path: Path) -> None:
+        """Test nullable boolean fields are read as booleans, as fiona reads them."""
+        gpd = pytest.importorskip("geopandas")
+        pytest.importorskip("pyogrio")
+        pd = pytest.importorskip("pandas")
+        from shapely.geometry import Point
+
+        from mtu.converters.geopackage import GeoPackageConverter
+
+        path = tmp_path / "data.gpkg"
+        gpd.GeoDataFrame(
+            {"flag": pd.array([True, None, False], dtype="boolean"), "open": [True, False, True]},
+            geometry=[Point(0, 0)] * 3,
+            crs="EPSG:4326",
+        ).to_file(path, engine="pyogrio")
+
+        with patch("mtu.converters.base.is_installed", return_value=True):
+            converter = GeoPackageConverter()
+        features = converter.convert(path).geojson["features"]
+
+        # Compared as JSON, since 1 == True
+        expected = '[{"flag": true, "open": true}, {"flag": null, "open": false}, '
+        expected += '{"flag": false, "open": true}]'
+        assert json.dumps([f["properties"] for f in features]) == expected
+        _, lines = converter.iter_geojsonl(path)
+        assert json.dumps([json.loads(line)["properties"] for line in lines]) == expected
+
+        if is_installed("fiona"):
+            with patch("mtu.converters.geopackage._reads_in_bulk", return_value=False):
+                features = converter.convert(path).geojson["features"]
+            assert json.dumps([f["properties"] for f in features]) == expected
+
+
+class TestGPXConverter:
+    """Test GPX converter."""
+
+    GPX = """<?xml version="1.0" encoding="UTF-8"?>
+<gpx version="1.1" creator="test" xmlns="http://www.topografix.com/GPX/1/1">
+  <wpt lat="47.5" lon="8.5">
+    <ele>410.5</ele>
+    <time>2024-01-01T10:00:00.5Z</time>
+    <name>Summit</name>
+    <desc></desc>
+  </wpt>
+  <rte>
+    <name>Route</name>
+    <rtept lat="47.0" lon="8.0"/>
+    <rtept lat="47.1" lon="8.1"><ele>400</ele></rtept>
+  </rte>
+  <rte><name>Empty</name></rte>
+  <trk>
+    <name>Track</name>
+    <trkseg>
+      <trkpt lat="47.0" lon="8.0"><time>2024-01-01T10:00:00+02:00</time></trkpt>
+      <trkpt lat="47.1" lon="8.1"><ele>401</ele></trkpt>
+      <trkpt lat="47.2" lon="8.2"><time>2024-01-01T10:30:00+02:00</time></trkpt>
+    </trkseg>
+    <trkseg></trkseg>
+  </trk>
+</gpx>
+"""
+
+    def test_convert(self, tmp_path: Path) -> None:
+        """Test waypoints, routes and track segments are converted."""
+        from mtu.converters.gpx import GPXConverter
+
+        path = tmp_path / "data.gpx"
+        path.write_text(self.GPX, encoding="utf-8")
+
+        result = GPXConverter().convert(path)
+
+        features = result.geojson["features"]
+        assert [f["geometry"]["type"] for f in features] == ["Point", "LineString", "LineString"]
+        assert features[0]["geometry"]["coordinates"] == [8.5, 47.5, 410.5]
+        assert features[0]["properties"] == {
+            "type": "waypoint",
+            "name": "Summit",
+            "elevation": 410.5,
+            "time": "2024-01-01T10:00:00.500000+00:00",
+        }
+        assert features[1]["geometry"]["coordinates"] == [[8.0, 47.0], [8.1, 47.1, 400.0]]
+        assert features[1]["properties"] == {"type": "route", "name": "Route"}
+        assert features[2]["geometry"]["coordinates"] == [
+            [8.0, 47.0],
+            [8.1, 47.1, 401.0],
+            [8.2, 47.2],
+        ]
+        assert features[2]["properties"] == {
+            "type": "track",
+            "name": "Track",
+            "segment": 0,
+            "start_time": "2024-01-01T10:00:00+02:00",
+            "end_time": "2024-01-01T10:30:00+02:00",
+            "duration_seconds": 1800.0,
+        }
+        assert result.metadata == {"tracks": 1, "routes": 1, "waypoints": 1}
+        assert result.warnings == [
+            "Empty route 'Empty' skipped",
+            "Empty track segment in 'Track' skipped",
+        ]
+
+    def test_convert_restores_gc(self, tmp_path: Path) -> None:
+        """Test the garbage collector is re-enabled after converting."""
+        from mtu.converters.gpx import GPXConverter
+
+        path = tmp_path / "data.gpx"
+        path.write_text(self.GPX, encoding="utf-8")
+
+        assert gc.isenabled()
+        GPXConverter().convert(path)
+        assert gc.isenabled()
+
+        path.write_text("<gpx>", encoding="utf-8")
+        with pytest.raises(ValueError):
+            GPXConverter().convert(path)
+        assert gc.isenabled()
+
+    def test_iter_geojsonl_matches_convert(self, tmp_path: Path) -> None:
+        """Test line-delimited output has the same features as convert()."""
+        from mtu.converters.gpx import GPXConverter
+
+        path = tmp_path / "data.gpx"
+        path.write_text(self.GPX, encoding="utf-8")
+        converter = GPXConverter()
+
+        count, lines = converter.iter_geojsonl(path, include_waypoints=False)
+        features = [json.loads(line) for line in lines]
+
+        assert count == 2
+        assert features == converter.convert(path, include_waypoints=False).geojson["features"]
+
+        _, lines = converter.iter_geojsonl(path, precision=0)
+        assert json.loads(next(lines))["geometry"]["coordinates"] == [8.0, 48.0, 410.0]
+
+    def test_format_time_matches_isoformat(self) -> None:
+        """Test the formatting shortcut gives the same strings as isoformat()."""
+        from mtu.converters.gpx import _format_time, _parse_time
+
+        for text in [
+            "2024-01-01T10:00:00Z",
+            "2024-01-01T10:00:00.5Z",
+            "2024-01-01T10:00:00",
+            "2024-01-01T10:00:00+02:00",
+            "2024-01-01T10:00:00-00:00",
+            "2024-01-01 10:00:00+00:00",
+        ]:
+            assert _format_time(text) == _parse_time(text).isoformat()
+
+    def test_convert_gpx_1_0(self, tmp_path: Path) -> None:
+        """Test GPX 1.0 files are read with their own namespace."""
+        from mtu.converters.gpx import GPXConverter
+
+        path = tmp_path / "data.gpx"
+        path.write_text(
+            self.GPX.replace("GPX/1/1", "GPX/1/0").replace('version="1.1"', 'version="1.0"'),
+            encoding="utf-8",
+        )
+
+        result = GPXConverter().convert(path, include_routes=False)
+
+        assert result.feature_count == 2
+        assert result.metadata == {"tracks": 1, "routes": 0, "waypoints": 1}
+
+    def test_convert_invalid_xml(self, tmp_path: Path) -> None:
+        """Test malformed files raise ValueError."""
+        from mtu.converters.gpx import GPXConverter
+
+        path = tmp_path / "data.gpx"
+        path.write_text("<gpx><wpt lat='1' lon='2'>", encoding="utf-8")
+
+        with pytest.raises(ValueError, match="Failed to parse GPX"):
+            GPXConverter().convert(path)
+
+
+class TestShapefileConverter:
+    """Test Shapefile converter."""
+
+    @staticmethod
+    def write_shapefile(path: Path) -> Path:
+        """Write a small polygon shapefile with a null shape."""
+        shapefile = pytest.importorskip("shapefile")
+
+        with shapefile.Writer(str(path), shapeType=shapefile.POLYGON) as w:
+            w.field("name", "C", 20)
+            w.field("count", "N", 8, 0)
+            w.poly([[[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]])
+            w.record("a", 1)
+            w.null()
+            w.record("b", 2)
+            w.poly([[[2, 2], [2, 3], [3, 3], [2, 2]]])
+            w.record("c", 3)
+        return path.with_suffix(".shp")
+
+    def test_convert(self, tmp_path: Path) -> None:
+        """Test shapes and records are converted and null shapes skipped."""
+        from mtu.converters.shapefile import ShapefileConverter
+
+        path = self.write_shapefile(tmp_path / "data")
+
+        assert gc.isenabled()
+        result = ShapefileConverter().convert(path)
+        assert gc.isenabled()
+
+        features = result.geojson["features"]
+        assert [f["properties"] for f in features] == [
+            {"name": "a", "count": 1},
+            {"name": "c", "count": 3},
+        ]
+        assert features[0]["geometry"]["type"] == "Polygon"
+        assert "Feature with null geometry skipped" in result.warnings
+
+    def test_iter_geojsonl_matches_convert(self, tmp_path: Path) -> None:
+        """Test serial and parallel line-delimited output match convert()."""
+        from mtu.converters.shapefile import ShapefileConverter
+
+        path = self.write_shapefile(tmp_path / "data")
+        converter = ShapefileConverter()
+        # pyshp returns positions as tuples
+        expected = json.loads(json.dumps(converter.convert(path).geojson["features"]))
+
+        for workers in (1, 2):
+            with (
+                patch("mtu.converters.shapefile.PARALLEL_MIN_FEATURES", 0),
+                patch("mtu.converters.shapefile.WORKER_CHUNK_SIZE", 1),
+            ):
+                count, lines = converter.iter_geojsonl(path, workers=workers)
+                features = [json.loads(line) for line in lines]
+            assert count == 3
+            assert features == expected
+
+        # Without workers, features are encoded in this process
+        with (
+            patch("mtu.converters.shapefile.PARALLEL_MIN_FEATURES", 0),
+            patch("mtu.converters.shapefile.iter_encoded_parallel") as parallel,
+        ):
+            _, lines = converter.iter_geojsonl(path)
+            assert [json.loads(line) for line in lines] == expected
+        parallel.assert_not_called()
+
+        with pytest.raises(ValueError, match="Zipped"):
+            converter.iter_geojsonl(tmp_path / "data.zip")
+
+    def test_convert_zip(self, tmp_path: Path) -> None:
+        """Test zipped shapefiles are read without extracting them."""
+        from mtu.converters.shapefile import ShapefileConverter
+
+        shp = self.write_shapefile(tmp_path / "data")
+        archive = tmp_path / "data.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            for suffix in (".shp", ".shx", ".dbf"):
+                zf.write(shp.with_suffix(suffix), f"layer/DATA{suffix.upper()}")
+            zf.writestr("layer/DATA.prj", 'GEOGCS["WGS 84"]')
+
+        converter = ShapefileConverter()
+        expected = converter.convert(shp)
+        with patch("tempfile.TemporaryDirectory", side_effect=AssertionError("extracted")):
+            for result in (
+                converter.convert(archive),
+                converter.convert_from_bytes(archive.read_bytes()),
+            ):
+                assert result.geojson == expected.geojson
+                assert result.warnings == ["Feature with null geometry skipped"]
@@ -0,0 +1,117 @@
+"""Tests for the JSON helpers."""
+
+import gc
+import io
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mtu import _json
+
+
+class TestJSON:
+    """Test JSON encoding and decoding."""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Test data survives dumps/load through a file and a stream."""
+        data = {"name": "Zürich", "values": [1, 2.5, None, True]}
+        path = tmp_path / "data.json"
+        path.write_bytes(_json.dumps(data))
+
+        assert _json.load(path) == data
+        assert _json.load(str(path)) == data
+        assert _json.load(io.BytesIO(_json.dumps(data, pretty=True))) == data
+
+    def test_load_empty_file(self, tmp_path: Path) -> None:
+        """Test files that can't be memory mapped are still read."""
+        path = tmp_path / "empty.json"
+        path.write_bytes(b"")
+        for orjson in (_json.orjson, None):
+            with patch("mtu._json.orjson", orjson):
+                with pytest.raises(_json.JSONDecodeError):
+                    _json.load(path)
+
+    def test_stdlib_fallback(self) -> None:
+        """Test the stdlib json module is used without orjson."""
+        data = {"name": "Zürich", "values": [1, 2]}
+        with patch("mtu._json.orjson", None):
+            assert _json.dumps(data) == json.dumps(
+                data, separators=(",", ":"), ensure_ascii=False
+            ).encode("utf-8")
+            assert b'\n  "name"' in _json.dumps(data, pretty=True)
+            assert _json.loads(b'{"a": 1}') == {"a": 1}
+
+    def test_loads_restores_gc(self) -> None:
+        """Test the garbage collector state is restored after parsing."""
+        assert gc.isenabled()
+        _json.loads(b'{"a": [1, 2]}')
+        assert gc.isenabled()
+        with pytest.raises(_json.JSONDecodeError):
+            _json.loads(b"{")
+        assert gc.isenabled()
+
+        gc.disable()
+        try:
+            _json.loads(b"{}")
+            assert not gc.isenabled()
+        finally:
+            gc.enable()
+
+    def test_decode_error(self) -> None:
+        """Test invalid JSON raises the stdlib-compatible error."""
+        for orjson in (_json.orjson, None):
+            with patch("mtu._json.orjson", orjson):
+                with pytest.raises(_json.JSONDecodeError):
+                    _json.loads(b"{")
+
+    def test_round_coordinates(self) -> None:
+        """Test coordinates are rounded without touching the input."""
+        polygon = [[[0.123456, 1.0], [1.987654, 0.0], [1, 1], [0.123456, 1.0]]]
+        geojson = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Polygon", "coordinates": polygon},
+                    "properties": {"value": 0.123456},
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {
+                        "type": "GeometryCollection",
+                        "geometries": [{"type": "Point", "coordinates": [0.55555, 1.44444, 9.1]}],
+                    },
+                    "properties": {},
+                },
+                {"type": "Feature", "geometry": None, "properties": {}},
+            ],
+        }
+
+        rounded = _json.round_coordinates(geojson, 2)
+
+        features = rounded["features"]
+        assert features[0]["geometry"]["coordinates"] == [
+            [[0.12, 1.0], [1.99, 0.0], [1, 1], [0.12, 1.0]]
+        ]
+        assert features[0]["properties"] == {"value": 0.123456}
+        assert features[1]["geometry"]["geometries"][0]["coordinates"] == [0.56, 1.44, 9.1]
+        assert features[2]["geometry"] is None
+        assert geojson["features"][0]["geometry"]["coordinates"] is polygon
+        assert polygon[0][0] == [0.123456, 1.0]
+
+        line = {"type": "LineString", "coordinates": ((0.123456, 1.0), (1.987654, 0.0))}
+        assert _json.round_coordinates(line, 2)["coordinates"] == [[0.12, 1.0], [1.99, 0.0]]
+
+    def test_dumps_rounded(self) -> None:
+        """Test features are encoded with rounded coordinates."""
+        feature = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [0.123456, 1.987654]},
+            "properties": {"value": 0.123456},
+        }
+        assert _json.loads(_json.dumps_rounded(feature, 2)) == {
+            **feature,
+            "geometry": {"type": "Point", "coordinates": [0.12, 1.99]},
+        }
@@ -0,0 +1,35 @@
+"""Tests for the top-level package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import mtu
+
+
+class TestPackage:
+    """Test top-level package exports."""
+
+    def test_lazy_exports(self) -> None:
+        """Test that public names resolve to their submodule objects."""
+        from mtu.uploader import TilesetUploader
+        from mtu.validators import validate_geojson
+
+        assert mtu.TilesetUploader is TilesetUploader
+        assert mtu.validate_geojson is validate_geojson
+        assert set(mtu.__all__) <= set(dir(mtu))
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError, match="no attribute"):
+            mtu.does_not_exist
+
+    def test_version_import_is_lightweight(self) -> None:
+        """Test that importing the package does not load submodules."""
+        code = (
+            "import sys, mtu; mtu.__version__; "
+            "assert 'mtu.uploader' not in sys.modules; "
+            "assert 'mtu.converters' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,11 +1,18 @@
 """Tests for the uploader module."""
 
+import gzip
+import io
+import json
 import os
-from unittest.mock import patch
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, call, patch
 
 import pytest
+import requests
 
-from mtu.uploader import TilesetConfig, TilesetUploader, UploadResult
+from mtu.uploader import TilesetConfig, TilesetUploader, UploadResult, _url_extension
 
 
 class TestTilesetConfig:
@@ -178,6 +185,412 @@ class TestTilesetUploader:
             assert "GeoJSON" in format_names
             assert "TopoJSON" in format_names
 
+    def test_iter_source_files(self, tmp_path: Path) -> None:
+        """Test splitting features into line-delimited source files."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader()
+            features = [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [i, i]},
+                    "properties": {"i": i},
+                }
+                for i in range(5)
+            ]
+            geojson = {"type": "FeatureCollection", "features": features}
+
+            count, lines = uploader._geojson_lines(geojson)
+            # Batches smaller than a part, so parts are written in several batches
+            with patch("mtu.uploader.WRITE_BATCH_SIZE", 1):
+                paths = list(uploader._iter_source_files(lines, count, 3, tmp_path))
+            assert len(paths) == 3
+            lines = [
+                json.loads(line)
+                for path in paths
+                for line in path.read_text(encoding="utf-8").splitlines()
+            ]
+            assert lines == features
+
+    def test_iter_source_files_caps_parts(self, tmp_path: Path) -> None:
+        """Test that no more files than features are written."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader()
+            geojson = {
+                "type": "FeatureCollection",
+                "features": [{"type": "Feature", "geometry": None, "properties": {}}],
+            }
+
+            count, lines = uploader._geojson_lines(geojson)
+            paths = list(uploader._iter_source_files(lines, count, 4, tmp_path))
+            assert len(paths) == 1
+
+            # Fewer lines than expected don't produce empty trailing files
+            paths = list(uploader._iter_source_files([b"{}"] * 2, 6, 3, tmp_path))
+            assert len(paths) == 1
+            assert paths[0].read_bytes() == b"{}\n{}\n"
+
+    def test_iter_source_files_compressed(self, tmp_path: Path) -> None:
+        """Test source files are gzipped when compression is enabled."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader(compress=True)
+            paths = list(uploader._iter_source_files([b"{}"] * 3, 3, 2, tmp_path))
+
+            assert [path.name for path in paths] == ["part-0.geojsonl.gz", "part-1.geojsonl.gz"]
+            assert b"".join(gzip.decompress(path.read_bytes()) for path in paths) == b"{}\n" * 3
+
+    def test_upload_source_replaces_then_appends(self) -> None:
+        """Test the first source file replaces and the rest append."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader(upload_concurrency=3)
+            paths = [Path("a"), Path("b"), Path("c")]
+
+            with patch.object(uploader, "_upload_source_file") as upload_file:
+                uploader._upload_source(paths, "source")
+
+            assert upload_file.call_args_list[0] == call(Path("a"), "source", replace=True)
+            assert sorted(upload_file.call_args_list[1:]) == [
+                call(Path("b"), "source", False),
+                call(Path("c"), "source", False),
+            ]
+
+    def test_upload_source_waits_for_all_files(self) -> None:
+        """Test nothing is uploaded if writing a later source file fails."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader(upload_concurrency=2)
+
+            def source_files() -> Iterator[Path]:
+                yield Path("a")
+                raise ValueError("Malformed line")
+
+            with patch.object(uploader, "_upload_source_file") as upload_file:
+                with pytest.raises(ValueError, match="Malformed line"):
+                    uploader._upload_source(source_files(), "source")
+
+            upload_file.assert_not_called()
+
+    def test_upload_keeps_source_on_conversion_error(self, tmp_path: Path) -> None:
+        """Test a bad line near the end of a GeoJSONSeq file fails before any upload."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader(validate_geometry=False, upload_concurrency=2)
+            source = tmp_path / "data.geojsonl"
+            feature = b'{"type":"Feature","geometry":null,"properties":{}}\n'
+            source.write_bytes(feature * 3 + b"{not json\n")
+
+            with patch.object(uploader, "_upload_source_file") as upload_file:
+                result = uploader.upload_from_file(source, TilesetConfig("test", "Test"))
+
+            assert not result.success
+            assert result.error
+            upload_file.assert_not_called()
+
+    def test_upload_without_validation_skips_feature_collection(self, tmp_path: Path) -> None:
+        """Test formats with line-delimited output bypass convert() without validation."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader(validate_geometry=False)
+            source = tmp_path / "data.geojson"
+            source.write_text("{}", encoding="utf-8")
+            converter = MagicMock(supports_geojsonl=True)
+            converter.iter_geojsonl.return_value = (1, iter([b'{"type":"Feature"}']))
+            uploaded: list[bytes] = []
+
+            with (
+                patch("mtu.uploader.get_converter", return_value=converter),
+                patch.object(
+                    uploader,
+                    "_upload_source_file",
+                    side_effect=lambda path, *args, **kwargs: uploaded.append(path.read_bytes()),
+                ),
+                patch.object(uploader, "_tileset_exists", return_value=True),
+                patch.object(uploader, "_update_recipe"),
+                patch.object(uploader, "_publish_tileset", return_value="job"),
+                patch.object(uploader, "_wait_for_job", return_value="success"),
+            ):
+                result = uploader.upload_from_file(
+                    source, TilesetConfig(tileset_id="test", tileset_name="Test")
+                )
+
+            assert result.success, result.error
+            converter.convert.assert_not_called()
+            assert uploaded == [b'{"type":"Feature"}\n']
+
+    def test_context_manager_closes_session(self) -> None:
+        """Test the HTTP session is closed when leaving the context."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader()
+            with patch.object(uploader.session, "close") as close:
+                with uploader:
+                    close.assert_not_called()
+                close.assert_called_once()
+
+    def test_session_pool_covers_concurrent_uploads(self) -> None:
+        """Test the session keeps enough connections alive for parallel uploads."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader(upload_concurrency=10)
+            adapter = uploader.session.get_adapter("https://api.mapbox.com")
+            assert adapter._pool_maxsize >= 4 * uploader.upload_concurrency
+
+    def test_upload_source_file_retries_server_errors(self, tmp_path: Path) -> None:
+        """Test source file uploads retry on server errors."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader()
+            source_file = tmp_path / "part.geojsonl"
+            source_file.write_text("{}\n", encoding="utf-8")
+
+            responses = [MagicMock(status_code=503, text="busy"), MagicMock(status_code=200)]
+            with (
+                patch.object(uploader.session, "request", side_effect=responses) as request,
+                patch("mtu.uploader.time.sleep"),
+            ):
+                uploader._upload_source_file(source_file, "source", replace=True)
+
+            assert request.call_count == 2
+            assert request.call_args.args[0] == "PUT"
+
+    def test_upload_source_file_fails_on_client_error(self, tmp_path: Path) -> None:
+        """Test source file uploads don't retry client errors."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader()
+            source_file = tmp_path / "part.geojsonl"
+            source_file.write_text("{}\n", encoding="utf-8")
+
+            response = MagicMock(status_code=401, text="unauthorized")
+            with patch.object(uploader.session, "request", return_value=response) as request:
+                with pytest.raises(RuntimeError, match="unauthorized"):
+                    uploader._upload_source_file(source_file, "source", replace=False)
+
+            assert request.call_count == 1
+
+    def test_tileset_exists_is_cached(self) -> None:
+        """Test tilesets found to exist aren't looked up again."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader()
+            responses = [MagicMock(status_code=404), MagicMock(status_code=200)]
+            with patch.object(uploader.session, "request", side_effect=responses) as request:
+                assert not uploader._tileset_exists("testuser.test")
+                assert uploader._tileset_exists("testuser.test")
+                assert uploader._tileset_exists("testuser.test")
+
+            assert request.call_count == 2
+            assert request.call_args.args == (
+                "GET",
+                "https://api.mapbox.com/tilesets/v1/testuser.test/status",
+            )
+
+    def test_wait_for_job_polls_the_job(self) -> None:
+        """Test job polling reads the job stage from the API."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader()
+            responses = [
+                MagicMock(status_code=200, content=b'{"stage": "processing"}'),
+                requests.ConnectionError("reset"),
+                MagicMock(status_code=429, headers={"Retry-After": "20"}),
+                MagicMock(status_code=200, content=b'{"stage": "failed", "errors": ["bad"]}'),
+            ]
+            with (
+                patch.object(uploader.session, "request", side_effect=responses) as request,
+                patch("mtu.uploader.time.sleep") as sleep,
+            ):
+                status = uploader._wait_for_job("testuser.test", "job1")
+
+            assert status == "failed: bad"
+            # Backs off from one second, and waits as long as a rate limit asks
+            delays = [c.args[0] for c in sleep.call_args_list]
+            assert 1 <= delays[0] <= 1.1
+            assert 1.5 <= delays[1] <= 1.65
+            assert delays[2] == 20
+            assert request.call_args.args[1].endswith("/tilesets/v1/testuser.test/jobs/job1")
+
+    def test_create_tileset(self) -> None:
+        """Test tilesets are created with a single API request."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader()
+            config = TilesetConfig(
+                tileset_id="test",
+                tileset_name="Test",
+                attribution='[{"text": "© Test", "link": "https://example.com"}]',
+            )
+            recipe = uploader._build_recipe(config)
+
+            with patch.object(
+                uploader.session, "request", return_value=MagicMock(ok=True)
+            ) as request:
+                uploader._create_tileset("testuser.test", recipe, config)
+                assert uploader._tileset_exists("testuser.test")
+
+            assert request.call_count == 1
+            assert request.call_args.args == (
+                "POST",
+                "https://api.mapbox.com/tilesets/v1/testuser.test",
+            )
+            assert json.loads(request.call_args.kwargs["data"]) == {
+                "recipe": recipe,
+                "name": "Test",
+                "attribution": [{"text": "© Test", "link": "https://example.com"}],
+            }
+
+    def test_list_tilesets_follows_pages(self) -> None:
+        """Test listings collect every page linked by the API."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader()
+            next_url = "https://api.mapbox.com/tilesets/v1/testuser?start=b"
+            pages = [
+                MagicMock(ok=True, content=b'[{"id": "a"}]', links={"next": {"url": next_url}}),
+                MagicMock(ok=True, content=b'[{"id": "b"}]', links={}),
+            ]
+            with patch.object(uploader.session, "get", side_effect=pages) as get:
+                assert uploader.list_tilesets() == [{"id": "a"}, {"id": "b"}]
+
+            assert get.call_args.args == (next_url,)
+
+    def test_url_extension(self) -> None:
+        """Test source formats are recognized from URLs regardless of case."""
+        assert _url_extension("https://example.com/Roads.SHP?token=x") == ".shp"
+        assert _url_extension("https://example.com/points.geojsonl") == ".geojsonl"
+        assert _url_extension("https://example.com/data.geojson") == ".geojson"
+        assert _url_extension("https://example.com/download?id=1") == ".geojson"
+        assert _url_extension("https://example.com/roads.shp.zip") == ".zip"
+        assert _url_extension("https://example.com/download?name=roads.shp") == ".geojson"
+        assert _url_extension("https://example.com/data.gpx/points.geojson") == ".geojson"
+        assert _url_extension("https://shp.example.com/data.gpkg#layer.kml") == ".gpkg"
+
+    def test_upload_from_url_reuses_download_directory(self) -> None:
+        """Test downloads share one directory that is removed on close."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader()
+            config = TilesetConfig(tileset_id="test", tileset_name="Test")
+            downloads: list[Path] = []
+
+            def download(url: str, path: Path) -> None:
+                path.write_text("{}", encoding="utf-8")
+                downloads.append(path)
+
+            with (
+                patch.object(uploader, "_download_file", side_effect=download),
+                patch.object(uploader, "upload_from_file"),
+            ):
+                uploader.upload_from_url("https://example.com/a.geojson", config)
+                uploader.upload_from_url("https://example.com/b.geojson", config)
+
+            assert downloads[0] != downloads[1]
+            assert downloads[0].parent == downloads[1].parent
+            assert not any(path.exists() for path in downloads)
+            assert downloads[0].parent.is_dir()
+            uploader.close()
+            assert not downloads[0].parent.exists()
+
+    def test_upload_from_url_streams_geojson(self) -> None:
+        """Test GeoJSON URLs are converted straight from the response."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader(validate_geometry=False)
+            config = TilesetConfig(tileset_id="test", tileset_name="Test")
+            geojson = {"type": "Point", "coordinates": [1, 2]}
+
+            response = MagicMock()
+            response.__enter__.return_value = response
+            response.raw = io.BytesIO(json.dumps(geojson).encode("utf-8"))
+
+            with (
+                patch.object(uploader.session, "get", return_value=response),
+                patch.object(uploader, "_download_file") as download,
+            ):
+                result = uploader.upload_from_url(
+                    "https://example.com/data.geojson", config, dry_run=True, stream=True
+                )
+
+            download.assert_not_called()
+            assert result.success
+            assert result.conversion_result is not None
+            assert result.conversion_result.feature_count == 1
+
+    def test_upload_many_runs_jobs_concurrently(self, tmp_path: Path) -> None:
+        """Test uploads overlap and their results keep the order of the jobs."""
+        with patch.dict(
+            os.environ,
+            {"MAPBOX_ACCESS_TOKEN": "test", "MAPBOX_USERNAME": "testuser"},
+        ):
+            uploader = TilesetUploader()
+            configs = [TilesetConfig(tileset_id=f"t{i}", tileset_name="T") for i in range(3)]
+            started = threading.Barrier(2, timeout=5)
+
+            def upload(source: object, config: TilesetConfig, *args: object, **kwargs: object):
+                # Both jobs have to be running for the barrier to open
+                started.wait()
+                return UploadResult(success=True, tileset_id=config.tileset_id, source_id=None)
+
+            with (
+                patch.object(uploader, "upload_from_url", side_effect=upload) as from_url,
+                patch.object(uploader, "upload_from_file", side_effect=upload) as from_file,
+            ):
+                results = uploader.upload_many(
+                    [
+                        ("https://example.com/a.geojson", configs[0]),
+                        (tmp_path / "b.geojson", configs[1]),
+                    ],
+                    max_workers=2,
+                )
+
+                from_url.side_effect = requests.ConnectionError("unreachable")
+                failed = uploader.upload_many([("https://example.com/c.geojson", configs[2])])
+
+            assert [r.tileset_id for r in results] == ["t0", "t1"]
+            assert all(r.success for r in results)
+            assert from_url.call_count == 2
+            from_file.assert_called_once()
+            assert not failed[0].success
+            assert failed[0].tileset_id == "testuser.t2"
+            assert failed[0].error == "unreachable"
+
 
 class TestUploadResult:
     """Test UploadResult dataclass."""
@@ -1,13 +1,35 @@
 """Tests for the validators module."""
 
+from pathlib import Path
+from typing import Any
+
+import pytest
+
 from mtu.validators import (
     GeometryValidator,
     ValidationResult,
     ValidationWarning,
+    is_well_formed,
     validate_geojson,
 )
 
 
+def _warnings(result: ValidationResult) -> list[tuple[Any, ...]]:
+    """List the warnings of a result for comparison."""
+    return [(w.feature_index, w.warning_type, w.message, w.severity) for w in result.warnings]
+
+
+def _validate_one_by_one(
+    validator: GeometryValidator, features: list[dict[str, Any]]
+) -> list[tuple[Any, ...]]:
+    """Validate features one at a time, without the vectorized checks across features."""
+    warnings = []
+    for i, feature in enumerate(features):
+        result = validator.validate(feature)
+        warnings.extend((i, *warning[1:]) for warning in _warnings(result))
+    return warnings
+
+
 class TestValidationResult:
     """Test ValidationResult dataclass."""
 
@@ -286,6 +308,216 @@ class TestGeometryValidator:
         assert result.valid
         assert result.feature_count == 1
 
+    def test_validate_geometry_collection_members(self) -> None:
+        """Test collection members are checked with the parts of the collection."""
+        pytest.importorskip("shapely")
+        geojson = {
+            "type": "GeometryCollection",
+            "geometries": [
+                {"type": "Point", "coordinates": [0, 0]},
+                {
+                    "type": "GeometryCollection",
+                    "geometries": [
+                        {
+                            "type": "Polygon",
+                            "coordinates": [[[0, 0], [1, 1], [1, 0], [0, 1], [0, 0]]],
+                        }
+                    ],
+                },
+            ],
+        }
+
+        result = GeometryValidator().validate(geojson)
+
+        # The self-intersecting polygon is reported for itself and both collections
+        assert len(result.get_warnings_by_type("invalid_geometry")) == 3
+
+    def test_validate_skips_coordinates_within_bounds(self) -> None:
+        """Test in-range features skip per-coordinate checks."""
+        pytest.importorskip("shapely")
+        geojson = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+                    "properties": {},
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "LineString", "coordinates": [[0, 0], [0, 95]]},
+                    "properties": {},
+                },
+            ],
+        }
+
+        validator = GeometryValidator()
+        result = validator.validate(geojson)
+
+        assert _warnings(result) == _validate_one_by_one(validator, geojson["features"])
+        out_of_bounds = result.get_warnings_by_type("out_of_bounds")
+        assert [w.feature_index for w in out_of_bounds] == [1]
+
+    def test_validate_checks_coordinates_the_bounds_miss(self) -> None:
+        """Test coordinates left out of the bounds still get their warnings."""
+        pytest.importorskip("shapely")
+        nan = float("nan")
+        geometries = [
+            # Bounds skip NaN
+            {"type": "LineString", "coordinates": [[0, 0], [nan, 1], [2, 2]]},
+            {"type": "Point", "coordinates": [1, nan]},
+            # The bounds of a polygon are the bounds of its shell
+            {
+                "type": "Polygon",
+                "coordinates": [
+                    [[0, 0], [1, 0], [1, 1], [0, 0]],
+                    [[190, 0], [191, 0], [191, 1], [190, 0]],
+                ],
+            },
+            # shape() leaves out empty members
+            {
+                "type": "GeometryCollection",
+                "geometries": [
+                    {"type": "Point", "coordinates": [0, 0]},
+                    {"type": "Point", "coordinates": []},
+                ],
+            },
+        ]
+        features = [{"type": "Feature", "geometry": g, "properties": {}} for g in geometries]
+
+        validator = GeometryValidator()
+        result = validator.validate({"type": "FeatureCollection", "features": features})
+
+        assert _warnings(result) == _validate_one_by_one(validator, features)
+        out_of_bounds = result.get_warnings_by_type("out_of_bounds")
+        assert [w.message.split(" is")[0] for w in out_of_bounds] == [
+            "Longitude nan",
+            "Latitude nan",
+            "Longitude 190",
+            "Longitude 191",
+            "Longitude 191",
+            "Longitude 190",
+        ]
+        assert [w.feature_index for w in result.get_warnings_by_type("invalid_coordinate")] == [3]
+
+    def test_validate_coordinates_reports_offenders(self) -> None:
+        """Test out-of-range and malformed coordinates are reported in order."""
+        geojson = {
+            "type": "LineString",
+            "coordinates": [[0, 0], [200, 0], [1, 1], [2], [3, 95]],
+        }
+
+        result = GeometryValidator(check_validity=False).validate(geojson)
+
+        assert [w.message for w in result.warnings] == [
+            "Longitude 200 is out of range [-180.0, 180.0]",
+            "Invalid coordinate: [2]",
+            "Latitude 95 is out of range [-90.0, 90.0]",
+        ]
+
+    def test_validate_checks_validity_in_bulk(self) -> None:
+        """Test the vectorized validity checks report the same as one by one."""
+        pytest.importorskip("shapely")
+        geometries = [
+            {"type": "Point", "coordinates": [0, 0]},
+            {"type": "Polygon", "coordinates": [[[0, 0], [1, 1], [1, 0], [0, 1], [0, 0]]]},
+            {"type": "LineString", "coordinates": []},
+            # Closed when it is built, as shape() does
+            {"type": "Polygon", "coordinates": [[[0, 0], [0, 1], [1, 1], [1, 0]]]},
+        ]
+        geojson = {
+            "type": "FeatureCollection",
+            "features": [{"type": "Feature", "geometry": g, "properties": {}} for g in geometries],
+        }
+
+        validator = GeometryValidator()
+        result = validator.validate(geojson)
+
+        assert _warnings(result) == _validate_one_by_one(validator, geojson["features"])
+        assert [w.feature_index for w in result.get_warnings_by_type("invalid_geometry")] == [1]
+        assert [w.feature_index for w in result.get_warnings_by_type("empty_geometry")] == [2]
+        assert [w.feature_index for w in result.get_warnings_by_type("unclosed_ring")] == [3]
+
+    def test_validate_builds_geometries_from_coordinates(self) -> None:
+        """Test geometries built by type give the same warnings as one by one."""
+        pytest.importorskip("shapely")
+        ring = [[0, 0], [1, 0], [1, 1], [0, 0]]
+        geometries = [
+            {"type": "Point", "coordinates": [0, 0]},
+            {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+            {"type": "LineString", "coordinates": [[0, 0, 1], [1, 1, 1]]},
+            {"type": "Polygon", "coordinates": [[[0, 0], [1, 1], [1, 0], [0, 1], [0, 0]]]},
+            # Empty parts, which shapely.from_ragged_array can't build
+            {"type": "Polygon", "coordinates": [[], ring]},
+            {"type": "Polygon", "coordinates": [ring, []]},
+            {"type": "MultiPolygon", "coordinates": [[ring], []]},
+            {"type": "MultiLineString", "coordinates": [[]]},
+            {"type": "LineString", "coordinates": []},
+            # Mixed dimensions, which shape() rejects
+            {"type": "LineString", "coordinates": [[0, 0, 1], [1, 1]]},
+            {"type": "MultiPoint", "coordinates": [[0, 0, 1], [1, 1]]},
+        ]
+        features = [{"type": "Feature", "geometry": g, "properties": {}} for g in geometries]
+
+        validator = GeometryValidator()
+        result = validator.validate({"type": "FeatureCollection", "features": features})
+
+        assert _warnings(result) == _validate_one_by_one(validator, features)
+        errors = result.get_warnings_by_type("validation_error")
+        assert [w.feature_index for w in result.get_warnings_by_type("invalid_geometry")] == [3]
+        assert [w.feature_index for w in errors] == [4, 6, 9]
+        assert result.valid_feature_count == 6
+
+    def test_validate_matches_one_by_one(self) -> None:
+        """Test malformed input gives the same warnings as validating features one by one."""
+        pytest.importorskip("shapely")
+        nan = float("nan")
+        ring = [[0, 0], [1, 0], [1, 1], [0, 0]]
+        geometries = [
+            {"type": "Polygon", "coordinates": [[], ring]},
+            {"type": "MultiPolygon", "coordinates": [[], [ring]]},
+            {"type": "MultiPolygon", "coordinates": [[[]]]},
+            {"type": "Polygon", "coordinates": [[[0, 0], [200, 0], [1, 1]]]},
+            {"type": "Polygon", "coordinates": [[[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]]},
+            {"type": "LineString", "coordinates": [[0, 0], [1, nan], [2, 2]]},
+            {"type": "LineString", "coordinates": [[0, 0], [float("inf"), 1]]},
+            {"type": "LineString", "coordinates": [[0, 0, 0], [1, 1], [1, 1]]},
+            {"type": "MultiLineString", "coordinates": [[[0, 0], [1, 1]], [[0, 0, 1], [1, 1, 1]]]},
+            {"type": "MultiPoint", "coordinates": [[0, 0], [1, 1, 1], [nan, nan]]},
+            {"type": "MultiPoint", "coordinates": [[0, 0], [1], [1, 1]]},
+            {"type": "Point", "coordinates": [1, 2, 3, 4]},
+            {
+                "type": "GeometryCollection",
+                "geometries": [
+                    {"type": "Polygon", "coordinates": [[]]},
+                    {"type": "LineString", "coordinates": [[0, 0], [0, 95]]},
+                ],
+            },
+        ]
+        features = [{"type": "Feature", "geometry": g, "properties": {}} for g in geometries]
+
+        for options in ({}, {"check_winding": True}):
+            validator = GeometryValidator(**options)
+            result = validator.validate({"type": "FeatureCollection", "features": features})
+            assert _warnings(result) == _validate_one_by_one(validator, features)
+
+    def test_validate_winding(self) -> None:
+        """Test ring orientation is reported for exteriors and holes."""
+        counterclockwise = [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]]
+        hole = [[1, 1, 5], [2, 1, 5], [2, 2, 5], [1, 2, 5], [1, 1, 5]]
+        validator = GeometryValidator(check_validity=False)
+
+        result = validator.validate({"type": "Polygon", "coordinates": [counterclockwise, hole]})
+        assert [w.message for w in result.get_warnings_by_type("wrong_winding")] == [
+            "Exterior ring should be clockwise (RFC 7946)",
+        ]
+
+        clockwise = counterclockwise[::-1]
+        result = validator.validate({"type": "Polygon", "coordinates": [clockwise, hole[::-1]]})
+        assert [w.message for w in result.get_warnings_by_type("wrong_winding")] == [
+            "Hole 1 should be counter-clockwise (RFC 7946)",
+        ]
+
     def test_validate_max_warnings_limit(self) -> None:
         """Test max warnings limit."""
         validator = GeometryValidator(max_warnings=5)
@@ -364,3 +596,82 @@ class TestValidateGeoJSONFunction:
         result = validate_geojson(geojson, check_coordinates=False)
         # No out_of_bounds because we disabled coordinate checks
         assert len(result.get_warnings_by_type("out_of_bounds")) == 0
+
+
+class TestIsWellFormed:
+    """Test the structural GeoJSON check."""
+
+    def test_well_formed(self) -> None:
+        """Test structurally valid GeoJSON passes."""
+        polygon = [[[0, 0], [1, 0], [1, 1], [0, 0]]]
+        geojson = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "Point", "coordinates": [0, 0]},
+                    "properties": {},
+                },
+                {
+                    "type": "Feature",
+                    "geometry": {"type": "MultiPolygon", "coordinates": [polygon]},
+                    "properties": None,
+                },
+                {"type": "Feature", "geometry": None, "properties": {}},
+            ],
+        }
+
+        assert is_well_formed(geojson)
+        assert is_well_formed({"type": "LineString", "coordinates": [[0, 0], [1, 1]]})
+
+    def test_shapefile_output(self, tmp_path: Path) -> None:
+        """Test converter output with tuple positions is well-formed."""
+        shapefile = pytest.importorskip("shapefile")
+        from mtu.converters.shapefile import ShapefileConverter
+
+        with shapefile.Writer(str(tmp_path / "data"), shapeType=shapefile.POLYGON) as w:
+            w.field("name", "C", 20)
+            w.poly([[[0, 0], [0, 1], [1, 1], [1, 0], [0, 0]]])
+            w.record("a")
+
+        geojson = ShapefileConverter().convert(tmp_path / "data.shp").geojson
+
+        ring = geojson["features"][0]["geometry"]["coordinates"][0]
+        assert isinstance(ring[0], tuple)
+        assert is_well_formed(geojson)
+
+    def test_number_subclasses(self) -> None:
+        """Test positions may hold float subclasses, such as numpy floats."""
+
+        class Coordinate(float):
+            pass
+
+        assert is_well_formed({"type": "Point", "coordinates": [Coordinate(1.5), 0]})
+        assert not is_well_formed({"type": "Point", "coordinates": [0, "1"]})
+
+    def test_tuple_positions(self) -> None:
+        """Test tuple positions, as built by __geo_interface__, are checked like lists."""
+        ring = ((0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 0.0))
+
+        assert is_well_formed({"type": "Point", "coordinates": (1, 2.5)})
+        assert is_well_formed({"type": "LineString", "coordinates": [(0, 0), (1, 1)]})
+        assert is_well_formed({"type": "MultiPolygon", "coordinates": [(ring,)]})
+        assert not is_well_formed({"type": "Point", "coordinates": (0, "1")})
+        assert not is_well_formed({"type": "Point", "coordinates": (True, 0)})
+
+    def test_malformed(self) -> None:
+        """Test structural problems are detected."""
+        malformed = [
+            {"type": "Unknown"},
+            {"type": "FeatureCollection", "features": {}},
+            {"type": "Point", "coordinates": [0]},
+            {"type": "Point", "coordinates": [True, 0]},
+            {"type": "LineString", "coordinates": [[0, 0]]},
+            {"type": "Polygon", "coordinates": []},
+            {"type": "Polygon", "coordinates": [[[0, 0], [1, 0], [1, 1], [2, 2]]]},
+            {"type": "Feature", "geometry": {"type": "Point"}, "properties": {}},
+            {"type": "Feature", "geometry": None, "properties": []},
+        ]
+
+        for geojson in malformed:
+            assert not is_well_formed(geojson), geojson